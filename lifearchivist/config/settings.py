@@ -43,6 +43,82 @@ class Settings(BaseSettings):
     chunk_size: int = Field(default=512, description="Text chunk size")
     chunk_overlap: int = Field(default=64, description="Text chunk overlap")
     embedding_batch_size: int = Field(default=32, description="Embedding batch size")
+    metadata_encoding: str = Field(
+        default="fields",
+        description=(
+            "Redis document metadata layout: 'fields' (one JSON value per hash "
+            "field) or 'compact' (single blob plus indexed fields)"
+        ),
+    )
+    enrichment_queue_backend: str = Field(
+        default="streams",
+        description=(
+            "Enrichment queue backend: 'streams' (Redis Streams, priority-aware, "
+            "shareable by several workers) or 'list' (single Redis list)"
+        ),
+    )
+    enrichment_concurrency: int = Field(
+        default=4,
+        description=(
+            "Enrichment tasks a worker keeps in flight at once; raised to "
+            "enrichment_llm_concurrency * date_extraction_batch_size when "
+            "date extraction is batched"
+        ),
+    )
+    enrichment_llm_concurrency: int = Field(
+        default=2,
+        description="Concurrent LLM date extractions per enrichment worker",
+    )
+    date_extraction_batch_size: int = Field(
+        default=8,
+        description=(
+            "Documents per batched LLM date extraction prompt "
+            "(1 = one full prompt per document)"
+        ),
+    )
+    llm_provider_slots: int = Field(
+        default=4,
+        description="Concurrent LLM requests per provider",
+    )
+    ollama_provider_slots: int = Field(
+        default=2,
+        description=(
+            "Concurrent LLM requests per Ollama provider; one is kept for "
+            "interactive requests"
+        ),
+    )
+    enrichment_worker_processes: int = Field(
+        default=1,
+        description=(
+            "Enrichment worker processes (0 = one per CPU core, "
+            "1 = a single worker inside the server process)"
+        ),
+    )
+    precompile_classifiers: bool = Field(
+        default=False,
+        description="Compile all subtheme classifier rules in the background at startup",
+    )
+    classifier_sample_chars: int = Field(
+        default=200_000,
+        description=(
+            "Character budget for theme classification; longer documents are "
+            "classified from head, tail and strided windows (0 = whole text)"
+        ),
+    )
+    classification_cache_ttl: int = Field(
+        default=30 * 24 * 3600,
+        description=(
+            "Seconds to keep cached classification results in Redis, keyed by "
+            "content hash and rules version (0 = disable the cache)"
+        ),
+    )
+    classifier_processes: int = Field(
+        default=0,
+        description=(
+            "Worker processes for batch subtheme classification "
+            "(0 = one per CPU core, 1 = classify in-process)"
+        ),
+    )
 
     # Folder Watching
     folder_watch_concurrency: int = Field(
@@ -57,6 +133,12 @@ class Settings(BaseSettings):
         default=100,
         description="Maximum number of folders that can be watched simultaneously",
     )
+    folder_watch_scan_concurrency: int = Field(
+        default=20,
+        description=(
+            "Maximum files from a catch-up scan waiting for ingestion at a time"
+        ),
+    )
     folder_watch_auto_resume: bool = Field(
         default=True,
         description="Automatically resume watching folders on server restart",
@@ -77,6 +159,23 @@ class Settings(BaseSettings):
     max_file_size_mb: int = Field(default=100, description="Maximum file size in MB")
     max_vault_size_gb: int = Field(default=100, description="Maximum vault size in GB")
     thumbnail_size: int = Field(default=256, description="Thumbnail size in pixels")
+    thumbnail_workers: int = Field(
+        default=2, description="Worker threads rendering image and PDF thumbnails"
+    )
+    lazy_thumbnails: bool = Field(
+        default=False,
+        description=(
+            "Render thumbnails on first request instead of at import, for "
+            "archives where most thumbnails are never viewed"
+        ),
+    )
+    vault_stats_recount_interval: int = Field(
+        default=0,
+        description=(
+            "Seconds between background recounts of vault statistics to "
+            "correct counter drift (0 disables periodic recounts)"
+        ),
+    )
 
     # UI Settings
     theme: str = Field(default="dark", description="UI theme")
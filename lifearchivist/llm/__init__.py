@@ -37,6 +37,7 @@ from .provider_loader import ProviderLoader
 from .provider_manager import LLMProviderManager
 from .provider_registry import ProviderRegistry
 from .provider_router import ProviderRouter, RoutingStrategy
+from .request_scheduler import RequestPriority, RequestScheduler
 
 __all__ = [
     # Base types
@@ -68,6 +69,8 @@ __all__ = [
     "ProviderRegistry",
     "ProviderRouter",
     "RoutingStrategy",
+    "RequestPriority",
+    "RequestScheduler",
     "ProviderLoader",
     "CostTracker",
     "CostRecord",
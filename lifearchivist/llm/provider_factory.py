@@ -18,6 +18,7 @@ from .provider_loader import ProviderLoader
 from .provider_manager import LLMProviderManager
 from .provider_registry import ProviderRegistry
 from .provider_router import ProviderRouter
+from .request_scheduler import RequestScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -93,6 +94,7 @@ class ProviderManagerFactory:
             router=router,
             cost_tracker=cost_tracker,
             health_monitor=health_monitor,
+            scheduler=ProviderManagerFactory._create_scheduler(),
         )
 
         log_event(
@@ -105,6 +107,18 @@ class ProviderManagerFactory:
 
         return manager
 
+    @staticmethod
+    def _create_scheduler() -> RequestScheduler:
+        """Create the request scheduler with slot counts from settings."""
+        from ..config import get_settings
+        from .base_provider import ProviderType
+
+        settings = get_settings()
+        return RequestScheduler(
+            default_slots=settings.llm_provider_slots,
+            slots_by_type={ProviderType.OLLAMA: settings.ollama_provider_slots},
+        )
+
     @staticmethod
     def create_minimal() -> LLMProviderManager:
         """
@@ -28,6 +28,7 @@ from .provider_metadata import (
 )
 from .provider_registry import ProviderRegistry
 from .provider_router import ProviderRouter, RoutingStrategy
+from .request_scheduler import RequestPriority, RequestScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +42,7 @@ class LLMProviderManager:
     - ProviderRouter: Routes requests to providers
     - CostTracker: Tracks and enforces costs
     - ProviderHealthMonitor: Monitors provider health
+    - RequestScheduler: Shares provider slots between interactive and batch work
 
     This class focuses on coordination and high-level operations.
 
@@ -57,6 +59,7 @@ class LLMProviderManager:
         router: ProviderRouter,
         cost_tracker: Optional[CostTracker] = None,
         health_monitor: Optional[ProviderHealthMonitor] = None,
+        scheduler: Optional[RequestScheduler] = None,
     ):
         """
         Initialize provider manager with dependencies.
@@ -66,11 +69,13 @@ class LLMProviderManager:
             router: Provider router instance
             cost_tracker: Optional cost tracker
             health_monitor: Optional health monitor
+            scheduler: Request scheduler (defaults to DEFAULT_SLOTS per provider)
         """
         self.registry = registry
         self.router = router
         self.cost_tracker = cost_tracker
         self.health_monitor = health_monitor
+        self.scheduler = scheduler or RequestScheduler()
         self._initialized = False
 
     async def __aenter__(self) -> "LLMProviderManager":
@@ -275,6 +280,7 @@ class LLMProviderManager:
         temperature: float = 0.7,
         max_tokens: int = 2000,
         user_id: str = "default",
+        priority: RequestPriority = RequestPriority.INTERACTIVE,
         **kwargs,
     ) -> Result[LLMResponse, str]:
         """
@@ -288,6 +294,8 @@ class LLMProviderManager:
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
             user_id: User making the request
+            priority: INTERACTIVE requests are served before BATCH ones and
+                may preempt them
             **kwargs: Additional provider-specific parameters
 
         Returns:
@@ -354,12 +362,16 @@ class LLMProviderManager:
                 },
             )
 
-            response = await provider.generate(
-                messages=messages,
-                model=model,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                **kwargs,
+            response = await self.scheduler.run(
+                provider,
+                priority,
+                lambda: provider.generate(
+                    messages=messages,
+                    model=model,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    **kwargs,
+                ),
             )
 
             # Record cost
@@ -426,6 +438,7 @@ class LLMProviderManager:
         temperature: float = 0.7,
         max_tokens: int = 2000,
         user_id: str = "default",
+        priority: RequestPriority = RequestPriority.INTERACTIVE,
         **kwargs,
     ) -> AsyncGenerator[LLMStreamChunk, None]:
         """
@@ -439,6 +452,8 @@ class LLMProviderManager:
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
             user_id: User making the request
+            priority: INTERACTIVE requests are served before BATCH ones and
+                may preempt them
             **kwargs: Additional provider-specific parameters
 
         Yields:
@@ -493,21 +508,22 @@ class LLMProviderManager:
         total_tokens = 0
 
         try:
-            stream = cast(
-                AsyncGenerator[LLMStreamChunk, None],
-                provider.generate_stream(
-                    messages=messages,
-                    model=model,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                    **kwargs,
-                ),
-            )
-            async for chunk in stream:
-                chunk_count += 1
-                if chunk.tokens_used:
-                    total_tokens = chunk.tokens_used
-                yield chunk
+            async with self.scheduler.slot(provider, priority):
+                stream = cast(
+                    AsyncGenerator[LLMStreamChunk, None],
+                    provider.generate_stream(
+                        messages=messages,
+                        model=model,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                        **kwargs,
+                    ),
+                )
+                async for chunk in stream:
+                    chunk_count += 1
+                    if chunk.tokens_used:
+                        total_tokens = chunk.tokens_used
+                    yield chunk
 
             # Record cost after streaming completes
             if self.cost_tracker and total_tokens > 0:
@@ -0,0 +1,273 @@
+"""
+Request Scheduler - Admission control for LLM requests per provider.
+
+Interactive requests (chat) and batch requests (background enrichment)
+compete for the same providers; a local Ollama instance in particular only
+generates a few responses at a time, so a backfill can hold every slot and
+leave chat waiting for whole generations before its first token.
+
+Each provider gets a fixed number of request slots:
+- interactive requests take any free slot and are served first
+- batch requests never take the last RESERVED_INTERACTIVE_SLOTS slots and
+  queue behind any waiting interactive request
+- a non-streaming batch request that holds a slot an interactive request is
+  waiting for is cancelled (preempted) and re-queued, then retried once a
+  slot frees up
+"""
+
+import asyncio
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from enum import Enum
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    TypeVar,
+    cast,
+)
+
+from ..utils.logging import log_event
+from .base_provider import BaseLLMProvider, ProviderType
+
+T = TypeVar("T")
+
+
+class RequestPriority(Enum):
+    """Scheduling class of an LLM request."""
+
+    INTERACTIVE = "interactive"
+    BATCH = "batch"
+
+
+class _Lease:
+    """A granted request slot."""
+
+    def __init__(self, priority: RequestPriority):
+        self.priority = priority
+        # Set when an interactive request needs this batch slot back
+        self.preempted = asyncio.Event()
+
+
+class _ProviderSlots:
+    """Slot accounting and wait queues for one provider."""
+
+    def __init__(self, limit: int, batch_limit: int):
+        self.limit = limit
+        self.batch_limit = batch_limit
+        self.active: List[_Lease] = []
+        self.interactive_waiters: Deque[asyncio.Future] = deque()
+        self.batch_waiters: Deque[asyncio.Future] = deque()
+        self.preemptions = 0
+
+    def batch_active(self) -> int:
+        return sum(
+            1 for lease in self.active if lease.priority == RequestPriority.BATCH
+        )
+
+    def can_start(self, priority: RequestPriority) -> bool:
+        if len(self.active) >= self.limit:
+            return False
+        if priority == RequestPriority.INTERACTIVE:
+            return True
+        return not self.interactive_waiters and self.batch_active() < self.batch_limit
+
+
+class RequestScheduler:
+    """
+    Per-provider request slots with interactive-first admission.
+
+    Slot counts are per provider; providers of a type listed in
+    slots_by_type (e.g. a local Ollama) get that many, others default_slots.
+    """
+
+    DEFAULT_SLOTS = 4
+    RESERVED_INTERACTIVE_SLOTS = 1
+
+    def __init__(
+        self,
+        default_slots: Optional[int] = None,
+        slots_by_type: Optional[Dict[ProviderType, int]] = None,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            default_slots: Concurrent requests per provider
+            slots_by_type: Concurrent requests for providers of these types
+        """
+        self.default_slots = default_slots or self.DEFAULT_SLOTS
+        self.slots_by_type = slots_by_type or {}
+        self._providers: Dict[str, _ProviderSlots] = {}
+
+    def _slots_for(self, provider: BaseLLMProvider) -> _ProviderSlots:
+        slots = self._providers.get(provider.provider_id)
+        if slots is None:
+            limit = max(
+                1, self.slots_by_type.get(provider.provider_type, self.default_slots)
+            )
+            # With a single slot, batch work relies on preemption instead
+            batch_limit = max(1, limit - self.RESERVED_INTERACTIVE_SLOTS)
+            slots = _ProviderSlots(limit, batch_limit)
+            self._providers[provider.provider_id] = slots
+        return slots
+
+    async def _acquire(
+        self,
+        provider: BaseLLMProvider,
+        priority: RequestPriority,
+        preempted: bool = False,
+    ) -> _Lease:
+        slots = self._slots_for(provider)
+        if slots.can_start(priority):
+            lease = _Lease(priority)
+            slots.active.append(lease)
+            return lease
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        if priority == RequestPriority.INTERACTIVE:
+            slots.interactive_waiters.append(future)
+            self._preempt_batch(provider.provider_id, slots)
+        elif preempted:
+            # A preempted request keeps its place at the head of the queue
+            slots.batch_waiters.appendleft(future)
+        else:
+            slots.batch_waiters.append(future)
+
+        try:
+            return await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted just as the waiter was cancelled
+                self._release(slots, future.result())
+            else:
+                for waiters in (slots.interactive_waiters, slots.batch_waiters):
+                    if future in waiters:
+                        waiters.remove(future)
+            raise
+
+    def _release(self, slots: _ProviderSlots, lease: _Lease) -> None:
+        if lease in slots.active:
+            slots.active.remove(lease)
+        self._dispatch(slots)
+
+    def _dispatch(self, slots: _ProviderSlots) -> None:
+        """Hand free slots to waiters, interactive first."""
+        for priority, waiters in (
+            (RequestPriority.INTERACTIVE, slots.interactive_waiters),
+            (RequestPriority.BATCH, slots.batch_waiters),
+        ):
+            while waiters and slots.can_start(priority):
+                future = waiters.popleft()
+                if future.done():
+                    continue
+                lease = _Lease(priority)
+                slots.active.append(lease)
+                future.set_result(lease)
+
+    def _preempt_batch(self, provider_id: str, slots: _ProviderSlots) -> None:
+        """Ask the newest batch requests to give up slots interactive ones need."""
+        if len(slots.active) < slots.limit:
+            return
+        already_preempted = sum(1 for lease in slots.active if lease.preempted.is_set())
+        needed = len(slots.interactive_waiters) - already_preempted
+        for lease in reversed(slots.active):
+            if needed <= 0:
+                break
+            if lease.priority == RequestPriority.BATCH and not lease.preempted.is_set():
+                lease.preempted.set()
+                slots.preemptions += 1
+                needed -= 1
+                log_event(
+                    "llm_batch_request_preempted",
+                    {"provider_id": provider_id},
+                    level=logging.DEBUG,
+                )
+
+    @asynccontextmanager
+    async def slot(
+        self, provider: BaseLLMProvider, priority: RequestPriority
+    ) -> AsyncIterator[None]:
+        """
+        Hold a request slot for the duration of the block (not preemptible).
+
+        Used for streaming, where a cancelled request cannot be retried
+        without repeating chunks already sent.
+        """
+        slots = self._slots_for(provider)
+        lease = await self._acquire(provider, priority)
+        try:
+            yield
+        finally:
+            self._release(slots, lease)
+
+    async def run(
+        self,
+        provider: BaseLLMProvider,
+        priority: RequestPriority,
+        call: Callable[[], Awaitable[T]],
+    ) -> T:
+        """
+        Run a request in a slot; batch requests are retried if preempted.
+
+        Args:
+            provider: Provider the request goes to
+            priority: Scheduling class
+            call: Starts the request; called again after a preemption
+
+        Returns:
+            The request's result
+        """
+        slots = self._slots_for(provider)
+        preempted_before = False
+        while True:
+            lease = await self._acquire(provider, priority, preempted_before)
+            request: Optional[asyncio.Future] = None
+            try:
+                if priority == RequestPriority.INTERACTIVE:
+                    return await call()
+
+                request = asyncio.ensure_future(call())
+                preempted = asyncio.ensure_future(lease.preempted.wait())
+                try:
+                    await asyncio.wait(
+                        {request, preempted}, return_when=asyncio.FIRST_COMPLETED
+                    )
+                finally:
+                    preempted.cancel()
+                if request.done():
+                    return cast(T, request.result())
+
+                request.cancel()
+                try:
+                    await request
+                except asyncio.CancelledError:
+                    pass
+                preempted_before = True
+            except asyncio.CancelledError:
+                if request is not None and not request.done():
+                    request.cancel()
+                raise
+            finally:
+                self._release(slots, lease)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get slot usage and queue depth per provider."""
+        return {
+            provider_id: {
+                "slots": slots.limit,
+                "batch_slots": slots.batch_limit,
+                "active_interactive": len(slots.active) - slots.batch_active(),
+                "active_batch": slots.batch_active(),
+                "waiting_interactive": len(slots.interactive_waiters),
+                "waiting_batch": len(slots.batch_waiters),
+                "preemptions": slots.preemptions,
+            }
+            for provider_id, slots in self._providers.items()
+        }
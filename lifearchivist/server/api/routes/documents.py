@@ -5,6 +5,7 @@ Provides CRUD operations for documents including:
 - Listing and filtering documents
 - Deleting documents from index and vault
 - Updating document metadata
+- Reclassifying the archive in the background
 - Analyzing document structure and chunks
 - Finding similar documents
 """
@@ -314,6 +315,46 @@ async def update_document_subtheme(document_id: str, subtheme_data: dict):
         raise HTTPException(status_code=500, detail=str(e)) from None
 
 
+@router.post("/documents/reclassify")
+async def reclassify_documents(resume: bool = True):
+    """
+    Start reclassifying every document with the current classifier rules.
+
+    Runs in the background; progress is broadcast over WebSocket as
+    reclassification_progress messages and is available from
+    /documents/reclassify/status. An interrupted pass resumes from its
+    checkpoint unless resume is false.
+    """
+    server = get_server()
+
+    if not server.llamaindex_service:
+        raise HTTPException(status_code=503, detail="LlamaIndex service not available")
+
+    if server.get_reclassification_status().get("status") in ("pending", "running"):
+        raise HTTPException(status_code=409, detail="Reclassification already running")
+
+    try:
+        status = server.start_reclassification(resume=resume)
+        return {"success": True, **status}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e)) from None
+
+
+@router.get("/documents/reclassify/status")
+async def get_reclassification_status():
+    """Get progress of the current or last reclassification."""
+    server = get_server()
+
+    try:
+        return {"success": True, **server.get_reclassification_status()}
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e)) from None
+
+
 @router.delete("/documents")
 async def clear_all_documents():
     """
@@ -344,6 +344,7 @@ async def scan_folder(folder_id: str = PathParam(..., description="Folder UUID")
 
     Notes:
         - Scans recursively for all supported file types
+        - Only queues files that are new or changed since last handled
         - Respects deduplication (won't re-ingest existing files)
         - Files are queued with debounce delay
         - Folder must be enabled to scan
@@ -379,39 +380,20 @@ async def scan_folder(folder_id: str = PathParam(..., description="Folder UUID")
                 detail=f"Folder path no longer accessible: {folder.path}",
             )
 
-        # Scan folder for supported files
-        files_found = []
-        for ext in server.folder_watcher.SUPPORTED_EXTENSIONS:
-            files_found.extend(folder.path.rglob(f"*{ext}"))
-
-        # Filter out hidden/temp files
-        files_found = [
-            f
-            for f in files_found
-            if not f.name.startswith(".") and not f.name.startswith("~")
-        ]
-
-        # Schedule each file for ingestion
-        files_queued = 0
-        failed_files = 0
-        for file_path in files_found:
-            try:
-                await server.folder_watcher.schedule_ingestion(folder_id, file_path)
-                files_queued += 1
-            except Exception as e:
-                # Log error but continue with other files
-                logger.warning(
-                    f"Failed to queue file {file_path.name} for ingestion: {e}"
-                )
-                failed_files += 1
+        # Scan folder and queue new or changed files
+        scan = await server.folder_watcher.scan_folder(folder_id)
+        files_queued = scan["files_queued"]
 
         return FolderScanResponse(
             success=True,
             folder_id=folder_id,
             folder_path=str(folder.path),
-            files_found=len(files_found),
+            files_found=scan["files_found"],
             files_queued=files_queued,
-            message=f"Scanned folder and queued {files_queued} files for ingestion",
+            message=(
+                f"Scanned folder and queued {files_queued} new or changed "
+                f"files for ingestion"
+            ),
         )
 
     except HTTPException:
@@ -417,3 +417,30 @@ async def get_upload_progress(file_id: str):
             },
             status_code=500,
         )
+
+
+@router.get("/ingest/metrics")
+async def get_ingest_metrics():
+    """
+    Get rolling per-stage ingest timings.
+
+    Returns p50/p95/mean duration for each import stage (hash, vault store,
+    extraction, classification, indexing, ...) over recent imports, overall
+    and per MIME type, to show which stage dominates ingest time.
+    """
+    from lifearchivist.tools.file_import.ingest_timing import (
+        get_ingest_metrics as get_metrics,
+    )
+
+    try:
+        return {"success": True, **get_metrics().snapshot()}
+
+    except Exception as e:
+        return JSONResponse(
+            content={
+                "success": False,
+                "error": f"Failed to retrieve ingest metrics: {str(e)}",
+                "error_type": type(e).__name__,
+            },
+            status_code=500,
+        )
@@ -6,6 +6,7 @@ background tasks, tool registry) while delegating core infrastructure
 to the ServiceContainer.
 """
 
+import asyncio
 import logging
 from typing import Any, Dict, Optional
 
@@ -17,7 +18,7 @@ from ..tools.registry import ToolRegistry
 from ..utils.logging import log_event
 from .activity_manager import ActivityManager
 from .background_tasks import BackgroundTaskManager
-from .enrichment_queue import EnrichmentQueue
+from .enrichment_queue import EnrichmentQueue, create_enrichment_queue
 from .progress_manager import ProgressManager
 from .service_container import ServiceConfig, ServiceContainer
 
@@ -103,6 +104,10 @@ class ApplicationServer:
         self.background_tasks: Optional[BackgroundTaskManager] = None
         self.tool_registry: Optional[ToolRegistry] = None
         self.folder_watcher = None  # Folder watching service
+        self.reconciliation_task: Optional[asyncio.Task] = None
+        self.classifier_precompile_task: Optional[asyncio.Task] = None
+        self.reclassification_job = None
+        self.reclassification_task: Optional[asyncio.Task] = None
 
         # Optional agents (only if enabled)
         self.ingestion_agent = None
@@ -116,7 +121,7 @@ class ApplicationServer:
 
         Initialization phases:
         1. Core infrastructure (ServiceContainer)
-        2. Vault reconciliation
+        2. Vault reconciliation (started in the background)
         3. Application services (progress, enrichment, background tasks)
         4. Tool registry
         5. Optional agents
@@ -134,8 +139,11 @@ class ApplicationServer:
             # Phase 1: Initialize core infrastructure
             await self._init_service_container()
 
-            # Phase 2: Run startup reconciliation
-            await self._run_startup_reconciliation()
+            # Phase 2: Start vault reconciliation without blocking readiness
+            self._start_startup_reconciliation()
+
+            if self.settings.precompile_classifiers:
+                self._start_classifier_precompile()
 
             # Phase 3: Initialize application services
             await self._init_activity_manager()
@@ -181,7 +189,46 @@ class ApplicationServer:
         """Cleanup all services in reverse initialization order."""
         log_event("application_server_cleanup_start")
 
-        # Stop background tasks first
+        # Stop an in-flight startup reconciliation; it resumes from its
+        # checkpoint on the next start
+        if self.reconciliation_task and not self.reconciliation_task.done():
+            self.reconciliation_task.cancel()
+            try:
+                await self.reconciliation_task
+            except asyncio.CancelledError:
+                log_event("startup_reconciliation_cancelled")
+        self.reconciliation_task = None
+
+        if (
+            self.classifier_precompile_task
+            and not self.classifier_precompile_task.done()
+        ):
+            self.classifier_precompile_task.cancel()
+        self.classifier_precompile_task = None
+
+        # Stop a running reclassification; its checkpoint lets the next run
+        # resume
+        if self.reclassification_task and not self.reclassification_task.done():
+            self.reclassification_task.cancel()
+            try:
+                await self.reclassification_task
+            except asyncio.CancelledError:
+                pass
+        self.reclassification_task = None
+
+        # Stop batch classification workers, if a batch ever started them
+        try:
+            from ..tools.subtheme_classifier import shutdown_classifier_pool
+
+            await asyncio.to_thread(shutdown_classifier_pool)
+        except Exception as e:
+            log_event(
+                "classifier_pool_shutdown_error",
+                {"error": str(e)},
+                level=logging.WARNING,
+            )
+
+        # Stop background tasks
         if self.background_tasks:
             try:
                 await self.background_tasks.stop()
@@ -272,6 +319,84 @@ class ApplicationServer:
             },
         )
 
+    def _start_startup_reconciliation(self):
+        """
+        Schedule startup reconciliation as a background task.
+
+        Reconciliation time grows with archive size, so it runs alongside
+        the remaining startup phases instead of delaying readiness.
+        """
+        self.reconciliation_task = asyncio.create_task(
+            self._run_startup_reconciliation()
+        )
+
+    def _start_classifier_precompile(self):
+        """
+        Compile subtheme classifier rules in the background.
+
+        Warms the process-wide classifier so the first imports of each theme
+        don't pay the regex compilation cost.
+        """
+        from ..tools.subtheme_classifier import precompile_subtheme_classifiers
+
+        async def precompile():
+            try:
+                await precompile_subtheme_classifiers()
+            except Exception as e:
+                log_event(
+                    "subtheme_classifier_precompile_failed",
+                    {"error": str(e), "error_type": type(e).__name__},
+                    level=logging.WARNING,
+                )
+
+        self.classifier_precompile_task = asyncio.create_task(precompile())
+
+    def start_reclassification(self, resume: bool = True) -> Dict[str, Any]:
+        """
+        Start reclassifying the archive in the background.
+
+        Args:
+            resume: Continue an interrupted pass from its checkpoint
+
+        Returns:
+            Status of the started job
+
+        Raises:
+            RuntimeError: If the document index is unavailable or a
+                reclassification is already running
+        """
+        if not self.llamaindex_service or not self.llamaindex_service.doc_tracker:
+            raise RuntimeError("Document index is not available")
+        if self.reclassification_task and not self.reclassification_task.done():
+            raise RuntimeError("Reclassification is already running")
+
+        from ..tools.classification_version import classification_rules_version
+        from ..tools.subtheme_classifier import get_classifier_pool
+        from .reclassification_job import ReclassificationJob
+
+        self.reclassification_job = ReclassificationJob(
+            doc_tracker=self.llamaindex_service.doc_tracker,
+            qdrant_client=self.llamaindex_service.qdrant_client,
+            classifier_pool=get_classifier_pool(),
+            rules_version=classification_rules_version(
+                self.settings.classifier_sample_chars
+            ),
+            session_manager=self.session_manager,
+            classification_cache=(
+                self.tool_registry.classification_cache if self.tool_registry else None
+            ),
+        )
+        self.reclassification_task = asyncio.create_task(
+            self.reclassification_job.run(resume=resume)
+        )
+        return self.get_reclassification_status()
+
+    def get_reclassification_status(self) -> Dict[str, Any]:
+        """Get the status of the current or last reclassification."""
+        if not self.reclassification_job:
+            return {"status": "idle"}
+        return self.reclassification_job.get_status()
+
     async def _run_startup_reconciliation(self):
         """
         Run vault reconciliation on startup to ensure data consistency.
@@ -376,7 +501,10 @@ class ApplicationServer:
     async def _init_enrichment_queue(self):
         """Initialize enrichment queue for background processing."""
         try:
-            self.enrichment_queue = EnrichmentQueue(redis_url=self.settings.redis_url)
+            self.enrichment_queue = create_enrichment_queue(
+                redis_url=self.settings.redis_url,
+                backend=self.settings.enrichment_queue_backend,
+            )
             await self.enrichment_queue.initialize()
             log_event("enrichment_queue_initialized")
         except Exception as e:
@@ -403,6 +531,10 @@ class ApplicationServer:
             self.background_tasks = BackgroundTaskManager(
                 llamaindex_service=self.service_container.llamaindex_service,
                 vault=self.service_container.vault,
+                health_monitor=(
+                    self.llm_manager.health_monitor if self.llm_manager else None
+                ),
+                llm_manager=self.llm_manager,
             )
             await self.background_tasks.start()
             log_event("background_tasks_initialized")
@@ -419,12 +551,26 @@ class ApplicationServer:
         if not self.service_container:
             raise RuntimeError("ServiceContainer must be initialized first")
 
+        classification_cache = None
+        if self.settings.classification_cache_ttl > 0:
+            from ..storage.classification_cache import ClassificationCache
+            from ..tools.classification_version import classification_rules_version
+
+            classification_cache = ClassificationCache(
+                redis_client=self.service_container.redis_client,
+                rules_version=classification_rules_version(
+                    self.settings.classifier_sample_chars
+                ),
+                ttl_seconds=self.settings.classification_cache_ttl,
+            )
+
         self.tool_registry = ToolRegistry(
             vault=self.service_container.vault,
             llamaindex_service=self.service_container.llamaindex_service,
             progress_manager=self.progress_manager,
             enrichment_queue=self.enrichment_queue,
             activity_manager=self.activity_manager,
+            classification_cache=classification_cache,
         )
         await self.tool_registry.register_all()
 
@@ -468,6 +614,7 @@ class ApplicationServer:
                 debounce_seconds=self.settings.folder_watch_debounce_seconds,
                 ingestion_concurrency=self.settings.folder_watch_concurrency,
                 max_folders=self.settings.folder_watch_max_folders,
+                scan_concurrency=self.settings.folder_watch_scan_concurrency,
             )
 
             # Initialize the service (async)
@@ -1,30 +1,49 @@
 """
 Background task management for integrated enrichment processing.
+
+With ``enrichment_worker_processes`` set to 1 the enrichment worker runs in
+the server's event loop; otherwise a WorkerSupervisor runs that many worker
+processes instead.
 """
 
 import asyncio
 import logging
 from typing import Optional
 
+from lifearchivist.config import get_settings
 from lifearchivist.utils.logging import log_event
 from lifearchivist.workers.enrichment_worker import EnrichmentWorker
+from lifearchivist.workers.worker_supervisor import WorkerSupervisor
 
 
 class BackgroundTaskManager:
     """Manages background tasks within the main server process."""
 
-    def __init__(self, llamaindex_service=None, vault=None):
+    def __init__(
+        self, llamaindex_service=None, vault=None, health_monitor=None, llm_manager=None
+    ):
         self.enrichment_worker: Optional[EnrichmentWorker] = None
+        self.supervisor: Optional[WorkerSupervisor] = None
         self.worker_task: Optional[asyncio.Task] = None
         self.enabled = False
         self.llamaindex_service = llamaindex_service
         self.vault = vault
+        self.health_monitor = health_monitor
+        self.llm_manager = llm_manager
 
     async def start(self):
         """Start background tasks."""
+        processes = get_settings().enrichment_worker_processes
+        if processes != 1:
+            await self._start_supervisor(processes)
+            return
+
         try:
             self.enrichment_worker = EnrichmentWorker(
-                llamaindex_service=self.llamaindex_service, vault=self.vault
+                llamaindex_service=self.llamaindex_service,
+                vault=self.vault,
+                health_monitor=self.health_monitor,
+                llm_manager=self.llm_manager,
             )
             await self.enrichment_worker.initialize()
 
@@ -49,6 +68,29 @@ class BackgroundTaskManager:
             )
             self.enabled = False
 
+    async def _start_supervisor(self, processes: int):
+        """Run enrichment in separate worker processes."""
+        try:
+            self.supervisor = WorkerSupervisor(processes=processes)
+            await self.supervisor.start()
+            self.enabled = True
+            log_event(
+                "background_tasks_started",
+                {
+                    "enrichment_worker": False,
+                    "worker_processes": self.supervisor.processes,
+                },
+            )
+        except Exception as e:
+            log_event(
+                "background_tasks_start_failed",
+                {
+                    "error": str(e),
+                },
+                level=logging.WARNING,
+            )
+            self.enabled = False
+
     async def _run_worker_with_restart(self):
         """Run worker with automatic restart on failure."""
         restart_count = 0
@@ -89,6 +131,10 @@ class BackgroundTaskManager:
 
     async def stop(self):
         """Stop background tasks gracefully."""
+        if self.supervisor:
+            await self.supervisor.stop()
+            self.supervisor = None
+
         if self.worker_task and not self.worker_task.done():
             if self.enrichment_worker:
                 self.enrichment_worker.shutdown_event.set()
@@ -111,5 +157,7 @@ class BackgroundTaskManager:
 
         if self.enrichment_worker and self.enabled:
             status["enrichment_worker"] = await self.enrichment_worker.get_status()
+        if self.supervisor and self.enabled:
+            status["worker_processes"] = self.supervisor.get_status()
 
         return status
@@ -1,20 +1,72 @@
 """
 Background enrichment queue for asynchronous document processing.
+
+Two backends share the EnrichmentQueue interface: the original Redis list
+queue ("list") and a priority-aware Redis Streams queue ("streams", see
+enrichment_stream_queue). create_enrichment_queue picks one from settings.
 """
 
+import hashlib
 import json
 import logging
+import time
 from datetime import datetime
-from typing import Any, Awaitable, Dict, Optional, cast
+from typing import Any, Awaitable, Dict, List, Optional, cast
 
 import redis.asyncio as redis
 
 from lifearchivist.utils.logging import log_event, track
 
+ENRICHMENT_QUEUE_BACKENDS = ("list", "streams")
+
+# Move processing entries back to the front of the queue if still processing
+REQUEUE_STUCK_SCRIPT = """
+local moved = 0
+for _, entry in ipairs(ARGV) do
+  if redis.call('LREM', KEYS[1], 1, entry) > 0 then
+    redis.call('RPUSH', KEYS[2], entry)
+    moved = moved + 1
+  end
+end
+return moved
+"""
+
+
+def create_enrichment_queue(
+    redis_url: str = "redis://localhost:6379", backend: str = "streams"
+) -> "EnrichmentQueue":
+    """
+    Create an enrichment queue for the configured backend.
+
+    Args:
+        redis_url: Redis connection URL
+        backend: "list" or "streams"
+
+    Returns:
+        Uninitialized queue
+    """
+    if backend not in ENRICHMENT_QUEUE_BACKENDS:
+        raise ValueError(
+            f"Unknown enrichment queue backend '{backend}', "
+            f"expected one of {ENRICHMENT_QUEUE_BACKENDS}"
+        )
+
+    if backend == "streams":
+        from .enrichment_stream_queue import StreamEnrichmentQueue
+
+        return StreamEnrichmentQueue(redis_url=redis_url)
+    return EnrichmentQueue(redis_url=redis_url)
+
 
 class EnrichmentQueue:
     """Manages background enrichment tasks for documents."""
 
+    # Entries kept in the completed and failed history lists
+    HISTORY_LIMIT = 1000
+
+    # Seconds a task may sit in the processing list before it is requeued
+    STUCK_AFTER_SECONDS = 900
+
     def __init__(self, redis_url: str = "redis://localhost:6379"):
         self.redis_url = redis_url
         self.redis_client: Optional[redis.Redis] = None
@@ -22,6 +74,8 @@ class EnrichmentQueue:
         self.processing_key = "lifearchivist:enrichment:processing"
         self.completed_key = "lifearchivist:enrichment:completed"
         self.failed_key = "lifearchivist:enrichment:failed"
+        # Digest of each processing entry -> when maintenance first saw it
+        self.processing_seen_key = "lifearchivist:enrichment:processing_seen"
 
     async def initialize(self):
         """Initialize Redis connection."""
@@ -161,6 +215,58 @@ class EnrichmentQueue:
             )
             return None
 
+    @track(
+        operation="dequeue_enrichment_tasks",
+        track_performance=True,
+        frequency="high_frequency",
+    )
+    async def get_next_tasks(
+        self, max_tasks: int, timeout: int = 1
+    ) -> List[Dict[str, Any]]:
+        """
+        Get up to max_tasks tasks, waiting up to timeout seconds for the first.
+
+        The rest are moved to the processing list with one pipelined round trip
+        and only if they are already queued.
+        """
+        task = await self.get_next_task(timeout=timeout)
+        if not task:
+            return []
+        tasks = [task]
+        if max_tasks <= 1:
+            return tasks
+
+        try:
+            async with self._client().pipeline(transaction=False) as pipe:
+                for _ in range(max_tasks - 1):
+                    pipe.rpoplpush(self.queue_key, self.processing_key)
+                results = await pipe.execute()
+        except Exception as e:
+            log_event(
+                "enrichment_dequeue_failed",
+                {
+                    "error": str(e),
+                },
+                level=logging.ERROR,
+            )
+            return tasks
+
+        for task_json in results:
+            if not task_json:
+                break
+            try:
+                tasks.append(cast(Dict[str, Any], json.loads(task_json)))
+            except json.JSONDecodeError as e:
+                log_event(
+                    "enrichment_task_decode_error",
+                    {
+                        "error": str(e),
+                        "task_json": task_json[:100],
+                    },
+                    level=logging.ERROR,
+                )
+        return tasks
+
     @track(
         operation="complete_enrichment_task",
         include_args=["document_id"],
@@ -187,8 +293,6 @@ class EnrichmentQueue:
                 client.lpush(self.completed_key, json.dumps(completion_record)),
             )
 
-            await cast(Awaitable[int], client.ltrim(self.completed_key, 0, 999))
-
             log_event(
                 "enrichment_task_completed",
                 {
@@ -275,8 +379,6 @@ class EnrichmentQueue:
             Awaitable[int], client.lpush(self.failed_key, json.dumps(failure_record))
         )
 
-        await cast(Awaitable[int], client.ltrim(self.failed_key, 0, 999))
-
         log_event(
             "enrichment_task_failed",
             {
@@ -288,6 +390,88 @@ class EnrichmentQueue:
             level=logging.WARNING,
         )
 
+    async def refresh_in_flight(self) -> int:
+        """
+        Mark this worker's dequeued tasks as still being worked on.
+
+        Called on every worker heartbeat. List-queued tasks are recovered by
+        their time in the processing list instead, so there is nothing to do.
+
+        Returns:
+            Number of tasks refreshed
+        """
+        return 0
+
+    @track(
+        operation="enrichment_queue_maintenance",
+        track_performance=True,
+        frequency="low_frequency",
+    )
+    async def run_maintenance(self) -> Dict[str, int]:
+        """
+        Periodic upkeep, run by a single elected worker.
+
+        Trims the completed and failed histories to HISTORY_LIMIT entries and
+        recovers tasks abandoned by crashed workers.
+
+        Returns:
+            Counts of what was recovered
+        """
+        client = self._client()
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.ltrim(self.completed_key, 0, self.HISTORY_LIMIT - 1)
+            pipe.ltrim(self.failed_key, 0, self.HISTORY_LIMIT - 1)
+            await pipe.execute()
+
+        result = await self._recover_stuck_tasks()
+        log_event("enrichment_queue_maintenance", result, level=logging.DEBUG)
+        return result
+
+    async def _recover_stuck_tasks(self) -> Dict[str, int]:
+        """
+        Requeue tasks that stayed in the processing list too long.
+
+        Entries carry no dequeue time, so each maintenance run records when it
+        first saw every processing entry; an entry still there
+        STUCK_AFTER_SECONDS later belonged to a worker that died.
+        """
+        client = self._client()
+        entries = await cast(
+            Awaitable[List[str]], client.lrange(self.processing_key, 0, -1)
+        )
+        seen = await cast(
+            Awaitable[Dict[str, str]], client.hgetall(self.processing_seen_key)
+        )
+
+        now = time.time()
+        first_seen: Dict[str, float] = {}
+        stuck: List[str] = []
+        for entry in entries:
+            digest = hashlib.sha1(entry.encode()).hexdigest()
+            first_seen[digest] = float(seen.get(digest, now))
+            if now - first_seen[digest] >= self.STUCK_AFTER_SECONDS:
+                stuck.append(entry)
+                first_seen.pop(digest)
+
+        async with client.pipeline(transaction=True) as pipe:
+            pipe.delete(self.processing_seen_key)
+            if first_seen:
+                pipe.hset(self.processing_seen_key, mapping=first_seen)
+            await pipe.execute()
+
+        requeued = 0
+        if stuck:
+            script = client.register_script(REQUEUE_STUCK_SCRIPT)
+            requeued = int(
+                await script(keys=[self.processing_key, self.queue_key], args=stuck)
+            )
+            log_event(
+                "enrichment_stuck_tasks_requeued",
+                {"requeued": requeued},
+                level=logging.WARNING,
+            )
+        return {"requeued": requeued}
+
     def _calculate_processing_time(self, task: Dict[str, Any]) -> float:
         """Calculate processing time in seconds."""
         try:
@@ -320,6 +504,7 @@ class EnrichmentQueue:
             client = self._client()
             stats = {
                 "status": "operational",
+                "backend": "list",
                 "queue_length": await cast(Awaitable[int], client.llen(self.queue_key)),
                 "processing": await cast(
                     Awaitable[int], client.llen(self.processing_key)
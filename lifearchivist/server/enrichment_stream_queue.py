@@ -0,0 +1,692 @@
+"""
+Enrichment queue backed by Redis Streams with a consumer group.
+
+The list-backed EnrichmentQueue ignores task priority and finds a task to
+acknowledge or retry with LREM over the whole processing list. Here each
+priority level has its own stream, read through one consumer group:
+
+- enqueue is an XADD to the stream for the task's priority
+- dequeue reads the highest-priority stream with work (XREADGROUP), so any
+  number of workers can share the queue without handing out a task twice
+- ack and retry address the task by stream and message ID (XACK + XDEL),
+  which is O(1) regardless of queue length
+- tasks left pending by a crashed worker are reclaimed with XAUTOCLAIM once
+  they have been idle longer than the claim timeout; live workers reset the
+  idle time of their own pending tasks on every heartbeat, and a task
+  delivered MAX_DELIVERIES times is moved to the failed list
+"""
+
+import json
+import logging
+import os
+import socket
+import time
+import uuid
+from collections import deque
+from datetime import datetime
+from typing import Any, Awaitable, Deque, Dict, List, Optional, Set, Tuple, cast
+
+from redis.exceptions import ResponseError
+
+from lifearchivist.utils.logging import log_event, track
+
+from .enrichment_queue import EnrichmentQueue
+
+# Priority levels, highest first, and the stream key suffix for each
+PRIORITY_LEVELS: Tuple[str, ...] = ("high", "normal", "low")
+
+# Internal fields added to dequeued tasks to address their stream entry
+STREAM_FIELD = "_stream"
+MESSAGE_ID_FIELD = "_message_id"
+
+
+def priority_level(priority: int) -> str:
+    """Map an enqueue priority (positive = urgent) to a priority level."""
+    if priority > 0:
+        return "high"
+    if priority < 0:
+        return "low"
+    return "normal"
+
+
+class StreamEnrichmentQueue(EnrichmentQueue):
+    """Priority-aware enrichment queue on Redis Streams."""
+
+    GROUP_NAME = "enrichment-workers"
+
+    # Pending tasks idle this long are assumed abandoned by a dead worker.
+    # Live workers reset the idle time of their pending tasks on every
+    # heartbeat, so this only needs to exceed a few heartbeat intervals
+    CLAIM_IDLE_MS = 300_000
+
+    # Seconds between XAUTOCLAIM sweeps for abandoned tasks
+    CLAIM_INTERVAL_SECONDS = 30.0
+
+    # Deliveries after which a task that keeps being abandoned (e.g. one
+    # that crashes its worker) is failed instead of claimed again
+    MAX_DELIVERIES = 5
+
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379",
+        consumer_name: Optional[str] = None,
+        claim_idle_ms: Optional[int] = None,
+    ):
+        """
+        Initialize the queue.
+
+        Args:
+            redis_url: Redis connection URL
+            consumer_name: Name of this worker in the consumer group (unique
+                per process by default)
+            claim_idle_ms: Idle time after which another worker's pending
+                task is reclaimed
+        """
+        super().__init__(redis_url)
+        self.stream_prefix = "lifearchivist:enrichment:stream"
+        self.stream_keys = [
+            f"{self.stream_prefix}:{level}" for level in PRIORITY_LEVELS
+        ]
+        self.consumer_name = consumer_name or (
+            f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        )
+        self.claim_idle_ms = claim_idle_ms or self.CLAIM_IDLE_MS
+        self._last_claim = 0.0
+        # Entries already delivered to this consumer but not yet handed out
+        self._delivered: Deque[Dict[str, Any]] = deque()
+        # Message IDs pending for this consumer (queued, handed out or
+        # running) until acknowledged, per stream
+        self._pending_ids: Dict[str, Set[str]] = {
+            stream_key: set() for stream_key in self.stream_keys
+        }
+
+    def _stream_key(self, priority: int) -> str:
+        return f"{self.stream_prefix}:{priority_level(priority)}"
+
+    async def initialize(self):
+        """Connect, create the consumer group and import list-queued tasks."""
+        await super().initialize()
+
+        client = self._client()
+        for stream_key in self.stream_keys:
+            try:
+                await client.xgroup_create(
+                    stream_key, self.GROUP_NAME, id="0", mkstream=True
+                )
+            except ResponseError as e:
+                # Group already exists
+                if "BUSYGROUP" not in str(e):
+                    raise
+
+        await self._import_list_tasks()
+
+    async def _import_list_tasks(self) -> int:
+        """
+        Move tasks left in the list-backed queue into the streams.
+
+        Tasks in the list backend's processing list were claimed by a worker
+        that never acknowledged them, so they are re-enqueued as well.
+        """
+        client = self._client()
+        moved = 0
+        for list_key in (self.processing_key, self.queue_key):
+            while True:
+                task_json = await cast(Awaitable[Optional[str]], client.rpop(list_key))
+                if task_json is None:
+                    break
+                try:
+                    task = json.loads(task_json)
+                except json.JSONDecodeError:
+                    continue
+                await client.xadd(
+                    self._stream_key(int(task.get("priority", 0))),
+                    {"task": json.dumps(task)},
+                )
+                moved += 1
+
+        if moved:
+            log_event("enrichment_list_tasks_imported", {"tasks": moved})
+        return moved
+
+    @track(
+        operation="enqueue_enrichment_task",
+        include_args=["task_type", "document_id"],
+        track_performance=True,
+        frequency="medium_frequency",
+    )
+    async def enqueue_task(
+        self, task_type: str, document_id: str, data: Dict[str, Any], priority: int = 0
+    ) -> bool:
+        """Add a task to the stream for its priority."""
+        if not self.redis_client:
+            log_event(
+                "enrichment_queue_not_initialized",
+                {
+                    "task_type": task_type,
+                    "document_id": document_id,
+                },
+                level=logging.WARNING,
+            )
+            return False
+
+        task = {
+            "type": task_type,
+            "document_id": document_id,
+            "data": data,
+            "priority": priority,
+            "enqueued_at": datetime.now().isoformat(),
+            "retry_count": 0,
+            "max_retries": 3,
+        }
+
+        try:
+            message_id = await cast(
+                Awaitable[str],
+                self._client().xadd(
+                    self._stream_key(priority), {"task": json.dumps(task)}
+                ),
+            )
+
+            log_event(
+                "enrichment_task_enqueued",
+                {
+                    "task_type": task_type,
+                    "document_id": document_id,
+                    "priority": priority_level(priority),
+                    "message_id": message_id,
+                },
+            )
+            return True
+
+        except Exception as e:
+            log_event(
+                "enrichment_enqueue_failed",
+                {
+                    "task_type": task_type,
+                    "document_id": document_id,
+                    "error": str(e),
+                },
+                level=logging.ERROR,
+            )
+            return False
+
+    def _decode_entries(
+        self, stream_key: str, entries: List[Tuple[str, Dict[str, str]]]
+    ) -> List[Dict[str, Any]]:
+        """Turn stream entries into tasks carrying their stream address."""
+        tasks = []
+        for message_id, fields in entries:
+            try:
+                task = json.loads(fields["task"])
+            except (KeyError, TypeError, json.JSONDecodeError) as e:
+                log_event(
+                    "enrichment_task_decode_error",
+                    {"message_id": message_id, "error": str(e)},
+                    level=logging.ERROR,
+                )
+                task = {"type": None, "document_id": None}
+            task[STREAM_FIELD] = stream_key
+            task[MESSAGE_ID_FIELD] = message_id
+            self._pending_ids[stream_key].add(message_id)
+            tasks.append(task)
+        return tasks
+
+    async def refresh_in_flight(self) -> int:
+        """
+        Reset the idle time of every task pending for this consumer.
+
+        XAUTOCLAIM measures idle time from delivery, so a task waiting behind
+        a type limit or a slow LLM call would otherwise look abandoned. XCLAIM
+        with JUSTID to this same consumer resets it without counting as a
+        delivery.
+        """
+        if not self.redis_client:
+            return 0
+
+        refreshed = 0
+        async with self._client().pipeline(transaction=False) as pipe:
+            for stream_key, message_ids in self._pending_ids.items():
+                if message_ids:
+                    pipe.xclaim(
+                        stream_key,
+                        self.GROUP_NAME,
+                        self.consumer_name,
+                        min_idle_time=0,
+                        message_ids=list(message_ids),
+                        justid=True,
+                    )
+                    refreshed += len(message_ids)
+            if refreshed:
+                await pipe.execute()
+        return refreshed
+
+    async def _claim_abandoned(self) -> None:
+        """Reclaim tasks left pending by workers that stopped responding."""
+        now = time.monotonic()
+        if now - self._last_claim < self.CLAIM_INTERVAL_SECONDS:
+            return
+        self._last_claim = now
+
+        client = self._client()
+        for stream_key in self.stream_keys:
+            start_id = "0-0"
+            while True:
+                response = await cast(
+                    Awaitable[List[Any]],
+                    client.xautoclaim(
+                        stream_key,
+                        self.GROUP_NAME,
+                        self.consumer_name,
+                        min_idle_time=self.claim_idle_ms,
+                        start_id=start_id,
+                        count=100,
+                    ),
+                )
+                start_id, entries = response[0], response[1]
+                # Tasks this worker still holds are not abandoned, however
+                # long they have been waiting
+                entries = [
+                    entry
+                    for entry in entries
+                    if entry and entry[0] not in self._pending_ids[stream_key]
+                ]
+                claimed = await self._drop_poison_tasks(
+                    stream_key, self._decode_entries(stream_key, entries)
+                )
+                if claimed:
+                    self._delivered.extend(claimed)
+                    log_event(
+                        "enrichment_tasks_reclaimed",
+                        {"stream": stream_key, "tasks": len(claimed)},
+                        level=logging.WARNING,
+                    )
+                if start_id in ("0-0", b"0-0"):
+                    break
+
+    async def _drop_poison_tasks(
+        self, stream_key: str, tasks: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Fail claimed tasks that have been delivered MAX_DELIVERIES times.
+
+        Returns:
+            The claimed tasks that should run again
+        """
+        if not tasks:
+            return []
+
+        client = self._client()
+        async with client.pipeline(transaction=False) as pipe:
+            for task in tasks:
+                message_id = task[MESSAGE_ID_FIELD]
+                pipe.xpending_range(
+                    stream_key, self.GROUP_NAME, min=message_id, max=message_id, count=1
+                )
+            pending = await pipe.execute()
+
+        keep = []
+        for task, entries in zip(tasks, pending, strict=True):
+            deliveries = int(entries[0]["times_delivered"]) if entries else 0
+            if deliveries < self.MAX_DELIVERIES:
+                keep.append(task)
+                continue
+
+            async with client.pipeline(transaction=True) as pipe:
+                self._queue_ack(pipe, task)
+                await pipe.execute()
+            await self._mark_failed(
+                {**self._strip_address(task), "deliveries": deliveries},
+                "Max deliveries exceeded",
+            )
+        return keep
+
+    async def _recover_stuck_tasks(self) -> Dict[str, int]:
+        """
+        Remove consumers of workers that are gone.
+
+        Their pending tasks are reclaimed by the live workers' XAUTOCLAIM
+        sweeps; once a consumer has no pending entries and has been idle past
+        the claim timeout, it is deleted from the group.
+        """
+        client = self._client()
+        removed = 0
+        for stream_key in self.stream_keys:
+            consumers = await cast(
+                Awaitable[List[Dict[str, Any]]],
+                client.xinfo_consumers(stream_key, self.GROUP_NAME),
+            )
+            for consumer in consumers:
+                name = consumer.get("name")
+                if (
+                    name == self.consumer_name
+                    or int(consumer.get("pending", 0))
+                    or int(consumer.get("idle", 0)) < self.claim_idle_ms
+                ):
+                    continue
+                await cast(
+                    Awaitable[int],
+                    client.xgroup_delconsumer(stream_key, self.GROUP_NAME, name),
+                )
+                removed += 1
+        return {"consumers_removed": removed}
+
+    async def _read(
+        self, streams: List[str], block_ms: Optional[int], count: int = 1
+    ) -> List[Any]:
+        return await cast(
+            Awaitable[List[Any]],
+            self._client().xreadgroup(
+                self.GROUP_NAME,
+                self.consumer_name,
+                {stream_key: ">" for stream_key in streams},
+                count=count,
+                block=block_ms,
+            ),
+        )
+
+    @track(
+        operation="dequeue_enrichment_task",
+        track_performance=True,
+        frequency="high_frequency",
+    )
+    async def get_next_task(self, timeout: int = 1) -> Optional[Dict[str, Any]]:
+        """
+        Get the next task, highest priority first.
+
+        Each priority stream is polled in order without blocking; only when
+        all are empty does the read block (up to ``timeout`` seconds) on all
+        of them at once.
+        """
+        if not self.redis_client:
+            return None
+
+        try:
+            await self._claim_abandoned()
+            if self._delivered:
+                return self._handout(self._delivered.popleft())
+
+            for stream_key in self.stream_keys:
+                response = await self._read([stream_key], block_ms=None)
+                if response:
+                    return self._handout(self._tasks_by_priority(response)[0])
+
+            response = await self._read(self.stream_keys, block_ms=timeout * 1000)
+            if not response:
+                return None
+
+            # Several streams may answer one blocking read; every entry is now
+            # pending for this consumer, so keep the rest for the next calls
+            tasks = self._tasks_by_priority(response)
+            self._delivered.extend(tasks[1:])
+            return self._handout(tasks[0])
+
+        except Exception as e:
+            log_event(
+                "enrichment_dequeue_failed",
+                {
+                    "error": str(e),
+                },
+                level=logging.ERROR,
+            )
+            return None
+
+    @track(
+        operation="dequeue_enrichment_tasks",
+        track_performance=True,
+        frequency="high_frequency",
+    )
+    async def get_next_tasks(
+        self, max_tasks: int, timeout: int = 1
+    ) -> List[Dict[str, Any]]:
+        """
+        Get up to max_tasks tasks, highest priority first.
+
+        Streams are read in priority order with COUNT so a batch is filled
+        from the high stream before lower ones; only an empty queue blocks.
+        """
+        if not self.redis_client or max_tasks <= 0:
+            return []
+
+        try:
+            await self._claim_abandoned()
+            tasks: List[Dict[str, Any]] = []
+            while self._delivered and len(tasks) < max_tasks:
+                tasks.append(self._delivered.popleft())
+
+            for stream_key in self.stream_keys:
+                if len(tasks) >= max_tasks:
+                    break
+                response = await self._read(
+                    [stream_key], block_ms=None, count=max_tasks - len(tasks)
+                )
+                if response:
+                    tasks.extend(self._tasks_by_priority(response))
+
+            if not tasks:
+                response = await self._read(
+                    self.stream_keys, block_ms=timeout * 1000, count=max_tasks
+                )
+                if response:
+                    # COUNT applies per stream, so a blocking read over all
+                    # streams can return more than asked for; keep the excess
+                    tasks = self._tasks_by_priority(response)
+                    self._delivered.extend(tasks[max_tasks:])
+                    tasks = tasks[:max_tasks]
+
+            return [self._handout(task) for task in tasks]
+
+        except Exception as e:
+            log_event(
+                "enrichment_dequeue_failed",
+                {
+                    "error": str(e),
+                },
+                level=logging.ERROR,
+            )
+            return []
+
+    def _tasks_by_priority(self, response: List[Any]) -> List[Dict[str, Any]]:
+        """Decode an XREADGROUP response into tasks, highest priority first."""
+        entries_by_stream = {
+            (
+                stream_key.decode() if isinstance(stream_key, bytes) else stream_key
+            ): entries
+            for stream_key, entries in response
+        }
+        tasks: List[Dict[str, Any]] = []
+        for stream_key in self.stream_keys:
+            tasks.extend(
+                self._decode_entries(stream_key, entries_by_stream.get(stream_key, []))
+            )
+        return tasks
+
+    def _handout(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        log_event(
+            "enrichment_task_dequeued",
+            {
+                "task_type": task.get("type"),
+                "document_id": task.get("document_id"),
+                "retry_count": task.get("retry_count", 0),
+                "message_id": task.get(MESSAGE_ID_FIELD),
+            },
+        )
+        return task
+
+    @staticmethod
+    def _strip_address(task: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            key: value
+            for key, value in task.items()
+            if key not in (STREAM_FIELD, MESSAGE_ID_FIELD)
+        }
+
+    @track(
+        operation="complete_enrichment_task",
+        include_args=["document_id"],
+        track_performance=True,
+        frequency="medium_frequency",
+    )
+    async def mark_complete(self, task: Dict[str, Any]) -> bool:
+        """Acknowledge a task and record its completion."""
+        if not self.redis_client:
+            return False
+
+        try:
+            completion_record = {
+                **self._strip_address(task),
+                "completed_at": datetime.now().isoformat(),
+            }
+
+            async with self._client().pipeline(transaction=True) as pipe:
+                self._queue_ack(pipe, task)
+                pipe.lpush(self.completed_key, json.dumps(completion_record))
+                await pipe.execute()
+
+            log_event(
+                "enrichment_task_completed",
+                {
+                    "task_type": task.get("type"),
+                    "document_id": task.get("document_id"),
+                    "processing_time_seconds": self._calculate_processing_time(task),
+                },
+            )
+            return True
+
+        except Exception as e:
+            log_event(
+                "enrichment_complete_failed",
+                {
+                    "document_id": task.get("document_id"),
+                    "error": str(e),
+                },
+                level=logging.ERROR,
+            )
+            return False
+
+    def _queue_ack(self, pipe, task: Dict[str, Any]) -> None:
+        """Add the commands acknowledging and deleting a task's entry."""
+        stream_key = task.get(STREAM_FIELD)
+        message_id = task.get(MESSAGE_ID_FIELD)
+        if stream_key and message_id:
+            pipe.xack(stream_key, self.GROUP_NAME, message_id)
+            pipe.xdel(stream_key, message_id)
+            self._pending_ids.get(stream_key, set()).discard(message_id)
+
+    @track(
+        operation="requeue_enrichment_task",
+        include_args=["document_id"],
+        track_performance=True,
+        frequency="low_frequency",
+    )
+    async def requeue_with_retry(self, task: Dict[str, Any]) -> bool:
+        """Acknowledge a failed task and re-add it with an incremented retry count."""
+        if not self.redis_client:
+            return False
+
+        try:
+            retried = self._strip_address(task)
+            retried["retry_count"] = retried.get("retry_count", 0) + 1
+            retried["last_retry_at"] = datetime.now().isoformat()
+
+            if retried["retry_count"] > retried.get("max_retries", 3):
+                async with self._client().pipeline(transaction=True) as pipe:
+                    self._queue_ack(pipe, task)
+                    await pipe.execute()
+                await self._mark_failed(retried, "Max retries exceeded")
+                return False
+
+            # Ack and re-add atomically, so the task is never lost or doubled
+            async with self._client().pipeline(transaction=True) as pipe:
+                self._queue_ack(pipe, task)
+                pipe.xadd(
+                    self._stream_key(int(retried.get("priority", 0))),
+                    {"task": json.dumps(retried)},
+                )
+                await pipe.execute()
+
+            log_event(
+                "enrichment_task_requeued",
+                {
+                    "task_type": retried.get("type"),
+                    "document_id": retried.get("document_id"),
+                    "retry_count": retried["retry_count"],
+                    "max_retries": retried.get("max_retries", 3),
+                },
+            )
+            return True
+
+        except Exception as e:
+            log_event(
+                "enrichment_requeue_failed",
+                {
+                    "document_id": task.get("document_id"),
+                    "error": str(e),
+                },
+                level=logging.ERROR,
+            )
+            return False
+
+    @track(
+        operation="get_queue_stats",
+        track_performance=True,
+        frequency="low_frequency",
+    )
+    async def get_stats(self) -> Dict[str, Any]:
+        """Get queue statistics, with waiting and pending counts per priority."""
+        if not self.redis_client:
+            return {
+                "status": "not_initialized",
+                "queue_length": 0,
+                "processing": 0,
+                "completed": 0,
+                "failed": 0,
+            }
+
+        try:
+            client = self._client()
+            by_priority: Dict[str, Dict[str, int]] = {}
+            for level, stream_key in zip(
+                PRIORITY_LEVELS, self.stream_keys, strict=True
+            ):
+                length = await cast(Awaitable[int], client.xlen(stream_key))
+                groups = await cast(
+                    Awaitable[List[Dict[str, Any]]], client.xinfo_groups(stream_key)
+                )
+                pending = 0
+                for group in groups:
+                    if group.get("name") == self.GROUP_NAME:
+                        pending = int(group.get("pending", 0))
+                # Acked entries are deleted, so the rest are waiting
+                by_priority[level] = {
+                    "queued": max(0, length - pending),
+                    "processing": pending,
+                }
+
+            stats = {
+                "status": "operational",
+                "backend": "streams",
+                "queue_length": sum(p["queued"] for p in by_priority.values()),
+                "processing": sum(p["processing"] for p in by_priority.values()),
+                "completed": await cast(
+                    Awaitable[int], client.llen(self.completed_key)
+                ),
+                "failed": await cast(Awaitable[int], client.llen(self.failed_key)),
+                "by_priority": by_priority,
+            }
+
+            log_event("enrichment_queue_stats", stats)
+
+            return stats
+
+        except Exception as e:
+            log_event(
+                "enrichment_stats_failed",
+                {
+                    "error": str(e),
+                },
+                level=logging.ERROR,
+            )
+            return {
+                "status": "error",
+                "error": str(e),
+            }
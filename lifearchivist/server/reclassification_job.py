@@ -0,0 +1,377 @@
+"""
+Background reclassification of every document in the archive.
+
+When classifier rules change, existing documents keep the classifications
+they were imported with. ReclassificationJob re-runs theme and subtheme
+classification over the whole archive without re-importing anything:
+
+- document IDs are streamed from the tracker with SSCAN, one page per batch
+- results for the current rules are read from the classification cache by
+  file hash in one MGET; only cache misses go further
+- each batch's text is rebuilt from its Qdrant chunks in a single retrieve
+- documents are classified across the classifier process pool and the
+  results are written back to the classification cache
+- only documents whose classifications changed are written back, in one
+  pipelined metadata update per batch
+
+The SSCAN cursor is checkpointed after every batch together with the rules
+version, so an interrupted pass resumes where it stopped unless the rules
+changed again in the meantime. Progress is broadcast to WebSocket clients as
+``reclassification_progress`` messages.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from lifearchivist.storage.classification_cache import classification_cache_name
+from lifearchivist.utils.logging import log_event
+
+# Metadata fields needed to reclassify a document
+RECLASSIFICATION_FIELDS = [
+    "original_path",
+    "original_filename",
+    "file_hash",
+    "classifications",
+]
+
+
+class ReclassificationJob:
+    """Re-runs document classification over the archive in resumable batches."""
+
+    CHECKPOINT_NAME = "reclassification"
+    BATCH_SIZE = 100
+    COLLECTION_NAME = "lifearchivist"
+
+    def __init__(
+        self,
+        doc_tracker,
+        qdrant_client,
+        classifier_pool,
+        rules_version: str,
+        session_manager=None,
+        batch_size: Optional[int] = None,
+        classification_cache=None,
+    ):
+        """
+        Initialize the job.
+
+        Args:
+            doc_tracker: Document tracker (Redis) for IDs, nodes and metadata
+            qdrant_client: Qdrant client holding the document chunks
+            classifier_pool: ClassifierPool used to classify each batch
+            rules_version: Fingerprint of the classifier rules; a checkpoint
+                from other rules is discarded
+            session_manager: WebSocket session manager for progress broadcasts
+            batch_size: Documents per batch
+            classification_cache: ClassificationCache shared with imports;
+                documents with a cached result for these rules skip
+                classification
+        """
+        self.doc_tracker = doc_tracker
+        self.qdrant_client = qdrant_client
+        self.classifier_pool = classifier_pool
+        self.rules_version = rules_version
+        self.session_manager = session_manager
+        self.batch_size = batch_size or self.BATCH_SIZE
+        self.classification_cache = classification_cache
+
+        self.status = "pending"
+        self.stats: Dict[str, Any] = self._empty_stats()
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, Any]:
+        return {
+            "processed": 0,
+            "changed": 0,
+            "unchanged": 0,
+            "cached": 0,
+            "skipped": 0,
+            "errors": 0,
+            "total_documents": 0,
+            "resumed": False,
+            "started_at": None,
+            "elapsed_seconds": 0.0,
+        }
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get the job's current status and counters."""
+        return {"status": self.status, **self.stats}
+
+    async def run(self, resume: bool = True) -> Dict[str, Any]:
+        """
+        Reclassify every document, writing back changed classifications.
+
+        Args:
+            resume: Continue from the last checkpoint instead of starting over
+
+        Returns:
+            Final status and counters (see get_status)
+        """
+        self.status = "running"
+        self.stats = self._empty_stats()
+        started = time.monotonic()
+        self.stats["started_at"] = time.time()
+
+        try:
+            cursor = await self._load_checkpoint() if resume else "0"
+            self.stats["resumed"] = cursor != "0"
+            self.stats["total_documents"] = await self.doc_tracker.get_document_count()
+
+            log_event(
+                "reclassification_started",
+                {
+                    "total_documents": self.stats["total_documents"],
+                    "resumed": self.stats["resumed"],
+                    "rules_version": self.rules_version,
+                },
+            )
+            await self._broadcast()
+
+            while True:
+                cursor, document_ids = await self.doc_tracker.scan_document_ids(
+                    cursor, count=self.batch_size
+                )
+                if document_ids:
+                    await self._reclassify_batch(document_ids)
+
+                self.stats["elapsed_seconds"] = round(time.monotonic() - started, 2)
+                if cursor == "0":
+                    break
+
+                await self._save_checkpoint(cursor)
+                await self._broadcast()
+
+            await self.doc_tracker.set_checkpoint(self.CHECKPOINT_NAME, None)
+            self.status = "completed"
+            log_event("reclassification_completed", self.get_status())
+
+        except asyncio.CancelledError:
+            # Checkpoint stays in place so the next run resumes
+            self.status = "cancelled"
+            log_event("reclassification_cancelled", self.get_status())
+            await self._broadcast()
+            raise
+
+        except Exception as e:
+            self.status = "failed"
+            self.stats["error"] = str(e)
+            log_event(
+                "reclassification_failed",
+                {**self.get_status(), "error_type": type(e).__name__},
+                level=logging.ERROR,
+            )
+
+        self.stats["elapsed_seconds"] = round(time.monotonic() - started, 2)
+        await self._broadcast()
+        return self.get_status()
+
+    async def _reclassify_batch(self, document_ids: List[str]) -> None:
+        """Classify one batch of documents and write back what changed."""
+        metadata_by_id, node_ids_by_id = await asyncio.gather(
+            self.doc_tracker.get_metadata_fields_batch(
+                document_ids, RECLASSIFICATION_FIELDS
+            ),
+            self.doc_tracker.get_node_ids_batch(document_ids),
+        )
+
+        classified = await self._get_cached(document_ids, metadata_by_id)
+        self.stats["cached"] += len(classified)
+
+        misses = [
+            document_id for document_id in document_ids if document_id not in classified
+        ]
+        texts = await self._load_texts(
+            {document_id: node_ids_by_id.get(document_id, []) for document_id in misses}
+        )
+
+        batch: List[Tuple[str, Tuple[str, str, Optional[str]]]] = []
+        for document_id in misses:
+            text = texts.get(document_id)
+            if not text or not text.strip():
+                self.stats["skipped"] += 1
+                continue
+            metadata = metadata_by_id.get(document_id, {})
+            original_filename = metadata.get("original_filename")
+            batch.append(
+                (
+                    document_id,
+                    (text, _display_path(metadata), original_filename),
+                )
+            )
+
+        if batch:
+            try:
+                results = await self.classifier_pool.classify_documents_async(
+                    [item for _, item in batch]
+                )
+            except Exception as e:
+                self.stats["errors"] += len(batch)
+                log_event(
+                    "reclassification_batch_failed",
+                    {"documents": len(batch), "error": str(e)},
+                    level=logging.WARNING,
+                )
+                batch = []
+            else:
+                new_results = dict(
+                    zip((document_id for document_id, _ in batch), results, strict=True)
+                )
+                classified.update(new_results)
+                await self._set_cached(new_results, metadata_by_id)
+
+        if not classified:
+            return
+
+        updates: Dict[str, Dict[str, Any]] = {}
+        for document_id, classifications in classified.items():
+            current = metadata_by_id.get(document_id, {}).get("classifications")
+            if _same_classifications(current, classifications):
+                self.stats["unchanged"] += 1
+            else:
+                updates[document_id] = {"classifications": classifications}
+
+        if updates:
+            written = await self.doc_tracker.update_full_metadata_batch(updates)
+            for updated in written.values():
+                if updated:
+                    self.stats["changed"] += 1
+                else:
+                    # Document was removed while the batch was classified
+                    self.stats["skipped"] += 1
+
+        self.stats["processed"] += len(classified)
+
+    async def _get_cached(
+        self, document_ids: List[str], metadata_by_id: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get cached classifications for the current rules, by document ID."""
+        if not self.classification_cache:
+            return {}
+
+        keyed = [
+            (document_id, metadata_by_id[document_id])
+            for document_id in document_ids
+            if metadata_by_id.get(document_id, {}).get("file_hash")
+        ]
+        cached = await self.classification_cache.get_many(
+            [(metadata["file_hash"], _cache_name(metadata)) for _, metadata in keyed]
+        )
+        return {
+            document_id: result
+            for (document_id, _), result in zip(keyed, cached, strict=True)
+            if result is not None
+        }
+
+    async def _set_cached(
+        self,
+        results: Dict[str, Dict[str, Any]],
+        metadata_by_id: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """Write new classifications to the cache for later passes and imports."""
+        if not self.classification_cache:
+            return
+
+        items = []
+        for document_id, classifications in results.items():
+            metadata = metadata_by_id.get(document_id, {})
+            if metadata.get("file_hash"):
+                items.append(
+                    (metadata["file_hash"], _cache_name(metadata), classifications)
+                )
+        await self.classification_cache.set_many(items)
+
+    async def _load_texts(self, node_ids_by_id: Dict[str, List[str]]) -> Dict[str, str]:
+        """
+        Rebuild document text from Qdrant chunks in one retrieve call.
+
+        Chunks are joined in their stored order; chunk overlap repeats a few
+        words at each boundary, which does not affect rule matching.
+        """
+        from lifearchivist.storage.utils import QdrantNodeUtils
+
+        all_node_ids = [
+            node_id for node_ids in node_ids_by_id.values() for node_id in node_ids
+        ]
+        if not all_node_ids or not self.qdrant_client:
+            return {}
+
+        points = await asyncio.to_thread(
+            self.qdrant_client.retrieve,
+            collection_name=self.COLLECTION_NAME,
+            ids=all_node_ids,
+            with_payload=True,
+            with_vectors=False,
+        )
+        text_by_node = {
+            str(point.id): QdrantNodeUtils.extract_text_from_node(point.payload or {})
+            for point in points
+        }
+
+        return {
+            document_id: "\n".join(
+                text
+                for text in (text_by_node.get(node_id) for node_id in node_ids)
+                if text
+            )
+            for document_id, node_ids in node_ids_by_id.items()
+        }
+
+    async def _load_checkpoint(self) -> str:
+        """Get the cursor to resume from, or "0" to start a new pass."""
+        raw = await self.doc_tracker.get_checkpoint(self.CHECKPOINT_NAME)
+        if not raw:
+            return "0"
+        try:
+            checkpoint = json.loads(raw)
+        except json.JSONDecodeError:
+            return "0"
+        if checkpoint.get("rules_version") != self.rules_version:
+            # Rules changed since the interrupted pass; every document needs
+            # the new rules, so start over
+            return "0"
+        return str(checkpoint.get("cursor", "0"))
+
+    async def _save_checkpoint(self, cursor: str) -> None:
+        await self.doc_tracker.set_checkpoint(
+            self.CHECKPOINT_NAME,
+            json.dumps({"cursor": cursor, "rules_version": self.rules_version}),
+        )
+
+    async def _broadcast(self) -> None:
+        """Send the current progress to connected WebSocket clients."""
+        if not self.session_manager:
+            return
+        try:
+            await self.session_manager.broadcast(
+                {"type": "reclassification_progress", "data": self.get_status()}
+            )
+        except Exception as e:
+            log_event(
+                "reclassification_broadcast_failed",
+                {"error": str(e)},
+                level=logging.DEBUG,
+            )
+
+
+def _display_path(metadata: Dict[str, Any]) -> str:
+    """Display path the document was imported with, as the classifiers saw it."""
+    return metadata.get("original_path") or metadata.get("original_filename") or ""
+
+
+def _cache_name(metadata: Dict[str, Any]) -> str:
+    """Classification cache name matching the one used at import."""
+    return classification_cache_name(
+        _display_path(metadata), metadata.get("original_filename")
+    )
+
+
+def _same_classifications(
+    current: Optional[Dict[str, Any]], new: Dict[str, Any]
+) -> bool:
+    """Compare stored and new classifications as they would be serialized."""
+    if not isinstance(current, dict):
+        return False
+    return json.dumps(current, sort_keys=True) == json.dumps(new, sort_keys=True)
@@ -20,6 +20,7 @@ from ..storage.bm25_index_service import BM25IndexService
 from ..storage.credential_service import CredentialService
 from ..storage.database import ConversationService, MessageService
 from ..storage.redis_document_tracker import RedisDocumentTracker
+from ..storage.vault.thumbnail_service import ThumbnailService
 from ..storage.vault.vault import Vault
 from ..utils.logging import log_event
 
@@ -252,7 +253,16 @@ class ServiceContainer:
                     level=logging.WARNING,
                 )
 
-        # Vault doesn't need explicit cleanup currently
+        if self.vault:
+            try:
+                await self.vault.stop_stats_recount()
+                self.vault.shutdown_thumbnails()
+            except Exception as e:
+                log_event(
+                    "vault_cleanup_error",
+                    {"error": str(e)},
+                    level=logging.WARNING,
+                )
 
         if self.db_pool:
             try:
@@ -412,8 +422,19 @@ class ServiceContainer:
     async def _init_vault(self) -> None:
         """Initialize vault storage."""
         try:
-            self.vault = Vault(self.config.vault_path)
+            settings = self.config.settings
+            self.vault = Vault(
+                self.config.vault_path,
+                thumbnail_service=ThumbnailService(
+                    size=settings.thumbnail_size,
+                    workers=settings.thumbnail_workers,
+                    lazy=settings.lazy_thumbnails,
+                ),
+            )
             await self.vault.initialize()
+            self.vault.start_stats_recount(
+                self.config.settings.vault_stats_recount_interval
+            )
 
             log_event("vault_initialized", {"path": str(self.config.vault_path)})
 
@@ -425,7 +446,10 @@ class ServiceContainer:
     async def _init_doc_tracker(self) -> None:
         """Initialize Redis document tracker."""
         try:
-            self.doc_tracker = RedisDocumentTracker(redis_url=self.config.redis_url)
+            self.doc_tracker = RedisDocumentTracker(
+                redis_url=self.config.redis_url,
+                metadata_encoding=self.config.settings.metadata_encoding,
+            )
             await self.doc_tracker.initialize()
 
             doc_count = await self.doc_tracker.get_document_count()
@@ -0,0 +1,182 @@
+"""
+Redis cache for theme and subtheme classification results.
+
+Classification depends only on a document's text, its filename and the
+classifier rules, so a result is cached under the file's SHA-256, a digest
+of the filename and a fingerprint of the rules. Re-importing unchanged
+content (or reclassifying an archive) then skips classification, and any
+change to a rule module changes the fingerprint, so stale results are never
+read and simply expire.
+"""
+
+import hashlib
+import json
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from redis.asyncio import Redis
+
+from ..utils.logging import log_event
+
+CLASSIFICATION_KEY_PREFIX = "lifearchivist:classification:"
+
+
+def classification_cache_name(
+    display_path: str, original_filename: Optional[str] = None
+) -> str:
+    """
+    Name a document is cached under.
+
+    Both filenames the classifiers see are part of it, so import and
+    reclassification share entries for the same document.
+    """
+    return f"{display_path}\0{original_filename or ''}"
+
+
+class ClassificationCache:
+    """Stores classification results keyed by content hash and rules version."""
+
+    TTL_SECONDS = 30 * 24 * 3600
+
+    def __init__(
+        self,
+        redis_client: Redis,
+        rules_version: str,
+        ttl_seconds: Optional[int] = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            redis_client: Async Redis client
+            rules_version: Fingerprint of the classifier rules
+                (see classification_rules_version)
+            ttl_seconds: Seconds each entry is kept
+        """
+        self.redis = redis_client
+        self.rules_version = rules_version
+        self.ttl_seconds = ttl_seconds or self.TTL_SECONDS
+
+    def _key(self, file_hash: str, filename: str) -> str:
+        # The filename feeds the filename-based tertiary rules, so it is part
+        # of the key; hashed to keep keys short
+        name_digest = hashlib.sha256(filename.encode()).hexdigest()[:16]
+        return (
+            f"{CLASSIFICATION_KEY_PREFIX}{self.rules_version}:{file_hash}:{name_digest}"
+        )
+
+    async def get(self, file_hash: str, filename: str = "") -> Optional[Dict[str, Any]]:
+        """
+        Get a cached classification result.
+
+        Args:
+            file_hash: SHA-256 of the file content
+            filename: Filename the document is classified with
+
+        Returns:
+            Cached result, or None on a miss (or if Redis is unavailable)
+        """
+        try:
+            cached = await self.redis.get(self._key(file_hash, filename))
+        except Exception as e:
+            log_event(
+                "classification_cache_read_failed",
+                {"file_hash": file_hash[:8], "error": str(e)},
+                level=logging.WARNING,
+            )
+            return None
+
+        if cached is None:
+            return None
+        try:
+            result: Dict[str, Any] = json.loads(cached)
+            return result
+        except json.JSONDecodeError:
+            return None
+
+    async def get_many(
+        self, items: Sequence[Tuple[str, str]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Get several cached results in one round trip.
+
+        Args:
+            items: (file_hash, filename) per document
+
+        Returns:
+            Cached result or None per item, in order
+        """
+        if not items:
+            return []
+        try:
+            values = await self.redis.mget(
+                [self._key(file_hash, filename) for file_hash, filename in items]
+            )
+        except Exception as e:
+            log_event(
+                "classification_cache_read_failed",
+                {"documents": len(items), "error": str(e)},
+                level=logging.WARNING,
+            )
+            return [None] * len(items)
+
+        results: List[Optional[Dict[str, Any]]] = []
+        for cached in values:
+            try:
+                results.append(json.loads(cached) if cached is not None else None)
+            except json.JSONDecodeError:
+                results.append(None)
+        return results
+
+    async def set_many(self, items: Sequence[Tuple[str, str, Dict[str, Any]]]) -> None:
+        """
+        Cache several results in one pipeline.
+
+        Failures are logged and ignored; the cache is only an optimization.
+
+        Args:
+            items: (file_hash, filename, result) per document
+        """
+        if not items:
+            return
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for file_hash, filename, result in items:
+                    pipe.set(
+                        self._key(file_hash, filename),
+                        json.dumps(result),
+                        ex=self.ttl_seconds,
+                    )
+                await pipe.execute()
+        except Exception as e:
+            log_event(
+                "classification_cache_write_failed",
+                {"documents": len(items), "error": str(e)},
+                level=logging.WARNING,
+            )
+
+    async def set(
+        self, file_hash: str, result: Dict[str, Any], filename: str = ""
+    ) -> None:
+        """
+        Cache a classification result.
+
+        Failures are logged and ignored; the cache is only an optimization.
+
+        Args:
+            file_hash: SHA-256 of the file content
+            result: Classification result to store
+            filename: Filename the document was classified with
+        """
+        try:
+            await self.redis.set(
+                self._key(file_hash, filename),
+                json.dumps(result),
+                ex=self.ttl_seconds,
+            )
+        except Exception as e:
+            log_event(
+                "classification_cache_write_failed",
+                {"file_hash": file_hash[:8], "error": str(e)},
+                level=logging.WARNING,
+            )
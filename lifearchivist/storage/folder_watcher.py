@@ -6,18 +6,27 @@ for processing. Uses OS-level filesystem events for efficient detection.
 
 Architecture:
 - Each folder has its own Observer and EventHandler
+- File events are coalesced per file; one dispatcher drains a timer wheel
+  of debounce deadlines and hands due files to a fixed pool of ingestion
+  workers, so a burst of events doesn't mean a task per file
 - Shared semaphore limits concurrent ingestions across all folders
+- Status broadcasts are throttled to one per STATUS_BROADCAST_INTERVAL
+- Duplicate checks fingerprint size plus the first and last 64 KB before
+  reading a whole file
 - Redis persistence for folder configurations
 - Thread-safe event loop integration
+- Catch-up scans (os.scandir against a per-folder file index) pick up files
+  added while a folder was not being watched
 """
 
 import asyncio
 import hashlib
 import logging
+import math
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 from uuid import uuid4
 
 import aiofiles
@@ -32,8 +41,25 @@ from lifearchivist.models.folder_watch import (
 from lifearchivist.storage.redis_folder_watch_store import RedisFolderWatchStore
 from lifearchivist.utils.logging import log_event
 
+try:
+    import xxhash
+
+    QUICK_HASH_ALGORITHM = "xxh3"
+except ImportError:  # pragma: no cover - depends on installed extras
+    xxhash = None
+    QUICK_HASH_ALGORITHM = "blake2b"
+
 logger = logging.getLogger(__name__)
 
+# Bytes sampled from each end of a file for its quick fingerprint
+QUICK_HASH_BYTES = 64 * 1024
+
+
+def _quick_digest(data: bytes) -> str:
+    if xxhash is not None:
+        return xxhash.xxh3_64_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
 
 class FolderWatcherService:
     """
@@ -48,6 +74,7 @@ class FolderWatcherService:
     - Concurrency control via semaphore
     - Redis persistence for folder configurations
     - Graceful start/stop per folder
+    - Incremental catch-up scan whenever a folder starts being watched
     """
 
     # Supported file extensions
@@ -64,6 +91,12 @@ class FolderWatcherService:
         ".csv",
     }
 
+    # Resolution of the debounce timer wheel
+    DISPATCH_TICK_SECONDS = 0.25
+
+    # Minimum seconds between folder_watch_status broadcasts
+    STATUS_BROADCAST_INTERVAL = 1.0
+
     def __init__(
         self,
         vault=None,
@@ -72,6 +105,7 @@ class FolderWatcherService:
         debounce_seconds: float = 2.0,
         ingestion_concurrency: int = 5,
         max_folders: int = 100,
+        scan_concurrency: int = 20,
     ):
         """
         Initialize the multi-folder watcher service.
@@ -83,6 +117,8 @@ class FolderWatcherService:
             debounce_seconds: Seconds to wait before processing a file
             ingestion_concurrency: Maximum concurrent file ingestions across all folders
             max_folders: Maximum number of folders that can be watched
+            scan_concurrency: Maximum files from one scan waiting for debounce
+                or ingestion at a time
         """
         self.vault = vault
         self.server = server
@@ -90,6 +126,7 @@ class FolderWatcherService:
         self.debounce_seconds = debounce_seconds
         self.ingestion_concurrency = ingestion_concurrency
         self.max_folders = max_folders
+        self.scan_concurrency = scan_concurrency
 
         # Multi-folder state: folder_id -> WatchedFolder
         self.watched_folders: Dict[str, WatchedFolder] = {}
@@ -97,9 +134,30 @@ class FolderWatcherService:
         # Event loop for thread-safe task scheduling
         self.event_loop: Optional[asyncio.AbstractEventLoop] = None
 
-        # Track pending files: (folder_id, file_path) -> asyncio.Task
-        # This allows us to track which folder each file belongs to
-        self.pending_tasks: Dict[Tuple[str, Path], asyncio.Task] = {}
+        # Files waiting out the debounce: (folder_id, file_path) -> deadline
+        # (event loop time). Another event for the same file only moves its
+        # deadline; deadlines are bucketed per DISPATCH_TICK_SECONDS in
+        # _timer_wheel, which a single dispatcher task drains.
+        self.pending_files: Dict[Tuple[str, Path], float] = {}
+        self._timer_wheel: Dict[int, Set[Tuple[str, Path]]] = {}
+        self._dispatcher_task: Optional[asyncio.Task] = None
+
+        # Files handed to the ingestion workers, not yet finished
+        self.queued_files: Set[Tuple[str, Path]] = set()
+        self._ready: asyncio.Queue[Tuple[str, Path]] = asyncio.Queue()
+        self._processing: Dict[Tuple[str, Path], asyncio.Task] = {}
+        self._worker_tasks: List[asyncio.Task] = []
+        self._file_done = asyncio.Condition()
+
+        # Throttled status broadcasts
+        self._status_task: Optional[asyncio.Task] = None
+        self._status_dirty = False
+        self._last_status_broadcast = 0.0
+
+        # Scan feeders per folder (folder_id -> asyncio.Task), plus catch-up
+        # scans that have not reached their feeder yet
+        self.scan_tasks: Dict[str, asyncio.Task] = {}
+        self._catch_up_tasks: Set[asyncio.Task] = set()
 
         # Concurrency control: Limit simultaneous ingestions across all folders
         # This prevents resource exhaustion when multiple folders drop files simultaneously
@@ -185,11 +243,27 @@ class FolderWatcherService:
             return
 
         try:
+            for task in list(self._catch_up_tasks):
+                task.cancel()
+
             # Stop all folder watchers
             folder_ids = list(self.watched_folders.keys())
             for folder_id in folder_ids:
                 await self.remove_folder(folder_id)
 
+            # Stop dispatching and ingesting
+            background = [
+                self._dispatcher_task,
+                self._status_task,
+                *self._worker_tasks,
+            ]
+            for task in background:
+                if task:
+                    task.cancel()
+            self._dispatcher_task = None
+            self._status_task = None
+            self._worker_tasks = []
+
             # Close Redis store
             if self.store:
                 await self.store.close()
@@ -341,15 +415,8 @@ class FolderWatcherService:
             if watched_folder.is_active():
                 await self._stop_watching(folder_id)
 
-            # Cancel pending tasks for this folder
-            tasks_to_cancel = [
-                (key, task)
-                for key, task in self.pending_tasks.items()
-                if key[0] == folder_id
-            ]
-            for key, task in tasks_to_cancel:
-                task.cancel()
-                self.pending_tasks.pop(key, None)
+            # Drop pending files for this folder
+            self._forget_pending_files(folder_id)
 
             # Remove from Redis first (fail fast if Redis is down)
             await self._store.remove_folder(folder_id)
@@ -478,10 +545,16 @@ class FolderWatcherService:
         """
         folders = list(self.watched_folders.values())
 
-        # Refresh stats from Redis for each folder
+        # Refresh stats from Redis for all folders in one round trip
+        try:
+            folders_data = await self._store.get_folders(f.id for f in folders)
+        except Exception as e:
+            logger.warning(f"Failed to refresh folder stats: {e}")
+            folders_data = {}
+
         for folder in folders:
             try:
-                folder_data = await self._store.get_folder(folder.id)
+                folder_data = folders_data.get(folder.id)
                 if folder_data:
                     # Update stats from Redis
                     folder.stats.files_detected = folder_data.get("files_detected", 0)
@@ -542,6 +615,12 @@ class FolderWatcherService:
             watched_folder.handler = handler
             watched_folder.status = FolderWatchStatus.ACTIVE
 
+            # Pick up files added while the folder wasn't watched; the
+            # observer is already running, so nothing falls in between
+            task = asyncio.create_task(self._catch_up_scan(folder_id))
+            self._catch_up_tasks.add(task)
+            task.add_done_callback(self._catch_up_tasks.discard)
+
             log_event(
                 "folder_watch_started",
                 {
@@ -572,6 +651,11 @@ class FolderWatcherService:
             return
 
         try:
+            # Stop feeding scanned files
+            scan_task = self.scan_tasks.pop(folder_id, None)
+            if scan_task:
+                scan_task.cancel()
+
             # Stop observer
             if watched_folder.observer:
                 watched_folder.observer.stop()
@@ -693,6 +777,174 @@ class FolderWatcherService:
             logger.error(f"Error resuming persisted folders: {e}", exc_info=True)
             # Don't fail initialization if resume fails
 
+    def _is_candidate_name(self, name: str) -> bool:
+        """Check a file name against the extension and hidden/temp filters."""
+        if name.startswith(".") or name.startswith("~"):
+            return False
+        return os.path.splitext(name)[1].lower() in self.SUPPORTED_EXTENSIONS
+
+    def _scan_tree(self, root: Path) -> Dict[str, Tuple[int, int]]:
+        """
+        Walk a folder with os.scandir (blocking; run in a thread).
+
+        Hidden directories are skipped and symlinks are not followed.
+
+        Args:
+            root: Folder to walk
+
+        Returns:
+            Mapping of path relative to root to (mtime_ns, size) for every
+            supported file
+        """
+        prefix_length = len(os.path.join(str(root), ""))
+        files: Dict[str, Tuple[int, int]] = {}
+        directories = [str(root)]
+
+        while directories:
+            directory = directories.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if not entry.name.startswith("."):
+                                    directories.append(entry.path)
+                            elif entry.is_file(
+                                follow_symlinks=False
+                            ) and self._is_candidate_name(entry.name):
+                                stat = entry.stat(follow_symlinks=False)
+                                files[entry.path[prefix_length:]] = (
+                                    stat.st_mtime_ns,
+                                    stat.st_size,
+                                )
+                        except OSError:
+                            # Removed or unreadable while scanning
+                            continue
+            except OSError as e:
+                logger.warning(f"Cannot scan directory {directory}: {e}")
+
+        return files
+
+    async def scan_folder(self, folder_id: str) -> Dict[str, int]:
+        """
+        Queue files that are new or changed since they were last handled.
+
+        Compares path, mtime and size from a scandir walk against the
+        folder's file index in Redis, drops index entries for deleted files,
+        and feeds the remaining candidates through the debounced ingestion
+        in the background, at most scan_concurrency at a time. Unchanged
+        files are neither hashed nor scheduled.
+
+        Args:
+            folder_id: Folder UUID
+
+        Returns:
+            Counts of files_found, files_queued, files_unchanged and
+            files_removed
+
+        Raises:
+            ValueError: If folder not found
+        """
+        watched_folder = self.watched_folders.get(folder_id)
+        if not watched_folder:
+            raise ValueError(f"Folder not found: {folder_id}")
+
+        root = watched_folder.path
+        scanned, index = await asyncio.gather(
+            asyncio.to_thread(self._scan_tree, root),
+            self._store.get_file_index(folder_id),
+        )
+
+        changed = [
+            path for path, signature in scanned.items() if index.get(path) != signature
+        ]
+        removed = [path for path in index if path not in scanned]
+        if removed:
+            await self._store.remove_from_file_index(folder_id, removed)
+
+        # The folder may have been stopped or removed during the walk
+        queued = 0
+        if changed and watched_folder.is_active():
+            previous = self.scan_tasks.pop(folder_id, None)
+            if previous:
+                previous.cancel()
+            self.scan_tasks[folder_id] = asyncio.create_task(
+                self._feed_scanned_files(folder_id, [root / path for path in changed])
+            )
+            queued = len(changed)
+
+        summary = {
+            "files_found": len(scanned),
+            "files_queued": queued,
+            "files_unchanged": len(scanned) - len(changed),
+            "files_removed": len(removed),
+        }
+        log_event("folder_watch_scanned", {"folder_id": folder_id, **summary})
+
+        return summary
+
+    async def _catch_up_scan(self, folder_id: str) -> None:
+        """Run scan_folder in the background, logging instead of raising."""
+        try:
+            await self.scan_folder(folder_id)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(
+                f"Catch-up scan failed for folder {folder_id}: {e}", exc_info=True
+            )
+
+    async def _feed_scanned_files(self, folder_id: str, files: List[Path]) -> None:
+        """
+        Schedule scanned files, keeping at most scan_concurrency in flight.
+
+        Args:
+            folder_id: Folder UUID
+            files: Absolute paths of new or changed files
+        """
+        limit = max(1, self.scan_concurrency)
+        in_flight: Set[Tuple[str, Path]] = set()
+
+        def has_room() -> bool:
+            in_flight.difference_update(
+                [key for key in in_flight if not self._is_pending(key)]
+            )
+            return len(in_flight) < limit
+
+        try:
+            for file_path in files:
+                async with self._file_done:
+                    await self._file_done.wait_for(has_room)
+                await self.schedule_ingestion(folder_id, file_path)
+                in_flight.add((folder_id, file_path))
+        finally:
+            if self.scan_tasks.get(folder_id) is asyncio.current_task():
+                del self.scan_tasks[folder_id]
+
+    async def _record_file_indexed(
+        self, folder_id: str, file_path: Path, file_stat: os.stat_result
+    ) -> None:
+        """
+        Record a handled file so catch-up scans skip it until it changes.
+
+        Args:
+            folder_id: Folder UUID
+            file_path: Path to the file
+            file_stat: Stat taken before the file was handled
+        """
+        watched_folder = self.watched_folders.get(folder_id)
+        if not watched_folder:
+            return
+
+        try:
+            relative_path = str(file_path.relative_to(watched_folder.path))
+            await self._store.update_file_index(
+                folder_id,
+                {relative_path: (file_stat.st_mtime_ns, file_stat.st_size)},
+            )
+        except Exception as e:
+            logger.warning(f"Failed to index {file_path}: {e}")
+
     def is_supported_file(self, file_path: Path) -> bool:
         """
         Check if file type is supported.
@@ -709,37 +961,138 @@ class FolderWatcherService:
         """
         Schedule a file for ingestion after debounce period.
 
+        Repeated events for the same file push its deadline back instead of
+        scheduling it again.
+
         Args:
             folder_id: Folder UUID that detected the file
             file_path: Path to file to ingest
         """
         key = (folder_id, file_path)
+        deadline = asyncio.get_running_loop().time() + self.debounce_seconds
 
-        # Cancel existing task for this file if any
-        if key in self.pending_tasks:
-            self.pending_tasks[key].cancel()
+        self.pending_files[key] = deadline
+        self._timer_wheel.setdefault(self._wheel_slot(deadline), set()).add(key)
 
-        # Schedule new task
-        task = asyncio.create_task(self._debounced_ingestion(folder_id, file_path))
-        self.pending_tasks[key] = task
+        if self._dispatcher_task is None or self._dispatcher_task.done():
+            self._dispatcher_task = asyncio.create_task(self._dispatch_due_files())
 
         # Notify frontend of status change
-        await self._notify_status_change()
+        self._request_status_broadcast()
+
+    def _wheel_slot(self, deadline: float) -> int:
+        """Timer wheel bucket of a deadline (rounded up to the next tick)."""
+        return math.ceil(deadline / self.DISPATCH_TICK_SECONDS)
+
+    def _is_pending(self, key: Tuple[str, Path]) -> bool:
+        return key in self.pending_files or key in self.queued_files
+
+    def _pending_count(self, folder_id: Optional[str] = None) -> int:
+        """Count files waiting for debounce or ingestion, optionally per folder."""
+        keys = self.pending_files.keys() | self.queued_files
+        if folder_id is None:
+            return len(keys)
+        return sum(1 for key in keys if key[0] == folder_id)
+
+    def _forget_pending_files(self, folder_id: str) -> None:
+        """Drop a folder's pending files and cancel its in-progress ones."""
+        for key in [key for key in self.pending_files if key[0] == folder_id]:
+            del self.pending_files[key]
+        # Stale wheel entries and queued keys are skipped when reached
+        self.queued_files.difference_update(
+            [key for key in self.queued_files if key[0] == folder_id]
+        )
+        for key, task in list(self._processing.items()):
+            if key[0] == folder_id:
+                task.cancel()
+        self._request_status_broadcast()
 
-    async def _debounced_ingestion(self, folder_id: str, file_path: Path) -> None:
+    async def _dispatch_due_files(self) -> None:
         """
-        Wait for debounce period, then ingest file.
+        Drain the timer wheel, handing due files to the ingestion workers.
+
+        Runs while any debounce deadline is outstanding; each tick hands
+        over everything that came due as one batch.
+        """
+        loop = asyncio.get_running_loop()
+
+        while self._timer_wheel:
+            next_slot = min(self._timer_wheel)
+            delay = next_slot * self.DISPATCH_TICK_SECONDS - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            current_slot = self._wheel_slot(loop.time())
+            due: List[Tuple[str, Path]] = []
+            for slot in sorted(s for s in self._timer_wheel if s <= current_slot):
+                for key in self._timer_wheel.pop(slot):
+                    deadline = self.pending_files.get(key)
+                    if deadline is None or self._wheel_slot(deadline) > slot:
+                        # Removed, or pushed back by a later event
+                        continue
+                    if key in self.queued_files:
+                        # Still being ingested; look again next tick
+                        self._timer_wheel.setdefault(current_slot + 1, set()).add(key)
+                        continue
+                    del self.pending_files[key]
+                    due.append(key)
+
+            if due:
+                self._hand_off(due)
+
+    def _hand_off(self, batch: List[Tuple[str, Path]]) -> None:
+        """Queue due files for the ingestion workers, starting them if needed."""
+        self.queued_files.update(batch)
+        for key in batch:
+            self._ready.put_nowait(key)
+
+        self._worker_tasks = [task for task in self._worker_tasks if not task.done()]
+        missing = min(self.ingestion_concurrency, self._ready.qsize()) - len(
+            self._worker_tasks
+        )
+        for _ in range(max(0, missing)):
+            self._worker_tasks.append(asyncio.create_task(self._ingestion_worker()))
+
+        log_event(
+            "folder_watch_batch_dispatched",
+            {"files": len(batch), "queued": len(self.queued_files)},
+            level=logging.DEBUG,
+        )
+
+    async def _ingestion_worker(self) -> None:
+        """Process queued files one at a time; exits when the queue is empty."""
+        while not self._ready.empty():
+            key = self._ready.get_nowait()
+            if key not in self.queued_files:
+                # Folder was removed after the file was queued
+                continue
+
+            task = asyncio.create_task(self._process_file(*key))
+            self._processing[key] = task
+            try:
+                await asyncio.shield(task)
+            except asyncio.CancelledError:
+                if not task.cancelled():
+                    # The worker itself is being cancelled
+                    task.cancel()
+                    raise
+            finally:
+                self._processing.pop(key, None)
+                self.queued_files.discard(key)
+                async with self._file_done:
+                    self._file_done.notify_all()
+                # Notify frontend that pending count changed
+                self._request_status_broadcast()
+
+    async def _process_file(self, folder_id: str, file_path: Path) -> None:
+        """
+        Check a debounced file and ingest it.
 
         Args:
             folder_id: Folder UUID
             file_path: Path to file to ingest
         """
-        key = (folder_id, file_path)
-
         try:
-            # Wait for file to stabilize
-            await asyncio.sleep(self.debounce_seconds)
-
             # Verify file still exists
             if not file_path.exists():
                 logger.debug(f"File no longer exists: {file_path}")
@@ -751,7 +1104,8 @@ class FolderWatcherService:
                 return
 
             # Check file size is reasonable
-            file_size = file_path.stat().st_size
+            file_stat = file_path.stat()
+            file_size = file_stat.st_size
             if file_size == 0:
                 logger.debug(f"File is empty: {file_path}")
                 return
@@ -762,12 +1116,13 @@ class FolderWatcherService:
                 return
 
             # Increment detected counter
-            await self._store.increment_stat(folder_id, "files_detected", 1)
+            self._store.buffer_stat_increment(folder_id, "files_detected")
 
-            # Check for duplicates using hash
-            if await self._is_duplicate(file_path):
+            # Check for duplicates, hashing in full only if needed
+            fingerprint = await self._quick_fingerprint(file_path, file_size)
+            if await self._is_duplicate(file_path, fingerprint):
                 logger.info(f"File already in vault (duplicate): {file_path.name}")
-                await self._store.increment_stat(folder_id, "files_skipped", 1)
+                self._store.buffer_stat_increment(folder_id, "files_skipped")
                 log_event(
                     "folder_watch_duplicate_skipped",
                     {
@@ -776,29 +1131,69 @@ class FolderWatcherService:
                         "file_size": file_size,
                     },
                 )
+                await self._record_file_indexed(folder_id, file_path, file_stat)
                 return
 
             # Queue for ingestion
-            await self._ingest_file(folder_id, file_path)
+            if await self._ingest_file(folder_id, file_path, fingerprint):
+                await self._record_file_indexed(folder_id, file_path, file_stat)
 
         except asyncio.CancelledError:
-            # Task was cancelled (new event for same file)
+            # Task was cancelled (folder removed)
             logger.debug(f"Ingestion cancelled: {file_path}")
         except Exception as e:
             logger.error(f"Error during debounced ingestion: {e}", exc_info=True)
             await self._record_file_failed(folder_id, file_path, str(e))
-        finally:
-            # Clean up task reference
-            self.pending_tasks.pop(key, None)
-            # Notify frontend that pending count changed
-            await self._notify_status_change()
 
-    async def _is_duplicate(self, file_path: Path) -> bool:
+    async def _quick_fingerprint(
+        self, file_path: Path, file_size: int
+    ) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        Fingerprint a file by its size and first and last QUICK_HASH_BYTES.
+
+        Args:
+            file_path: Path to file
+            file_size: Size of the file in bytes
+
+        Returns:
+            (fingerprint, SHA-256 if the whole file fit in the sample), or
+            None if the file could not be read
+        """
+
+        def read_sample() -> Tuple[str, Optional[str]]:
+            with open(file_path, "rb") as f:
+                if file_size <= 2 * QUICK_HASH_BYTES:
+                    data = f.read()
+                    full_hash: Optional[str] = hashlib.sha256(data).hexdigest()
+                else:
+                    data = f.read(QUICK_HASH_BYTES)
+                    f.seek(-QUICK_HASH_BYTES, os.SEEK_END)
+                    data += f.read(QUICK_HASH_BYTES)
+                    full_hash = None
+            digest = _quick_digest(data)
+            return f"{file_size}:{QUICK_HASH_ALGORITHM}:{digest}", full_hash
+
+        try:
+            return await asyncio.to_thread(read_sample)
+        except OSError as e:
+            logger.debug(f"Cannot fingerprint {file_path}: {e}")
+            return None
+
+    async def _is_duplicate(
+        self,
+        file_path: Path,
+        fingerprint: Optional[Tuple[str, Optional[str]]] = None,
+    ) -> bool:
         """
         Check if file is already in vault using hash.
 
+        With a quick fingerprint, the full SHA-256 is only computed when a
+        previously seen file shares it. An unseen fingerprint is treated as
+        new content; file.import still checks its full hash.
+
         Args:
             file_path: Path to file
+            fingerprint: Result of _quick_fingerprint for the file
 
         Returns:
             True if file already exists in vault
@@ -807,8 +1202,19 @@ class FolderWatcherService:
             return False
 
         try:
+            file_hash: Optional[str] = None
+            if fingerprint:
+                fingerprint_key, file_hash = fingerprint
+                known_hash = await self._store.get_fingerprint_hash(fingerprint_key)
+                if known_hash is None and file_hash is None:
+                    return False
+
             # Calculate file hash
-            file_hash = await self._calculate_hash(file_path)
+            if file_hash is None:
+                file_hash = await self._calculate_hash(file_path)
+
+            if fingerprint:
+                await self._store.add_fingerprint(fingerprint[0], file_hash)
 
             # Check if file exists in vault
             content_dir = self.vault.content_dir
@@ -846,26 +1252,36 @@ class FolderWatcherService:
 
         return sha256_hash.hexdigest()
 
-    async def _ingest_file(self, folder_id: str, file_path: Path) -> None:
+    async def _ingest_file(
+        self,
+        folder_id: str,
+        file_path: Path,
+        fingerprint: Optional[Tuple[str, Optional[str]]] = None,
+    ) -> bool:
         """
         Ingest a file using the file.import tool with concurrency control.
 
         Args:
             folder_id: Folder UUID
             file_path: Path to file to ingest
+            fingerprint: Quick fingerprint to record with the imported hash
+
+        Returns:
+            True if the file was ingested or file.import found it already in
+            the archive
         """
         if not self.server:
             logger.error("Server not available for ingestion")
-            return
+            return False
 
         if not self.ingestion_semaphore:
             logger.error("Ingestion semaphore not initialized")
-            return
+            return False
 
         watched_folder = self.watched_folders.get(folder_id)
         if not watched_folder:
             logger.error(f"Folder not found: {folder_id}")
-            return
+            return False
 
         # Acquire semaphore to limit concurrent ingestions
         async with self.ingestion_semaphore:
@@ -895,13 +1311,33 @@ class FolderWatcherService:
                 )
 
                 if result.get("success"):
-                    # Update stats
+                    import_result = result.get("result", {})
                     file_size = file_path.stat().st_size
-                    await self._store.increment_stat(folder_id, "files_ingested", 1)
-                    await self._store.increment_stat(
+                    self._store.buffer_clear_folder_error(folder_id)
+
+                    file_hash = import_result.get("hash")
+                    if fingerprint and file_hash:
+                        await self._store.add_fingerprint(fingerprint[0], file_hash)
+
+                    if import_result.get("status") == "duplicate":
+                        # Content the fingerprint index had not seen yet,
+                        # e.g. archived before the folder was watched
+                        self._store.buffer_stat_increment(folder_id, "files_skipped")
+                        log_event(
+                            "folder_watch_duplicate_skipped",
+                            {
+                                "folder_id": folder_id,
+                                "file_path": str(file_path),
+                                "file_size": file_size,
+                            },
+                        )
+                        return True
+
+                    # Update stats
+                    self._store.buffer_stat_increment(folder_id, "files_ingested")
+                    self._store.buffer_stat_increment(
                         folder_id, "bytes_processed", file_size
                     )
-                    await self._store.clear_folder_error(folder_id)
 
                     log_event(
                         "folder_watch_file_ingested",
@@ -922,15 +1358,19 @@ class FolderWatcherService:
                             folder_id=folder_id,
                             folder_path=str(watched_folder.path),
                             file_size=file_size,
+                            timings=import_result.get("timings"),
                         )
-                else:
-                    error = result.get("error", "Unknown error")
-                    await self._record_file_failed(folder_id, file_path, error)
+                    return True
+
+                error = result.get("error", "Unknown error")
+                await self._record_file_failed(folder_id, file_path, error)
 
             except Exception as e:
                 logger.error(f"Error ingesting file: {e}", exc_info=True)
                 await self._record_file_failed(folder_id, file_path, str(e))
 
+        return False
+
     async def _record_file_failed(
         self, folder_id: str, file_path: Path, error: str
     ) -> None:
@@ -943,7 +1383,7 @@ class FolderWatcherService:
             error: Error message
         """
         try:
-            await self._store.increment_stat(folder_id, "files_failed", 1)
+            self._store.buffer_stat_increment(folder_id, "files_failed")
             await self._store.set_folder_error(folder_id, error)
 
             log_event(
@@ -970,6 +1410,28 @@ class FolderWatcherService:
         except Exception as e:
             logger.error(f"Error recording failure: {e}", exc_info=True)
 
+    def _request_status_broadcast(self) -> None:
+        """Broadcast status soon, at most once per STATUS_BROADCAST_INTERVAL."""
+        self._status_dirty = True
+        if self._status_task is None or self._status_task.done():
+            self._status_task = asyncio.create_task(self._broadcast_status_throttled())
+
+    async def _broadcast_status_throttled(self) -> None:
+        """Send one broadcast per interval while status keeps changing."""
+        loop = asyncio.get_running_loop()
+
+        while self._status_dirty:
+            wait = (
+                self._last_status_broadcast + self.STATUS_BROADCAST_INTERVAL
+            ) - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            # Changes from here on are covered by the next broadcast
+            self._status_dirty = False
+            self._last_status_broadcast = loop.time()
+            await self._notify_status_change()
+
     async def _notify_status_change(self) -> None:
         """Broadcast status change to all connected WebSocket clients."""
         if not self.server or not self.server.session_manager:
@@ -1015,9 +1477,7 @@ class FolderWatcherService:
 
         for folder in folders:
             # Count pending files for this folder
-            pending_count = sum(
-                1 for key in self.pending_tasks.keys() if key[0] == folder.id
-            )
+            pending_count = self._pending_count(folder.id)
 
             status_dict[folder.id] = {
                 "folder_id": folder.id,
@@ -1073,7 +1533,7 @@ class FolderWatcherService:
         return {
             "total_folders": len(folders),
             "active_folders": active_count,
-            "total_pending": len(self.pending_tasks),
+            "total_pending": self._pending_count(),
             "total_detected": total_detected,
             "total_ingested": total_ingested,
             "total_failed": total_failed,
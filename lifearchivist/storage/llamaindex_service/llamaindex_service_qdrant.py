@@ -8,6 +8,7 @@ All public methods return Result types for explicit error handling and
 consistent response formats across the API and UI layers.
 """
 
+import asyncio
 import logging
 from typing import Any, Dict, List, Optional
 
@@ -50,6 +51,9 @@ class LlamaIndexQdrantService:
     - Async initialization for proper resource management
     """
 
+    # Chunks fetched per Qdrant retrieve when rebuilding document text
+    TEXT_READ_BATCH = 8
+
     def __init__(self, database=None, vault=None):
         self.settings = get_settings()
         self.database = database
@@ -794,6 +798,99 @@ class LlamaIndexQdrantService:
             "Metadata service not available", context={"filters": filters}
         )
 
+    async def find_document_by_hash(self, file_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        Find an existing document with the given content hash.
+
+        Uses the tracker's hash index instead of a metadata query, so
+        duplicate detection is a couple of Redis reads and builds no
+        document previews.
+
+        Returns:
+            {"document_id", "metadata"} with the stored original_path, or None
+        """
+        if not self.doc_tracker:
+            return None
+
+        document_id = await self.doc_tracker.find_document_by_hash(file_hash)
+        if not document_id:
+            return None
+
+        fields = await self.doc_tracker.get_metadata_fields_batch(
+            [document_id], ["original_path"]
+        )
+        return {
+            "document_id": document_id,
+            "metadata": fields.get(document_id, {}),
+        }
+
+    async def get_document_text(
+        self,
+        document_id: str,
+        max_chars: Optional[int] = None,
+        content_hash: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Rebuild a document's text from its stored chunks.
+
+        Chunks are read from Qdrant a few at a time, in order, and reading
+        stops once max_chars are covered, so a caller that only needs the
+        beginning of a large document fetches only its first chunks. Chunk
+        overlap repeats a few words at each boundary.
+
+        Args:
+            document_id: Document to read
+            max_chars: Stop reading after this many characters (the result
+                can run slightly past it; None reads everything)
+            content_hash: If given, return None unless the document still
+                has this file hash
+
+        Returns:
+            The text, or None if the document is gone or was replaced
+        """
+        if not self.doc_tracker or not self.qdrant_client:
+            return None
+
+        if content_hash:
+            fields = await self.doc_tracker.get_metadata_fields_batch(
+                [document_id], ["file_hash"]
+            )
+            if fields.get(document_id, {}).get("file_hash") != content_hash:
+                return None
+
+        node_ids = await self.doc_tracker.get_node_ids(document_id)
+        if not node_ids:
+            return None
+
+        from lifearchivist.storage.utils import QdrantNodeUtils
+
+        parts: List[str] = []
+        length = 0
+        for start in range(0, len(node_ids), self.TEXT_READ_BATCH):
+            batch = node_ids[start : start + self.TEXT_READ_BATCH]
+            points = await asyncio.to_thread(
+                self.qdrant_client.retrieve,
+                collection_name="lifearchivist",
+                ids=batch,
+                with_payload=True,
+                with_vectors=False,
+            )
+            text_by_node = {
+                str(point.id): QdrantNodeUtils.extract_text_from_node(
+                    point.payload or {}
+                )
+                for point in points
+            }
+            for node_id in batch:
+                text = text_by_node.get(node_id)
+                if text:
+                    parts.append(text)
+                    length += len(text) + 1
+            if max_chars is not None and length >= max_chars:
+                break
+
+        return "\n".join(parts)
+
     async def get_document_analysis(
         self, document_id: str
     ) -> Result[Dict[str, Any], str]:
@@ -0,0 +1,208 @@
+"""
+Compact metadata encoding support for the Redis document tracker.
+
+The tracker can store document metadata in two layouts:
+
+- ``fields``: one Redis hash field per metadata key, each JSON-encoded
+  separately (the original layout).
+- ``compact``: the whole metadata dict as a single JSON blob, plus the indexed
+  fields (theme, mime_type, status) kept as plain hash fields so index
+  maintenance and filtering can read them without decoding the blob.
+
+The blob is encoded with orjson when it is installed and falls back to the
+standard library json module otherwise. Either way the blob is UTF-8 text, so
+it works with the tracker's ``decode_responses=True`` client.
+
+This module also provides migration and benchmark tooling:
+
+    python -m lifearchivist.storage.metadata_encoding migrate --to compact
+    python -m lifearchivist.storage.metadata_encoding benchmark --sample-size 500
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Dict, List, cast
+
+from lifearchivist.utils.logging import log_event
+
+if TYPE_CHECKING:
+    from lifearchivist.storage.redis_document_tracker import RedisDocumentTracker
+
+try:
+    import orjson
+
+    BLOB_CODEC = "orjson"
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None
+    BLOB_CODEC = "json"
+
+METADATA_ENCODINGS = ("fields", "compact")
+
+# Hash field holding the JSON blob in the compact layout
+COMPACT_BLOB_FIELD = "_doc"
+
+# Hash field holding the write version used for compare-and-set updates
+COMPACT_VERSION_FIELD = "_v"
+
+
+def dumps_blob(metadata: Dict[str, Any]) -> str:
+    """Encode a metadata dict as a compact JSON blob."""
+    if orjson is not None:
+        return orjson.dumps(metadata, default=str).decode("utf-8")
+    return json.dumps(metadata, separators=(",", ":"), default=str)
+
+
+def loads_blob(blob: str) -> Dict[str, Any]:
+    """Decode a compact JSON blob back into a metadata dict."""
+    if orjson is not None:
+        return cast(Dict[str, Any], orjson.loads(blob))
+    return cast(Dict[str, Any], json.loads(blob))
+
+
+async def benchmark_metadata_encodings(
+    tracker: "RedisDocumentTracker", sample_size: int = 200, decode_rounds: int = 5
+) -> Dict[str, Any]:
+    """
+    Compare Redis memory use and decode time of both metadata encodings.
+
+    Copies the metadata of up to ``sample_size`` tracked documents into
+    scratch keys in each layout, measures ``MEMORY USAGE`` per key and the CPU
+    time needed to decode the fetched hashes, then deletes the scratch keys.
+    Stored documents are not modified.
+
+    Args:
+        tracker: Initialized document tracker to sample documents from
+        sample_size: Maximum number of documents to sample
+        decode_rounds: Times each fetched hash is decoded when timing
+
+    Returns:
+        Per-encoding totals and per-document averages
+    """
+    client = tracker._client()
+    document_ids = (await tracker.get_all_document_ids())[:sample_size]
+
+    samples: List[Dict[str, Any]] = []
+    for document_id in document_ids:
+        metadata = await tracker.get_full_metadata(document_id)
+        if metadata:
+            samples.append(metadata)
+
+    results: Dict[str, Any] = {
+        "documents_sampled": len(samples),
+        "blob_codec": BLOB_CODEC,
+    }
+    if not samples:
+        return results
+
+    scratch_prefix = f"{tracker.key_prefix}:bench:meta"
+
+    for encoding in METADATA_ENCODINGS:
+        keys = [f"{scratch_prefix}:{encoding}:{i}" for i in range(len(samples))]
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                for key, metadata in zip(keys, samples, strict=True):
+                    if encoding == "compact":
+                        mapping = tracker._encode_compact(metadata)
+                    else:
+                        mapping = tracker._encode_fields(metadata)
+                    pipe.hset(key, mapping=mapping)
+                await pipe.execute()
+
+            async with client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.memory_usage(key)
+                memory = await pipe.execute()
+
+            async with client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.hgetall(key)
+                raw_hashes = await pipe.execute()
+
+            start = time.perf_counter()
+            for _ in range(decode_rounds):
+                for raw in raw_hashes:
+                    tracker._decode_raw_metadata(raw)
+            decode_seconds = (time.perf_counter() - start) / decode_rounds
+        finally:
+            await cast(Awaitable[int], client.delete(*keys))
+
+        total_bytes = sum(int(m or 0) for m in memory)
+        results[encoding] = {
+            "total_bytes": total_bytes,
+            "avg_bytes_per_document": round(total_bytes / len(samples), 1),
+            "decode_ms_total": round(decode_seconds * 1000, 3),
+            "decode_us_per_document": round(decode_seconds * 1e6 / len(samples), 2),
+        }
+
+    fields_stats, compact_stats = results["fields"], results["compact"]
+    results["memory_reduction_percent"] = (
+        round((1 - compact_stats["total_bytes"] / fields_stats["total_bytes"]) * 100, 1)
+        if fields_stats["total_bytes"]
+        else 0
+    )
+    results["decode_speedup"] = (
+        round(fields_stats["decode_ms_total"] / compact_stats["decode_ms_total"], 2)
+        if compact_stats["decode_ms_total"]
+        else None
+    )
+
+    log_event("metadata_encoding_benchmark_completed", results)
+
+    return results
+
+
+async def _run_cli(args: argparse.Namespace) -> Dict[str, Any]:
+    """Run a CLI subcommand against the configured Redis instance."""
+    from lifearchivist.config import get_settings
+    from lifearchivist.storage.redis_document_tracker import RedisDocumentTracker
+
+    tracker = RedisDocumentTracker(redis_url=get_settings().redis_url)
+    await tracker.initialize()
+    try:
+        if args.command == "migrate":
+            return await tracker.migrate_metadata_encoding(
+                args.to, batch_size=args.batch_size
+            )
+        return await benchmark_metadata_encodings(tracker, sample_size=args.sample_size)
+    finally:
+        await tracker.close()
+
+
+def main() -> None:
+    """Command line entry point for metadata migration and benchmarking."""
+    parser = argparse.ArgumentParser(
+        description="Migrate or benchmark document metadata encodings in Redis."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    migrate = subparsers.add_parser(
+        "migrate", help="Rewrite stored metadata in the target encoding"
+    )
+    migrate.add_argument("--to", choices=METADATA_ENCODINGS, required=True)
+    migrate.add_argument("--batch-size", type=int, default=500)
+
+    benchmark = subparsers.add_parser(
+        "benchmark", help="Compare memory use and decode time of both encodings"
+    )
+    benchmark.add_argument("--sample-size", type=int, default=200)
+
+    args = parser.parse_args()
+
+    try:
+        result = asyncio.run(_run_cli(args))
+    except Exception as e:
+        log_event(
+            "metadata_encoding_cli_failed",
+            {"command": args.command, "error": str(e)},
+            level=logging.ERROR,
+        )
+        raise
+
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
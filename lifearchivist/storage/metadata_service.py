@@ -426,24 +426,77 @@ class LlamaIndexMetadataService(MetadataService):
 
     async def _get_matching_document_ids(self, filters: Dict[str, Any]) -> List[str]:
         """
-        Get document IDs matching filters using Redis indexed queries.
+        Get document IDs matching filters using a simple index-first query plan.
 
-        Uses O(k) indexed queries where k = number of matching documents.
+        Filters on indexed fields are resolved with Redis set intersections.
+        The remaining filters are evaluated only against those candidates, by
+        fetching just the filtered fields in pipelined batches.
         """
-        # Use Redis indexed queries
-        if hasattr(self.doc_tracker, "query_by_multiple_filters"):
-            doc_ids: List[str] = await self.doc_tracker.query_by_multiple_filters(
-                filters
+        indexed_fields = getattr(self.doc_tracker, "INDEXED_FIELDS", ())
+        index_filters, scan_filters = MetadataFilterUtils.split_filters(
+            filters, indexed_fields
+        )
+
+        if index_filters and hasattr(self.doc_tracker, "query_by_multiple_filters"):
+            candidate_ids: List[str] = await self.doc_tracker.query_by_multiple_filters(
+                index_filters
             )
-            return doc_ids
+        else:
+            # Nothing indexed to narrow by, so every document is a candidate
+            scan_filters = {**index_filters, **scan_filters}
+            index_filters = {}
+            candidate_ids = await self.doc_tracker.get_all_document_ids()
 
-        # Fallback: iterate through all documents (shouldn't happen with Redis)
-        matching_ids: List[str] = []
-        all_doc_ids: List[str] = await self.doc_tracker.get_all_document_ids()
+        if scan_filters and candidate_ids:
+            matching_ids = await self._scan_candidates(candidate_ids, scan_filters)
+        else:
+            matching_ids = candidate_ids
+
+        log_event(
+            "metadata_query_plan",
+            {
+                "indexed_filters": list(index_filters.keys()),
+                "scanned_filters": list(scan_filters.keys()),
+                "index_candidates": len(candidate_ids),
+                "documents_matched": len(matching_ids),
+            },
+            level=logging.DEBUG,
+        )
+
+        return matching_ids
+
+    async def _scan_candidates(
+        self, candidate_ids: List[str], scan_filters: Dict[str, Any]
+    ) -> List[str]:
+        """
+        Evaluate non-indexed filters against candidate documents.
+
+        Args:
+            candidate_ids: Documents that already satisfy the indexed filters
+            scan_filters: Filters that must be checked against stored values
+
+        Returns:
+            Candidate IDs whose metadata matches all scan filters, in order
+        """
+        if hasattr(self.doc_tracker, "get_metadata_fields_batch"):
+            fields_by_doc: Dict[str, Dict[str, Any]] = (
+                await self.doc_tracker.get_metadata_fields_batch(
+                    candidate_ids, list(scan_filters.keys())
+                )
+            )
+            return [
+                document_id
+                for document_id in candidate_ids
+                if MetadataFilterUtils.matches_filters(
+                    fields_by_doc.get(document_id, {}), scan_filters
+                )
+            ]
 
-        for document_id in all_doc_ids:
+        # Trackers without batch reads fall back to one lookup per document
+        matching_ids: List[str] = []
+        for document_id in candidate_ids:
             metadata = await self.doc_tracker.get_full_metadata(document_id)
-            if metadata and MetadataFilterUtils.matches_filters(metadata, filters):
+            if metadata and MetadataFilterUtils.matches_filters(metadata, scan_filters):
                 matching_ids.append(document_id)
 
         return matching_ids
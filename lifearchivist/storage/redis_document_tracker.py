@@ -2,19 +2,34 @@
 Redis-based document tracker for production-grade scalability.
 
 This implementation provides:
-- Atomic operations with Redis transactions
+- Atomic operations with server-side Lua scripts
 - Automatic indexing for fast queries
 - Sub-millisecond performance at any scale
 - Concurrent-safe operations
 - Efficient memory usage with Redis data structures
 """
 
+import asyncio
 import json
 import logging
 from typing import Any, Awaitable, Dict, List, Optional, Set, Tuple, cast
 
 import redis.asyncio as redis
-
+from redis.commands.core import AsyncScript
+
+from lifearchivist.storage.metadata_encoding import (
+    COMPACT_BLOB_FIELD,
+    COMPACT_VERSION_FIELD,
+    METADATA_ENCODINGS,
+    dumps_blob,
+    loads_blob,
+)
+from lifearchivist.storage.redis_tracker_scripts import (
+    ADD_DOCUMENT_SCRIPT,
+    COMPACT_WRITE_SCRIPT,
+    REMOVE_DOCUMENT_SCRIPT,
+    UPDATE_METADATA_SCRIPT,
+)
 from lifearchivist.utils.logging import log_event, track
 
 
@@ -30,7 +45,10 @@ class RedisDocumentTracker:
 
     2. Full Metadata (Redis Hash):
        Key: "lifearchivist:doc:meta:{document_id}"
-       Value: Hash of all metadata fields (nested JSON as strings)
+       Value (fields encoding): Hash of all metadata fields (nested JSON as
+       strings)
+       Value (compact encoding): {"_doc": JSON blob of all metadata,
+       "_v": write version, plus the indexed fields as plain strings}
 
     3. Document Index (Redis Set):
        Key: "lifearchivist:doc:index:all"
@@ -40,7 +58,9 @@ class RedisDocumentTracker:
        Key: "lifearchivist:doc:index:theme:{theme}"
        Key: "lifearchivist:doc:index:mime:{mime_type}"
        Key: "lifearchivist:doc:index:status:{status}"
-       Value: Set of document_ids matching the filter
+       Key: "lifearchivist:doc:index:file_hash:{sha256}"
+       Value: Set of document_ids matching the filter (the file_hash index
+       doubles as the hash -> document_id lookup for duplicate detection)
 
     5. Document Count (Redis String):
        Key: "lifearchivist:doc:count"
@@ -50,20 +70,51 @@ class RedisDocumentTracker:
     ---------------------------
     - Add document: O(1) - constant time regardless of total documents
     - Get nodes: O(1) - direct key lookup
-    - Delete document: O(1) - atomic transaction
+    - Delete document: O(1) - single Lua script round-trip
     - Count: O(1) - cached counter
     - Query by metadata: O(k) where k = matching documents (not total)
-    - Concurrent writes: Safe with Redis atomicity guarantees
+    - Concurrent writes: Safe - every mutation (data plus index maintenance)
+      runs as one atomic Lua script, so concurrent workers cannot interleave
     """
 
-    def __init__(self, redis_url: str = "redis://localhost:6379"):
+    # Metadata fields maintained as Redis set indexes (see section 4 above)
+    INDEXED_FIELDS: Tuple[str, ...] = ("theme", "mime_type", "status", "file_hash")
+
+    # Checkpoint recording which fields existing documents are indexed by
+    INDEXED_FIELDS_CHECKPOINT = "indexed_fields"
+
+    # Number of HMGET commands sent per pipeline round-trip in batch reads
+    METADATA_BATCH_SIZE = 500
+
+    # How list-valued fields are merged in "update" mode; other fields are set
+    LIST_MERGE_STRATEGIES: Dict[str, str] = {
+        "tags": "union",
+        "content_dates": "append",
+        "provenance": "append",
+    }
+
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379",
+        metadata_encoding: str = "fields",
+    ):
         """
         Initialize Redis document tracker.
 
         Args:
             redis_url: Redis connection URL
+            metadata_encoding: "fields" (one JSON value per hash field) or
+                "compact" (single blob plus indexed fields) for new writes.
+                Reads always accept both layouts.
         """
+        if metadata_encoding not in METADATA_ENCODINGS:
+            raise ValueError(
+                f"Unknown metadata encoding '{metadata_encoding}', "
+                f"expected one of {METADATA_ENCODINGS}"
+            )
+
         self.redis_url = redis_url
+        self.metadata_encoding = metadata_encoding
         self.redis_client: Optional[redis.Redis] = None
 
         # Key namespace following project conventions
@@ -72,6 +123,12 @@ class RedisDocumentTracker:
         # Connection state
         self._initialized = False
 
+        # Lua scripts registered against the client (invoked via EVALSHA)
+        self._add_document_script: Optional[AsyncScript] = None
+        self._remove_document_script: Optional[AsyncScript] = None
+        self._update_metadata_script: Optional[AsyncScript] = None
+        self._compact_write_script: Optional[AsyncScript] = None
+
         # Retry configuration
         self.max_retries = 3
         self.retry_delay = 0.1  # seconds
@@ -88,7 +145,7 @@ class RedisDocumentTracker:
         This method:
         1. Creates async Redis client with connection pooling
         2. Tests connection with PING
-        3. Sets up any required initial state
+        3. Registers and preloads the mutation Lua scripts
         4. Logs initialization metrics
 
         Raises:
@@ -107,8 +164,12 @@ class RedisDocumentTracker:
 
             await self.redis_client.ping()
 
+            await self._register_scripts()
+
             self._initialized = True
 
+            await self.ensure_field_indexes()
+
             doc_count = await self.get_document_count()
 
             log_event(
@@ -116,6 +177,7 @@ class RedisDocumentTracker:
                 {
                     "redis_url": self.redis_url,
                     "document_count": doc_count,
+                    "metadata_encoding": self.metadata_encoding,
                 },
             )
 
@@ -130,6 +192,33 @@ class RedisDocumentTracker:
             )
             raise ConnectionError(f"Failed to connect to Redis: {str(e)}") from e
 
+    async def _register_scripts(self) -> None:
+        """
+        Register mutation scripts and load them into the Redis script cache.
+
+        Registered scripts are called with EVALSHA and transparently reloaded
+        if the server's script cache was flushed.
+        """
+        client = self._client()
+        self._add_document_script = client.register_script(ADD_DOCUMENT_SCRIPT)
+        self._remove_document_script = client.register_script(REMOVE_DOCUMENT_SCRIPT)
+        self._update_metadata_script = client.register_script(UPDATE_METADATA_SCRIPT)
+        self._compact_write_script = client.register_script(COMPACT_WRITE_SCRIPT)
+
+        for script in (
+            self._add_document_script,
+            self._remove_document_script,
+            self._update_metadata_script,
+            self._compact_write_script,
+        ):
+            script.sha = await client.script_load(script.script)
+
+    def _script(self, script: Optional[AsyncScript]) -> AsyncScript:
+        """Return a registered script or raise if not initialized."""
+        if script is None:
+            raise RuntimeError("RedisDocumentTracker not initialized")
+        return script
+
     def _client(self) -> "redis.Redis":
         """Return a non-optional Redis client or raise if not initialized."""
         if self.redis_client is None:
@@ -164,10 +253,10 @@ class RedisDocumentTracker:
         """
         Add a document and its nodes to the tracker atomically.
 
-        This method uses Redis MULTI/EXEC transaction to ensure:
+        A single Lua script ensures:
         1. Node IDs are stored
         2. Document is added to all index
-        3. Count is incremented
+        3. Count is incremented only if the document was not already tracked
         All operations succeed or all fail together.
 
         Args:
@@ -188,12 +277,11 @@ class RedisDocumentTracker:
         all_index_key = f"{self.key_prefix}:index:all"
         count_key = f"{self.key_prefix}:count"
 
-        client = self._client()
-        async with client.pipeline(transaction=True) as pipe:
-            pipe.rpush(nodes_key, *node_ids)
-            pipe.sadd(all_index_key, document_id)
-            pipe.incr(count_key)
-            await pipe.execute()
+        script = self._script(self._add_document_script)
+        await script(
+            keys=[nodes_key, all_index_key, count_key],
+            args=[document_id, *node_ids],
+        )
 
     @track(
         operation="redis_get_node_ids",
@@ -221,6 +309,42 @@ class RedisDocumentTracker:
 
         return list(node_ids) if node_ids else None
 
+    async def get_node_ids_batch(
+        self, document_ids: List[str], batch_size: Optional[int] = None
+    ) -> Dict[str, List[str]]:
+        """
+        Get node IDs for many documents in pipelined batches.
+
+        Args:
+            document_ids: Documents to look up
+            batch_size: LRANGE commands per pipeline (defaults to
+                METADATA_BATCH_SIZE)
+
+        Returns:
+            Mapping of document_id to its node IDs in insertion order;
+            documents without nodes are omitted
+        """
+        if not self._initialized:
+            raise RuntimeError("RedisDocumentTracker not initialized")
+
+        batch_size = batch_size or self.METADATA_BATCH_SIZE
+        results: Dict[str, List[str]] = {}
+
+        client = self._client()
+        for start in range(0, len(document_ids), batch_size):
+            batch = document_ids[start : start + batch_size]
+
+            async with client.pipeline(transaction=False) as pipe:
+                for document_id in batch:
+                    pipe.lrange(f"{self.key_prefix}:nodes:{document_id}", 0, -1)
+                rows = await pipe.execute()
+
+            for document_id, node_ids in zip(batch, rows, strict=True):
+                if node_ids:
+                    results[document_id] = list(node_ids)
+
+        return results
+
     @track(
         operation="redis_remove_document",
         include_args=["document_id"],
@@ -231,12 +355,11 @@ class RedisDocumentTracker:
         """
         Remove a document and all its data atomically.
 
-        This method uses Redis transaction to:
-        1. Get metadata for index cleanup
-        2. Delete nodes list
-        3. Delete metadata hash
-        4. Remove from all indexes
-        5. Decrement count
+        A single Lua script, run atomically on the server:
+        1. Checks and removes membership in the all-documents index
+        2. Removes the document from its metadata indexes
+        3. Deletes the nodes list and metadata hash
+        4. Decrements count
 
         Args:
             document_id: Document to remove
@@ -247,28 +370,18 @@ class RedisDocumentTracker:
         if not self._initialized:
             raise RuntimeError("RedisDocumentTracker not initialized")
 
-        if not await self.document_exists(document_id):
-            return False
-
-        metadata = await self.get_full_metadata(document_id)
-
         nodes_key = f"{self.key_prefix}:nodes:{document_id}"
         metadata_key = f"{self.key_prefix}:meta:{document_id}"
         all_index_key = f"{self.key_prefix}:index:all"
         count_key = f"{self.key_prefix}:count"
 
-        client = self._client()
-        async with client.pipeline(transaction=True) as pipe:
-            pipe.delete(nodes_key)
-            pipe.delete(metadata_key)
-            pipe.srem(all_index_key, document_id)
-            pipe.decr(count_key)
-            await pipe.execute()
-
-        if metadata:
-            await self._remove_from_indexes(document_id, metadata)
+        script = self._script(self._remove_document_script)
+        removed = await script(
+            keys=[nodes_key, metadata_key, all_index_key, count_key],
+            args=[document_id, self._index_key_prefix(), *self.INDEXED_FIELDS],
+        )
 
-        return True
+        return bool(removed)
 
     @track(
         operation="redis_document_exists",
@@ -348,6 +461,36 @@ class RedisDocumentTracker:
 
         return sorted(list(members)) if members else []
 
+    async def scan_document_ids(
+        self, cursor: str = "0", count: int = 500
+    ) -> Tuple[str, List[str]]:
+        """
+        Read one page of document IDs with SSCAN.
+
+        Unlike get_all_document_ids this never loads the whole index, and the
+        returned cursor can be stored to resume a pass later. A full pass
+        returns every document present for its whole duration at least once.
+
+        Args:
+            cursor: Cursor from the previous page ("0" to start)
+            count: Approximate number of IDs per page
+
+        Returns:
+            Tuple of (next cursor, document IDs); the cursor is "0" once the
+            pass is complete
+        """
+        if not self._initialized:
+            raise RuntimeError("RedisDocumentTracker not initialized")
+
+        client = self._client()
+        next_cursor, members = await cast(
+            Awaitable[Tuple[int, List[str]]],
+            client.sscan(
+                f"{self.key_prefix}:index:all", cursor=int(cursor), count=count
+            ),
+        )
+        return str(next_cursor), list(members)
+
     @track(
         operation="redis_store_full_metadata",
         include_args=["document_id"],
@@ -364,7 +507,7 @@ class RedisDocumentTracker:
         1. Serializes nested structures to JSON strings
         2. Stores as Redis hash for efficient field access
         3. Updates metadata indexes (theme, mime_type, status)
-        4. Uses transaction for atomicity
+        4. Runs as a single Lua script for atomicity
 
         Args:
             document_id: Document this metadata belongs to
@@ -373,22 +516,10 @@ class RedisDocumentTracker:
         if not self._initialized:
             raise RuntimeError("RedisDocumentTracker not initialized")
 
-        metadata_key = f"{self.key_prefix}:meta:{document_id}"
+        if not metadata:
+            return
 
-        serialized = {k: self._serialize_metadata_value(v) for k, v in metadata.items()}
-
-        client = self._client()
-        if serialized:
-            await cast(Awaitable[int], client.hset(metadata_key, mapping=serialized))
-
-        indexable = self._extract_indexable_fields(metadata)
-        if indexable:
-            async with client.pipeline(transaction=False) as pipe:
-                for field, value in indexable.items():
-                    if value:
-                        index_key = f"{self.key_prefix}:index:{field}:{value}"
-                        pipe.sadd(index_key, document_id)
-                await pipe.execute()
+        await self._write_metadata(document_id, metadata, mode="store")
 
     @track(
         operation="redis_get_full_metadata",
@@ -424,11 +555,7 @@ class RedisDocumentTracker:
         if not raw_metadata:
             return None
 
-        deserialized = {
-            k: self._deserialize_metadata_value(v) for k, v in raw_metadata.items()
-        }
-
-        return deserialized
+        return self._decode_raw_metadata(raw_metadata)
 
     @track(
         operation="redis_update_full_metadata",
@@ -448,8 +575,8 @@ class RedisDocumentTracker:
         This method:
         1. Handles both "update" (merge) and "replace" modes
         2. Updates metadata indexes if indexed fields change
-        3. Uses transaction for atomicity
-        4. Handles list field merging (tags, provenance, etc.)
+        3. Runs as a single Lua script, so concurrent updates cannot interleave
+        4. Handles list field merging (tags, provenance, etc.) server-side
 
         Args:
             document_id: Document to update
@@ -462,63 +589,212 @@ class RedisDocumentTracker:
         if not self._initialized:
             raise RuntimeError("RedisDocumentTracker not initialized")
 
+        mode = "replace" if merge_mode == "replace" else "update"
+        return await self._write_metadata(document_id, metadata_updates, mode)
+
+    async def _write_metadata(
+        self, document_id: str, metadata: Dict[str, Any], mode: str
+    ) -> bool:
+        """Write metadata using the configured encoding."""
+        if self.metadata_encoding == "compact":
+            return await self._write_compact(document_id, metadata, mode)
+
+        result = await self._run_update_script(document_id, metadata, mode)
+        if result == -1:
+            # Hash was written in the compact layout; keep it in that layout
+            return await self._write_compact(document_id, metadata, mode)
+        return bool(result)
+
+    async def _run_update_script(
+        self, document_id: str, metadata: Dict[str, Any], mode: str
+    ) -> int:
+        """
+        Write metadata fields and maintain indexes in one atomic script call.
+
+        Args:
+            document_id: Document whose metadata hash is written
+            metadata: Fields to write (unserialized)
+            mode: "store", "update" or "replace" (see UPDATE_METADATA_SCRIPT)
+
+        Returns:
+            0 if mode requires an existing hash and none was found, -1 if the
+            hash is in the compact layout and was left untouched, otherwise 1
+        """
         metadata_key = f"{self.key_prefix}:meta:{document_id}"
+        args = self._update_script_args(document_id, metadata, mode)
+
+        script = self._script(self._update_metadata_script)
+        result = await script(keys=[metadata_key], args=args)
+
+        return int(result)
+
+    def _update_script_args(
+        self, document_id: str, metadata: Dict[str, Any], mode: str
+    ) -> List[Any]:
+        """Build UPDATE_METADATA_SCRIPT arguments for a metadata write."""
+        args: List[Any] = [
+            document_id,
+            self._index_key_prefix(),
+            mode,
+            len(self.INDEXED_FIELDS),
+            *self.INDEXED_FIELDS,
+        ]
+        for field, value in metadata.items():
+            strategy = "set"
+            if isinstance(value, list):
+                strategy = self.LIST_MERGE_STRATEGIES.get(field, "set")
+            args.extend((field, strategy, self._serialize_metadata_value(value)))
+        return args
 
-        client = self._client()
-        exists = await cast(Awaitable[int], client.exists(metadata_key))
-        if not exists:
-            return False
-
-        if merge_mode == "replace":
-            old_metadata = await self.get_full_metadata(document_id)
-
-            serialized = {
-                k: self._serialize_metadata_value(v)
-                for k, v in metadata_updates.items()
-            }
-
-            await cast(Awaitable[int], client.delete(metadata_key))
-            if serialized:
-                await cast(
-                    Awaitable[int], client.hset(metadata_key, mapping=serialized)
+    @track(
+        operation="redis_update_full_metadata_batch",
+        track_performance=True,
+        frequency="low_frequency",
+    )
+    async def update_full_metadata_batch(
+        self,
+        updates: Dict[str, Dict[str, Any]],
+        merge_mode: str = "update",
+        batch_size: Optional[int] = None,
+    ) -> Dict[str, bool]:
+        """
+        Update metadata for many documents in pipelined batches.
+
+        Each document is written by the same script as update_full_metadata,
+        but up to ``batch_size`` script calls share one pipeline round-trip.
+        Documents in the compact layout (or all documents, when the tracker
+        writes compact metadata) fall back to individual compare-and-set
+        writes.
+
+        Args:
+            updates: Mapping of document_id to the metadata fields to write
+            merge_mode: "update" to merge, "replace" to overwrite
+            batch_size: Script calls per pipeline (defaults to
+                METADATA_BATCH_SIZE)
+
+        Returns:
+            Mapping of document_id to whether its metadata was updated
+        """
+        if not self._initialized:
+            raise RuntimeError("RedisDocumentTracker not initialized")
+
+        mode = "replace" if merge_mode == "replace" else "update"
+        results: Dict[str, bool] = {}
+
+        if self.metadata_encoding == "compact":
+            for document_id, metadata in updates.items():
+                results[document_id] = await self._write_compact(
+                    document_id, metadata, mode
                 )
+            return results
 
-            await self._update_metadata_indexes(
-                document_id, old_metadata, metadata_updates
-            )
-        else:
-            old_metadata = await self.get_full_metadata(document_id)
-
-            merged = old_metadata.copy() if old_metadata else {}
-
-            for key, value in metadata_updates.items():
-                if key in ["content_dates", "tags", "provenance"] and isinstance(
-                    value, list
-                ):
-                    existing = merged.get(key, [])
-                    if isinstance(existing, list):
-                        if key == "tags":
-                            merged[key] = list(set(existing + value))
-                        else:
-                            merged[key] = existing + value
-                    else:
-                        merged[key] = value
+        batch_size = batch_size or self.METADATA_BATCH_SIZE
+        script = self._script(self._update_metadata_script)
+        document_ids = list(updates)
+
+        client = self._client()
+        for start in range(0, len(document_ids), batch_size):
+            batch = document_ids[start : start + batch_size]
+
+            async with client.pipeline(transaction=False) as pipe:
+                for document_id in batch:
+                    await script(
+                        keys=[f"{self.key_prefix}:meta:{document_id}"],
+                        args=self._update_script_args(
+                            document_id, updates[document_id], mode
+                        ),
+                        client=pipe,
+                    )
+                rows = await pipe.execute()
+
+            for document_id, result in zip(batch, rows, strict=True):
+                if int(result) == -1:
+                    results[document_id] = await self._write_compact(
+                        document_id, updates[document_id], mode
+                    )
                 else:
-                    merged[key] = value
+                    results[document_id] = bool(result)
 
-            serialized = {
-                k: self._serialize_metadata_value(merged[k])
-                for k in metadata_updates.keys()
-            }
+        return results
 
-            if serialized:
-                await cast(
-                    Awaitable[int], client.hset(metadata_key, mapping=serialized)
-                )
+    async def _write_compact(
+        self, document_id: str, metadata: Dict[str, Any], mode: str
+    ) -> bool:
+        """
+        Write metadata in the compact layout with compare-and-set retries.
+
+        The current metadata is read and merged in Python, then written by a
+        script that only applies if the hash's write version is unchanged.
 
-            await self._update_metadata_indexes(document_id, old_metadata, merged)
+        Args:
+            document_id: Document whose metadata hash is written
+            metadata: Fields to write (unserialized)
+            mode: "store", "update" or "replace"
+
+        Returns:
+            False if mode requires an existing hash and none was found
+
+        Raises:
+            RuntimeError: If concurrent writers win every retry
+        """
+        metadata_key = f"{self.key_prefix}:meta:{document_id}"
+        client = self._client()
+        script = self._script(self._compact_write_script)
+
+        for attempt in range(self.max_retries):
+            raw = await cast(Awaitable[Dict[str, str]], client.hgetall(metadata_key))
+            if not raw and mode != "store":
+                return False
+
+            current = self._decode_raw_metadata(raw) if raw else {}
+            if mode == "replace":
+                merged = dict(metadata)
+            elif mode == "update":
+                merged = self._merge_metadata(current, metadata)
+            else:
+                merged = {**current, **metadata}
+
+            indexable = self._extract_indexable_fields(merged)
+            args: List[Any] = [
+                document_id,
+                self._index_key_prefix(),
+                raw.get(COMPACT_VERSION_FIELD, "0"),
+                "0" if mode == "store" else "1",
+                dumps_blob(merged),
+                len(self.INDEXED_FIELDS),
+            ]
+            for field in self.INDEXED_FIELDS:
+                args.extend((field, indexable.get(field, "")))
+
+            result = await script(keys=[metadata_key], args=args)
+            if result != -1:
+                return bool(result)
+
+            await asyncio.sleep(self.retry_delay * (attempt + 1))
+
+        raise RuntimeError(
+            f"Metadata for document '{document_id}' changed concurrently "
+            f"during {self.max_retries} write attempts"
+        )
 
-        return True
+    def _merge_metadata(
+        self, current: Dict[str, Any], updates: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Merge updates into metadata using LIST_MERGE_STRATEGIES."""
+        merged = dict(current)
+        for key, value in updates.items():
+            strategy = self.LIST_MERGE_STRATEGIES.get(key)
+            existing = merged.get(key)
+            if strategy and isinstance(value, list) and isinstance(existing, list):
+                if strategy == "union":
+                    combined = list(existing)
+                    combined.extend(item for item in value if item not in existing)
+                    merged[key] = combined
+                else:
+                    merged[key] = existing + value
+            else:
+                merged[key] = value
+        return merged
 
     async def query_by_multiple_filters(self, filters: Dict[str, Any]) -> List[str]:
         """
@@ -544,7 +820,7 @@ class RedisDocumentTracker:
 
         index_keys = []
         for field, value in filters.items():
-            if field in ("theme", "mime_type", "status"):
+            if field in self.INDEXED_FIELDS:
                 index_key = f"{self.key_prefix}:index:{field}:{value}"
                 index_keys.append(index_key)
 
@@ -563,6 +839,304 @@ class RedisDocumentTracker:
         result_list: List[str] = sorted(list(result)) if result else []
         return result_list
 
+    async def find_document_by_hash(self, file_hash: str) -> Optional[str]:
+        """
+        Look up a document with the given content hash.
+
+        A single read of the file_hash index, so duplicate detection costs
+        the same regardless of archive size.
+
+        Args:
+            file_hash: SHA-256 of the file content
+
+        Returns:
+            ID of a document with that hash, or None
+        """
+        if not self._initialized:
+            raise RuntimeError("RedisDocumentTracker not initialized")
+
+        client = self._client()
+        document_id = await cast(
+            Awaitable[Optional[str]],
+            client.srandmember(f"{self._index_key_prefix()}file_hash:{file_hash}"),
+        )
+        return document_id
+
+    @track(
+        operation="redis_get_metadata_fields_batch",
+        track_performance=True,
+        frequency="medium_frequency",
+    )
+    async def get_metadata_fields_batch(
+        self,
+        document_ids: List[str],
+        fields: List[str],
+        batch_size: Optional[int] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch selected metadata fields for many documents in pipelined batches.
+
+        Issues one HMGET per document for only the requested fields, sending
+        up to ``batch_size`` commands per pipeline round-trip instead of one
+        HGETALL round-trip per document. Documents stored in the compact
+        layout are answered from their metadata blob.
+
+        Args:
+            document_ids: Documents to fetch fields for
+            fields: Metadata field names to fetch
+            batch_size: HMGET commands per pipeline (defaults to
+                METADATA_BATCH_SIZE)
+
+        Returns:
+            Mapping of document_id to the deserialized fields that are present.
+            Fields missing from a document's hash are omitted from its dict.
+        """
+        if not self._initialized:
+            raise RuntimeError("RedisDocumentTracker not initialized")
+
+        if not document_ids or not fields:
+            return {}
+
+        batch_size = batch_size or self.METADATA_BATCH_SIZE
+        results: Dict[str, Dict[str, Any]] = {}
+        requested = [*fields, COMPACT_BLOB_FIELD]
+
+        client = self._client()
+        for start in range(0, len(document_ids), batch_size):
+            batch = document_ids[start : start + batch_size]
+
+            async with client.pipeline(transaction=False) as pipe:
+                for document_id in batch:
+                    pipe.hmget(f"{self.key_prefix}:meta:{document_id}", requested)
+                rows = await pipe.execute()
+
+            for document_id, values in zip(batch, rows, strict=True):
+                blob = values[-1]
+                if blob is not None:
+                    metadata = loads_blob(blob)
+                    results[document_id] = {
+                        field: metadata[field] for field in fields if field in metadata
+                    }
+                    continue
+
+                results[document_id] = {
+                    field: self._deserialize_metadata_value(value)
+                    for field, value in zip(fields, values, strict=False)
+                    if value is not None
+                }
+
+        return results
+
+    @track(
+        operation="redis_migrate_metadata_encoding",
+        include_args=["target_encoding"],
+        include_result=True,
+        track_performance=True,
+        frequency="low_frequency",
+    )
+    async def migrate_metadata_encoding(
+        self, target_encoding: str, batch_size: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Rewrite stored metadata hashes into the target encoding.
+
+        Hashes are read in pipelined batches and only those not already in the
+        target layout are rewritten, so the migration can be re-run safely and
+        resumed after interruption. Index membership is preserved.
+
+        Args:
+            target_encoding: "fields" or "compact"
+            batch_size: Documents read per pipeline round-trip
+
+        Returns:
+            Counts of scanned, migrated, already-migrated and failed documents
+        """
+        if not self._initialized:
+            raise RuntimeError("RedisDocumentTracker not initialized")
+
+        if target_encoding not in METADATA_ENCODINGS:
+            raise ValueError(
+                f"Unknown metadata encoding '{target_encoding}', "
+                f"expected one of {METADATA_ENCODINGS}"
+            )
+
+        batch_size = batch_size or self.METADATA_BATCH_SIZE
+        stats = {"scanned": 0, "migrated": 0, "already_migrated": 0, "failed": 0}
+
+        client = self._client()
+        document_ids = await self.get_all_document_ids()
+
+        for start in range(0, len(document_ids), batch_size):
+            batch = document_ids[start : start + batch_size]
+
+            async with client.pipeline(transaction=False) as pipe:
+                for document_id in batch:
+                    pipe.hgetall(f"{self.key_prefix}:meta:{document_id}")
+                raw_hashes = await pipe.execute()
+
+            for document_id, raw in zip(batch, raw_hashes, strict=True):
+                stats["scanned"] += 1
+                if not raw:
+                    continue
+
+                is_compact = COMPACT_BLOB_FIELD in raw
+                if is_compact == (target_encoding == "compact"):
+                    stats["already_migrated"] += 1
+                    continue
+
+                try:
+                    metadata = self._decode_raw_metadata(raw)
+                    if target_encoding == "compact":
+                        migrated = await self._write_compact(
+                            document_id, metadata, mode="replace"
+                        )
+                    else:
+                        migrated = bool(
+                            await self._run_update_script(
+                                document_id, metadata, mode="replace"
+                            )
+                        )
+                    stats["migrated" if migrated else "failed"] += 1
+                except Exception as e:
+                    stats["failed"] += 1
+                    log_event(
+                        "metadata_encoding_migration_failed",
+                        {"document_id": document_id, "error": str(e)},
+                        level=logging.WARNING,
+                    )
+
+        log_event(
+            "metadata_encoding_migrated",
+            {"target_encoding": target_encoding, **stats},
+        )
+
+        return {"target_encoding": target_encoding, **stats}
+
+    async def ensure_field_indexes(self, batch_size: Optional[int] = None) -> int:
+        """
+        Index existing documents by any INDEXED_FIELDS added since they were
+        written.
+
+        Writes maintain every index, but documents stored before a field was
+        added to INDEXED_FIELDS are missing from its index. This backfills
+        all indexes in pipelined batches (adding to a set is idempotent) and
+        records the indexed fields in a checkpoint, so it only runs again
+        when the field list changes.
+
+        Args:
+            batch_size: Documents per pipeline round-trip
+
+        Returns:
+            Number of documents scanned (0 if indexes were already current)
+        """
+        indexed = ",".join(self.INDEXED_FIELDS)
+        if await self.get_checkpoint(self.INDEXED_FIELDS_CHECKPOINT) == indexed:
+            return 0
+
+        batch_size = batch_size or self.METADATA_BATCH_SIZE
+        requested = [*self.INDEXED_FIELDS, COMPACT_BLOB_FIELD]
+        index_prefix = self._index_key_prefix()
+        client = self._client()
+        scanned = 0
+        cursor = "0"
+
+        while True:
+            cursor, document_ids = await self.scan_document_ids(cursor, batch_size)
+
+            if document_ids:
+                async with client.pipeline(transaction=False) as pipe:
+                    for document_id in document_ids:
+                        pipe.hmget(f"{self.key_prefix}:meta:{document_id}", requested)
+                    rows = await pipe.execute()
+
+                async with client.pipeline(transaction=False) as pipe:
+                    for document_id, values in zip(document_ids, rows, strict=True):
+                        meta_key = f"{self.key_prefix}:meta:{document_id}"
+                        blob = values[-1]
+                        if blob is not None:
+                            # Compact hashes carry indexed fields as plain
+                            # fields too; add any the blob predates
+                            indexable = self._extract_indexable_fields(loads_blob(blob))
+                            if indexable:
+                                pipe.hset(meta_key, mapping=indexable)
+                        else:
+                            indexable = {
+                                field: value
+                                for field, raw in zip(
+                                    self.INDEXED_FIELDS, values, strict=False
+                                )
+                                if (value := self._raw_index_value(field, raw))
+                            }
+                        for field, value in indexable.items():
+                            pipe.sadd(f"{index_prefix}{field}:{value}", document_id)
+                    await pipe.execute()
+
+                scanned += len(document_ids)
+
+            if cursor == "0":
+                break
+
+        await self.set_checkpoint(self.INDEXED_FIELDS_CHECKPOINT, indexed)
+        log_event(
+            "redis_tracker_indexes_backfilled",
+            {"indexed_fields": indexed, "documents_scanned": scanned},
+        )
+        return scanned
+
+    def _raw_index_value(self, field: str, raw: Optional[str]) -> Optional[str]:
+        """Index value of a fields-layout hash value (mirrors the Lua helper)."""
+        if not raw:
+            return None
+        if raw.startswith("{"):
+            try:
+                decoded = json.loads(raw)
+            except json.JSONDecodeError:
+                return raw
+            if isinstance(decoded, dict):
+                value = decoded.get(field)
+                return str(value) if value not in (None, "") else None
+        return raw
+
+    async def get_checkpoint(self, name: str) -> Optional[str]:
+        """
+        Get a named progress checkpoint for a resumable maintenance pass.
+
+        Checkpoints live under the tracker's namespace, so clear_all
+        removes them together with the documents they refer to.
+
+        Args:
+            name: Checkpoint name (e.g. "vault_reconciliation")
+
+        Returns:
+            Stored checkpoint value, or None if none is recorded
+        """
+        if not self._initialized:
+            raise RuntimeError("RedisDocumentTracker not initialized")
+
+        client = self._client()
+        return await cast(
+            Awaitable[Optional[str]],
+            client.get(f"{self.key_prefix}:checkpoint:{name}"),
+        )
+
+    async def set_checkpoint(self, name: str, value: Optional[str]) -> None:
+        """
+        Record a named progress checkpoint, or clear it when value is None.
+
+        Args:
+            name: Checkpoint name
+            value: Checkpoint value to store, or None to delete it
+        """
+        if not self._initialized:
+            raise RuntimeError("RedisDocumentTracker not initialized")
+
+        client = self._client()
+        key = f"{self.key_prefix}:checkpoint:{name}"
+        if value is None:
+            await cast(Awaitable[int], client.delete(key))
+        else:
+            await cast(Awaitable[bool], client.set(key, value))
+
     @track(
         operation="redis_clear_all",
         track_performance=True,
@@ -659,98 +1233,47 @@ class RedisDocumentTracker:
         except (json.JSONDecodeError, ValueError):
             return value
 
-    async def _update_metadata_indexes(
-        self,
-        document_id: str,
-        old_metadata: Optional[Dict[str, Any]],
-        new_metadata: Dict[str, Any],
-    ) -> None:
-        """
-        Update metadata indexes when metadata changes.
-
-        This method:
-        1. Removes document from old index values
-        2. Adds document to new index values
-        3. Handles theme, mime_type, status indexes
-
-        Args:
-            document_id: Document being updated
-            old_metadata: Previous metadata (for cleanup)
-            new_metadata: New metadata (for indexing)
-        """
-        if not self._initialized:
-            raise RuntimeError("RedisDocumentTracker not initialized")
-
-        old_indexable = (
-            self._extract_indexable_fields(old_metadata) if old_metadata else {}
-        )
-        new_indexable = self._extract_indexable_fields(new_metadata)
+    def _encode_fields(self, metadata: Dict[str, Any]) -> Dict[str, str]:
+        """Encode metadata as a hash mapping in the fields layout."""
+        return {k: self._serialize_metadata_value(v) for k, v in metadata.items()}
 
-        client = self._client()
-        async with client.pipeline(transaction=False) as pipe:
-            for field, old_value in old_indexable.items():
-                new_value = new_indexable.get(field)
-                if old_value != new_value and old_value:
-                    old_key = f"{self.key_prefix}:index:{field}:{old_value}"
-                    pipe.srem(old_key, document_id)
-
-            for field, new_value in new_indexable.items():
-                old_val: Optional[str] = old_indexable.get(field)
-                if new_value != old_val and new_value:
-                    new_key = f"{self.key_prefix}:index:{field}:{new_value}"
-                    pipe.sadd(new_key, document_id)
-
-            await pipe.execute()
-
-    async def _remove_from_indexes(
-        self, document_id: str, metadata: Dict[str, Any]
-    ) -> None:
-        """
-        Remove document from all metadata indexes.
+    def _encode_compact(self, metadata: Dict[str, Any]) -> Dict[str, str]:
+        """Encode metadata as a hash mapping in the compact layout."""
+        return {
+            COMPACT_BLOB_FIELD: dumps_blob(metadata),
+            COMPACT_VERSION_FIELD: "1",
+            **self._extract_indexable_fields(metadata),
+        }
 
-        Args:
-            document_id: Document to remove
-            metadata: Metadata containing index values
-        """
-        if not self._initialized:
-            raise RuntimeError("RedisDocumentTracker not initialized")
+    def _decode_raw_metadata(self, raw_metadata: Dict[str, str]) -> Dict[str, Any]:
+        """Decode a metadata hash stored in either layout."""
+        blob = raw_metadata.get(COMPACT_BLOB_FIELD)
+        if blob is not None:
+            return loads_blob(blob)
 
-        indexable = self._extract_indexable_fields(metadata)
+        return {k: self._deserialize_metadata_value(v) for k, v in raw_metadata.items()}
 
-        client = self._client()
-        async with client.pipeline(transaction=False) as pipe:
-            for field, value in indexable.items():
-                if value:
-                    index_key = f"{self.key_prefix}:index:{field}:{value}"
-                    pipe.srem(index_key, document_id)
-            await pipe.execute()
+    def _index_key_prefix(self) -> str:
+        """Prefix that index keys are built from: {prefix}{field}:{value}."""
+        return f"{self.key_prefix}:index:"
 
     def _extract_indexable_fields(self, metadata: Dict[str, Any]) -> Dict[str, str]:
         """
         Extract fields that should be indexed from metadata.
 
+        A dict value (e.g. the classification dict under "theme") is indexed by
+        its same-named key.
+
         Returns:
             Dictionary with theme, mime_type, status if present
         """
         indexable: Dict[str, str] = {}
 
-        if "theme" in metadata:
-            theme_data = metadata["theme"]
-            if isinstance(theme_data, dict):
-                theme_value: Optional[str] = theme_data.get("theme", "")
-            else:
-                theme_value = str(theme_data)
-            if theme_value:
-                indexable["theme"] = str(theme_value)
-
-        if "mime_type" in metadata:
-            mime_value = metadata["mime_type"]
-            if mime_value:
-                indexable["mime_type"] = str(mime_value)
-
-        if "status" in metadata:
-            status_value = metadata["status"]
-            if status_value:
-                indexable["status"] = str(status_value)
+        for field in self.INDEXED_FIELDS:
+            value = metadata.get(field)
+            if isinstance(value, dict):
+                value = value.get(field)
+            if value:
+                indexable[field] = str(value)
 
         return indexable
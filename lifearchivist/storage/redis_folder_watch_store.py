@@ -8,12 +8,14 @@ This implementation provides:
 - Concurrent-safe operations
 - Efficient memory usage with Redis hashes and sets
 - Persistence across server restarts
+- Pipelined multi-folder reads and buffered stat increments
 """
 
+import asyncio
 import json
 import logging
 from datetime import datetime
-from typing import Any, Awaitable, Dict, List, Optional, Set, cast
+from typing import Any, Awaitable, Dict, Iterable, List, Optional, Set, Tuple, cast
 from uuid import uuid4
 
 import redis.asyncio as redis
@@ -22,6 +24,26 @@ from lifearchivist.utils.logging import log_event, track
 
 logger = logging.getLogger(__name__)
 
+# Apply one folder's buffered stats only if the folder still exists, so a
+# flush racing remove_folder cannot recreate a partial hash.
+# KEYS[1]: folder hash; ARGV: last_activity ("" to leave it), clear-errors
+# flag ("1"/"0"), then stat name/amount pairs
+FLUSH_FOLDER_STATS_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+  return 0
+end
+for i = 3, #ARGV, 2 do
+  redis.call('HINCRBY', KEYS[1], ARGV[i], ARGV[i + 1])
+end
+if ARGV[2] == '1' then
+  redis.call('HSET', KEYS[1], 'last_error', '', 'error_count', '0')
+end
+if ARGV[1] ~= '' then
+  redis.call('HSET', KEYS[1], 'last_activity', ARGV[1])
+end
+return 1
+"""
+
 
 class RedisFolderWatchStore:
     """
@@ -62,6 +84,18 @@ class RedisFolderWatchStore:
          - total_processed: Count
          - last_updated: ISO timestamp
 
+    5. File Index (Redis Hash, one per folder):
+       Key: "lifearchivist:folder_watch:files:{folder_id}"
+       Fields: {path relative to the folder: "{mtime_ns}:{size}"}
+       Purpose: Files already handled, so catch-up scans only revisit
+       files that are new or changed since
+
+    6. Quick Fingerprint Index (Redis Hash):
+       Key: "lifearchivist:folder_watch:fingerprints"
+       Fields: {"{size}:{algorithm}:{head/tail digest}": SHA-256}
+       Purpose: Only files whose quick fingerprint matches a known file
+       need a full hash before the duplicate check
+
     Performance Characteristics:
     ---------------------------
     - Add folder: O(1) - constant time
@@ -69,10 +103,19 @@ class RedisFolderWatchStore:
     - List folders: O(n) where n = number of folders
     - Delete folder: O(1) - atomic transaction
     - Check path exists: O(1) - hash field lookup
-    - Update stats: O(1) - atomic increment
+    - Update stats: O(1) - atomic increment; buffered increments are
+      flushed for all folders in one pipeline of per-folder Lua scripts
+      per interval
+    - Load file index: O(n) where n = files in the folder (HSCAN batches)
     - Concurrent writes: Safe with Redis atomicity
     """
 
+    # File index entries written per pipeline round trip
+    FILE_INDEX_BATCH_SIZE = 1000
+
+    # Seconds between flushes of buffered stat increments
+    STAT_FLUSH_INTERVAL_SECONDS = 1.0
+
     def __init__(self, redis_url: str = "redis://localhost:6379"):
         """
         Initialize Redis folder watch store.
@@ -89,6 +132,12 @@ class RedisFolderWatchStore:
         # Connection state
         self._initialized = False
 
+        # Buffered stat increments: folder_id -> {stat_name: amount}, plus
+        # folders whose error state is cleared on the next flush
+        self._stat_buffer: Dict[str, Dict[str, int]] = {}
+        self._clear_errors: Set[str] = set()
+        self._flush_task: Optional[asyncio.Task] = None
+
     @track(
         operation="redis_folder_watch_store_initialize",
         track_performance=True,
@@ -113,6 +162,7 @@ class RedisFolderWatchStore:
 
             await self.redis_client.ping()
             self._initialized = True
+            self._flush_task = asyncio.create_task(self._flush_stats_loop())
 
             folder_count = await self.get_folder_count()
 
@@ -147,7 +197,19 @@ class RedisFolderWatchStore:
 
     async def close(self) -> None:
         """Close Redis connection and cleanup resources."""
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+
         if self.redis_client:
+            try:
+                await self.flush_stats()
+            except Exception as e:
+                logger.warning(f"Failed to flush folder stats on close: {e}")
             await self.redis_client.aclose()
             self._initialized = False
 
@@ -274,7 +336,41 @@ class RedisFolderWatchStore:
             return None
 
         # Deserialize data types
-        return self._deserialize_folder_data(raw_data)
+        return self._with_buffered_stats(self._deserialize_folder_data(raw_data))
+
+    @track(
+        operation="redis_get_watched_folders",
+        track_performance=True,
+        frequency="high_frequency",
+    )
+    async def get_folders(self, folder_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get several folder configurations in one round trip.
+
+        Args:
+            folder_ids: Folder UUIDs
+
+        Returns:
+            Mapping of folder_id to configuration dict (missing folders omitted)
+        """
+        if not self._initialized:
+            raise RuntimeError("RedisFolderWatchStore not initialized")
+
+        folder_ids = list(folder_ids)
+        if not folder_ids:
+            return {}
+
+        client = self._client()
+        async with client.pipeline(transaction=False) as pipe:
+            for folder_id in folder_ids:
+                pipe.hgetall(f"{self.key_prefix}:folders:{folder_id}")
+            results: List[Dict[str, str]] = await pipe.execute()
+
+        return {
+            folder_id: self._with_buffered_stats(self._deserialize_folder_data(raw))
+            for folder_id, raw in zip(folder_ids, results, strict=True)
+            if raw
+        }
 
     @track(
         operation="redis_list_watched_folders",
@@ -302,14 +398,12 @@ class RedisFolderWatchStore:
         if not folder_ids:
             return []
 
-        # Fetch all folder configurations
-        folders = []
-        for folder_id in folder_ids:
-            folder = await self.get_folder(folder_id)
-            if folder:
-                if enabled_only and not folder.get("enabled", False):
-                    continue
-                folders.append(folder)
+        # Fetch all folder configurations in one pipeline
+        folders = [
+            folder
+            for folder in (await self.get_folders(folder_ids)).values()
+            if not enabled_only or folder.get("enabled", False)
+        ]
 
         # Sort by created_at descending (newest first)
         folders.sort(key=lambda f: f.get("created_at", ""), reverse=True)
@@ -387,10 +481,15 @@ class RedisFolderWatchStore:
         ids_key = f"{self.key_prefix}:folder_ids"
         path_index_key = f"{self.key_prefix}:path_index"
 
+        # Pending increments would recreate the deleted hash
+        self._stat_buffer.pop(folder_id, None)
+        self._clear_errors.discard(folder_id)
+
         client = self._client()
         async with client.pipeline(transaction=True) as pipe:
-            # Delete folder configuration
+            # Delete folder configuration and file index
             pipe.delete(folder_key)
+            pipe.delete(self._file_index_key(folder_id))
             # Remove from folder IDs index
             pipe.srem(ids_key, folder_id)
             # Remove from path index
@@ -452,6 +551,137 @@ class RedisFolderWatchStore:
 
         return new_value
 
+    def buffer_stat_increment(
+        self, folder_id: str, stat_name: str, amount: int = 1
+    ) -> None:
+        """
+        Add to a folder statistic without a round trip.
+
+        Increments are summed in memory and written by flush_stats(), which
+        runs every STAT_FLUSH_INTERVAL_SECONDS; reads through get_folder(s)
+        already include them. Increments for folders deleted before the
+        flush are dropped.
+
+        Args:
+            folder_id: Folder UUID
+            stat_name: Stat field name (e.g., "files_ingested")
+            amount: Amount to increment by
+        """
+        stats = self._stat_buffer.setdefault(folder_id, {})
+        stats[stat_name] = stats.get(stat_name, 0) + amount
+
+    def buffer_clear_folder_error(self, folder_id: str) -> None:
+        """
+        Clear a folder's error state on the next stats flush.
+
+        Args:
+            folder_id: Folder UUID
+        """
+        self._clear_errors.add(folder_id)
+
+    async def flush_stats(self) -> int:
+        """
+        Write buffered stat increments in one pipeline.
+
+        Each folder's increments run in a Lua script that skips folders
+        removed since the increments were buffered.
+
+        Returns:
+            Number of folders updated
+        """
+        if not self._stat_buffer and not self._clear_errors:
+            return 0
+
+        buffer, self._stat_buffer = self._stat_buffer, {}
+        clear_errors, self._clear_errors = self._clear_errors, set()
+        folder_ids = list(buffer.keys() | clear_errors)
+        folder_keys = [f"{self.key_prefix}:folders:{fid}" for fid in folder_ids]
+
+        client = self._client()
+        flush_folder = client.register_script(FLUSH_FOLDER_STATS_SCRIPT)
+        now = datetime.utcnow().isoformat()
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                for folder_id, folder_key in zip(folder_ids, folder_keys, strict=True):
+                    stats = buffer.get(folder_id, {})
+                    args: List[Any] = [
+                        now if folder_id in buffer else "",
+                        "1" if folder_id in clear_errors else "0",
+                    ]
+                    for stat_name, amount in stats.items():
+                        args.extend((stat_name, amount))
+                    await flush_folder(keys=[folder_key], args=args, client=pipe)
+                results = await pipe.execute()
+            updated = sum(1 for result in results if result)
+        except Exception:
+            # Put the increments back so the next flush retries them; error
+            # clears are dropped, the next success queues another
+            for folder_id, stats in buffer.items():
+                for stat_name, amount in stats.items():
+                    self.buffer_stat_increment(folder_id, stat_name, amount)
+            raise
+
+        return updated
+
+    async def _flush_stats_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.STAT_FLUSH_INTERVAL_SECONDS)
+            try:
+                await self.flush_stats()
+            except Exception as e:
+                log_event(
+                    "folder_watch_stats_flush_failed",
+                    {"error": str(e)},
+                    level=logging.WARNING,
+                )
+
+    def _with_buffered_stats(self, folder: Dict[str, Any]) -> Dict[str, Any]:
+        """Add unflushed increments to a deserialized folder."""
+        folder_id = folder["id"]
+        for stat_name, amount in self._stat_buffer.get(folder_id, {}).items():
+            if isinstance(folder.get(stat_name), int):
+                folder[stat_name] += amount
+        if folder_id in self._clear_errors:
+            folder["last_error"] = ""
+            folder["error_count"] = 0
+        return folder
+
+    async def get_fingerprint_hash(self, fingerprint: str) -> Optional[str]:
+        """
+        Get the SHA-256 of a known file with this quick fingerprint.
+
+        Args:
+            fingerprint: Size and head/tail digest of a file
+
+        Returns:
+            Full content hash, or None if no file with it was seen
+        """
+        if not self._initialized:
+            raise RuntimeError("RedisFolderWatchStore not initialized")
+
+        client = self._client()
+        return await cast(
+            Awaitable[Optional[str]],
+            client.hget(f"{self.key_prefix}:fingerprints", fingerprint),
+        )
+
+    async def add_fingerprint(self, fingerprint: str, file_hash: str) -> None:
+        """
+        Record the full content hash for a quick fingerprint.
+
+        Args:
+            fingerprint: Size and head/tail digest of a file
+            file_hash: SHA-256 of the file
+        """
+        if not self._initialized:
+            raise RuntimeError("RedisFolderWatchStore not initialized")
+
+        client = self._client()
+        await cast(
+            Awaitable[int],
+            client.hset(f"{self.key_prefix}:fingerprints", fingerprint, file_hash),
+        )
+
     async def get_folder_id_by_path(self, path: str) -> Optional[str]:
         """
         Get folder ID by path (O(1) lookup).
@@ -524,6 +754,9 @@ class RedisFolderWatchStore:
 
         folder_key = f"{self.key_prefix}:folders:{folder_id}"
 
+        # A clear buffered before this error must not overwrite it
+        self._clear_errors.discard(folder_id)
+
         client = self._client()
         async with client.pipeline(transaction=True) as pipe:
             pipe.hset(folder_key, "last_error", error_message)
@@ -549,6 +782,100 @@ class RedisFolderWatchStore:
             pipe.hset(folder_key, "error_count", "0")
             await pipe.execute()
 
+    def _file_index_key(self, folder_id: str) -> str:
+        return f"{self.key_prefix}:files:{folder_id}"
+
+    @track(
+        operation="redis_get_folder_file_index",
+        include_args=["folder_id"],
+        track_performance=True,
+        frequency="low_frequency",
+    )
+    async def get_file_index(self, folder_id: str) -> Dict[str, Tuple[int, int]]:
+        """
+        Get the files recorded as handled for a folder.
+
+        Args:
+            folder_id: Folder UUID
+
+        Returns:
+            Mapping of relative path to (mtime_ns, size)
+        """
+        if not self._initialized:
+            raise RuntimeError("RedisFolderWatchStore not initialized")
+
+        index: Dict[str, Tuple[int, int]] = {}
+        client = self._client()
+        async for path, value in client.hscan_iter(
+            self._file_index_key(folder_id), count=self.FILE_INDEX_BATCH_SIZE
+        ):
+            mtime_ns, _, size = value.partition(":")
+            try:
+                index[path] = (int(mtime_ns), int(size))
+            except ValueError:
+                # Unparseable entries are treated as unseen files
+                continue
+
+        return index
+
+    async def update_file_index(
+        self, folder_id: str, entries: Dict[str, Tuple[int, int]]
+    ) -> None:
+        """
+        Record files as handled for a folder.
+
+        Args:
+            folder_id: Folder UUID
+            entries: Mapping of relative path to (mtime_ns, size)
+        """
+        if not self._initialized:
+            raise RuntimeError("RedisFolderWatchStore not initialized")
+
+        if not entries:
+            return
+
+        key = self._file_index_key(folder_id)
+        items = [
+            (path, f"{mtime_ns}:{size}") for path, (mtime_ns, size) in entries.items()
+        ]
+
+        client = self._client()
+        async with client.pipeline(transaction=False) as pipe:
+            for start in range(0, len(items), self.FILE_INDEX_BATCH_SIZE):
+                pipe.hset(
+                    key,
+                    mapping=dict(items[start : start + self.FILE_INDEX_BATCH_SIZE]),
+                )
+            await pipe.execute()
+
+    async def remove_from_file_index(self, folder_id: str, paths: Iterable[str]) -> int:
+        """
+        Forget files that no longer exist in a folder.
+
+        Args:
+            folder_id: Folder UUID
+            paths: Relative paths to remove
+
+        Returns:
+            Number of entries removed
+        """
+        if not self._initialized:
+            raise RuntimeError("RedisFolderWatchStore not initialized")
+
+        paths = list(paths)
+        if not paths:
+            return 0
+
+        key = self._file_index_key(folder_id)
+
+        client = self._client()
+        async with client.pipeline(transaction=False) as pipe:
+            for start in range(0, len(paths), self.FILE_INDEX_BATCH_SIZE):
+                pipe.hdel(key, *paths[start : start + self.FILE_INDEX_BATCH_SIZE])
+            results = await pipe.execute()
+
+        return sum(int(removed) for removed in results)
+
     @track(
         operation="redis_clear_all_folders",
         track_performance=True,
@@ -566,6 +893,9 @@ class RedisFolderWatchStore:
 
         folder_count = await self.get_folder_count()
 
+        self._stat_buffer.clear()
+        self._clear_errors.clear()
+
         pattern = f"{self.key_prefix}:*"
         cursor = 0
         keys_deleted = 0
@@ -0,0 +1,221 @@
+"""
+Server-side Lua scripts for RedisDocumentTracker mutations.
+
+Each script performs a complete tracker mutation (data keys plus metadata
+index maintenance) in a single atomic round-trip. Scripts are registered once
+per client and invoked with EVALSHA.
+
+Index keys are derived inside the scripts from an index key prefix passed in
+ARGV, so these scripts assume a single (non-clustered) Redis instance.
+"""
+
+# Shared helpers prepended to every script.
+#
+# index_value mirrors RedisDocumentTracker._extract_indexable_fields: a field
+# stored as a JSON object (e.g. the classification dict under "theme") is
+# indexed by its same-named key, anything else by its raw string value.
+_LUA_HELPERS = """
+local function index_value(field, raw)
+    if not raw or raw == '' then
+        return nil
+    end
+    if string.sub(raw, 1, 1) == '{' then
+        local ok, decoded = pcall(cjson.decode, raw)
+        if ok and type(decoded) == 'table' then
+            local value = decoded[field]
+            if type(value) == 'string' and value ~= '' then
+                return value
+            end
+            if type(value) == 'number' then
+                return tostring(value)
+            end
+            return nil
+        end
+    end
+    return raw
+end
+
+local function reindex(prefix, document_id, field, old_value, new_value)
+    if old_value == new_value then
+        return
+    end
+    if old_value then
+        redis.call('SREM', prefix .. field .. ':' .. old_value, document_id)
+    end
+    if new_value then
+        redis.call('SADD', prefix .. field .. ':' .. new_value, document_id)
+    end
+end
+"""
+
+# KEYS[1] = nodes list, KEYS[2] = all-documents set, KEYS[3] = count
+# ARGV[1] = document_id, ARGV[2..] = node ids
+#
+# Returns 1 if the document was newly added, 0 if it was already tracked
+# (its node ids are still appended, but the count is not incremented twice).
+ADD_DOCUMENT_SCRIPT = _LUA_HELPERS + """
+local added = redis.call('SADD', KEYS[2], ARGV[1])
+local chunk = 1000
+for i = 2, #ARGV, chunk do
+    redis.call('RPUSH', KEYS[1], unpack(ARGV, i, math.min(i + chunk - 1, #ARGV)))
+end
+if added == 1 then
+    redis.call('INCR', KEYS[3])
+end
+return added
+"""
+
+# KEYS[1] = nodes list, KEYS[2] = metadata hash, KEYS[3] = all-documents set,
+# KEYS[4] = count
+# ARGV[1] = document_id, ARGV[2] = index key prefix, ARGV[3..] = indexed fields
+#
+# Returns 1 if the document was removed, 0 if it was not tracked.
+REMOVE_DOCUMENT_SCRIPT = _LUA_HELPERS + """
+if redis.call('SREM', KEYS[3], ARGV[1]) == 0 then
+    return 0
+end
+for i = 3, #ARGV do
+    local field = ARGV[i]
+    local value = index_value(field, redis.call('HGET', KEYS[2], field))
+    if value then
+        redis.call('SREM', ARGV[2] .. field .. ':' .. value, ARGV[1])
+    end
+end
+redis.call('DEL', KEYS[1], KEYS[2])
+redis.call('DECR', KEYS[4])
+return 1
+"""
+
+# KEYS[1] = metadata hash
+# ARGV[1] = document_id
+# ARGV[2] = index key prefix
+# ARGV[3] = mode: "store" (upsert), "update" (merge) or "replace"
+# ARGV[4] = number of indexed fields (n)
+# ARGV[5 .. 4+n] = indexed field names
+# ARGV[5+n ..] = repeated (field, strategy, serialized value) triples, where
+#                strategy is "set", "append" or "union"
+#
+# "append" concatenates JSON arrays textually so existing entries are kept
+# byte-for-byte. "union" adds only values not already present. Both fall back
+# to "set" when the stored value is not a JSON array, and are only applied in
+# "update" mode.
+#
+# Returns 0 if mode is "update"/"replace" and the document has no metadata,
+# -1 if a "store"/"update" targets a hash in the compact layout (the caller
+# must use COMPACT_WRITE_SCRIPT instead), otherwise 1.
+UPDATE_METADATA_SCRIPT = _LUA_HELPERS + """
+local function merge_lists(strategy, existing, incoming)
+    if not existing or string.sub(existing, 1, 1) ~= '['
+            or string.sub(existing, -1) ~= ']' then
+        return incoming
+    end
+    if strategy == 'append' then
+        if existing == '[]' then
+            return incoming
+        end
+        if incoming == '[]' then
+            return existing
+        end
+        return string.sub(existing, 1, -2) .. ', ' .. string.sub(incoming, 2)
+    end
+    local ok_old, old_items = pcall(cjson.decode, existing)
+    local ok_new, new_items = pcall(cjson.decode, incoming)
+    if not ok_old or not ok_new then
+        return incoming
+    end
+    local seen = {}
+    local merged = {}
+    local function push(item)
+        local key = type(item) == 'string' and item or cjson.encode(item)
+        if not seen[key] then
+            seen[key] = true
+            table.insert(merged, item)
+        end
+    end
+    for _, item in ipairs(old_items) do push(item) end
+    for _, item in ipairs(new_items) do push(item) end
+    if #merged == 0 then
+        return '[]'
+    end
+    return cjson.encode(merged)
+end
+
+local mode = ARGV[3]
+if mode ~= 'store' and redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+if mode ~= 'replace' and redis.call('HEXISTS', KEYS[1], '_doc') == 1 then
+    return -1
+end
+
+local n = tonumber(ARGV[4])
+local old_index = {}
+for i = 1, n do
+    local field = ARGV[4 + i]
+    old_index[field] = index_value(field, redis.call('HGET', KEYS[1], field))
+end
+
+if mode == 'replace' then
+    redis.call('DEL', KEYS[1])
+end
+
+for i = 5 + n, #ARGV, 3 do
+    local field, strategy, value = ARGV[i], ARGV[i + 1], ARGV[i + 2]
+    if mode == 'update' and strategy ~= 'set' then
+        value = merge_lists(strategy, redis.call('HGET', KEYS[1], field), value)
+    end
+    redis.call('HSET', KEYS[1], field, value)
+end
+
+for i = 1, n do
+    local field = ARGV[4 + i]
+    local new_value = index_value(field, redis.call('HGET', KEYS[1], field))
+    reindex(ARGV[2], ARGV[1], field, old_index[field], new_value)
+end
+return 1
+"""
+
+# Compare-and-set write of a hash in the compact layout.
+#
+# KEYS[1] = metadata hash
+# ARGV[1] = document_id
+# ARGV[2] = index key prefix
+# ARGV[3] = expected write version ("0" for a hash without one)
+# ARGV[4] = "1" if the hash must already exist, "0" to allow creating it
+# ARGV[5] = metadata blob
+# ARGV[6] = number of indexed fields (n)
+# ARGV[7 ..] = n (field, index value) pairs; an empty value means unindexed
+#
+# The hash is rewritten as {_doc: blob, _v: version + 1, indexed fields}.
+# Returns -1 if the version changed since it was read (the caller re-reads
+# and retries), 0 if the hash must exist but does not, otherwise 1.
+COMPACT_WRITE_SCRIPT = _LUA_HELPERS + """
+local current = redis.call('HGET', KEYS[1], '_v') or '0'
+if current ~= ARGV[3] then
+    return -1
+end
+if ARGV[4] == '1' and redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+
+local n = tonumber(ARGV[6])
+local old_index = {}
+for i = 0, n - 1 do
+    local field = ARGV[7 + 2 * i]
+    old_index[field] = index_value(field, redis.call('HGET', KEYS[1], field))
+end
+
+redis.call('DEL', KEYS[1])
+redis.call('HSET', KEYS[1], '_doc', ARGV[5], '_v', tonumber(current) + 1)
+
+for i = 0, n - 1 do
+    local field, value = ARGV[7 + 2 * i], ARGV[8 + 2 * i]
+    local new_value = nil
+    if value ~= '' then
+        redis.call('HSET', KEYS[1], field, value)
+        new_value = value
+    end
+    reindex(ARGV[2], ARGV[1], field, old_index[field], new_value)
+end
+return 1
+"""
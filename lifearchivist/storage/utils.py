@@ -7,7 +7,7 @@ following DRY principles and ensuring consistency.
 
 import json
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Collection, Dict, List, Optional, Tuple
 
 from lifearchivist.utils.logging import log_event
 
@@ -60,6 +60,35 @@ class MetadataFilterUtils:
 
         return True
 
+    @staticmethod
+    def split_filters(
+        filters: Dict[str, Any], indexed_fields: Collection[str]
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Split filters into those answerable from an index and those needing a scan.
+
+        A filter can use an index only when its field is indexed and it is an
+        exact match on a scalar value. List membership and operator filters on
+        indexed fields still have to be evaluated against the stored values.
+
+        Args:
+            filters: Filter criteria to split
+            indexed_fields: Field names that have exact-match indexes
+
+        Returns:
+            Tuple of (index_filters, scan_filters)
+        """
+        index_filters: Dict[str, Any] = {}
+        scan_filters: Dict[str, Any] = {}
+
+        for key, value in (filters or {}).items():
+            if key in indexed_fields and not isinstance(value, (list, dict)):
+                index_filters[key] = value
+            else:
+                scan_filters[key] = value
+
+        return index_filters, scan_filters
+
     @staticmethod
     def _check_operators(value: Any, operators: Dict[str, Any]) -> bool:
         """
@@ -0,0 +1,148 @@
+"""
+Thumbnail generation off the event loop.
+
+Decoding and resizing an image (or rasterizing a PDF page) takes tens to
+hundreds of milliseconds of CPU, which would stall every other request if run
+on the event loop. ThumbnailService renders thumbnails on a dedicated thread
+pool (Pillow and poppler release the GIL while decoding and resampling), and
+collapses concurrent requests for the same file into one render.
+
+In lazy mode the vault skips thumbnails at import time, and they are rendered
+on the first get_thumbnail_path request and kept on disk from then on.
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from lifearchivist.utils.logging import log_event
+
+from .vault_utils import is_thumbnail_supported, render_thumbnail
+
+
+class ThumbnailService:
+    """Renders vault thumbnails on a bounded worker pool."""
+
+    WORKERS = 2
+
+    # Seconds before a source that failed to render is tried again
+    FAILURE_RETRY_SECONDS = 600.0
+    # Failed sources remembered at once; the oldest are forgotten first
+    MAX_FAILED = 10000
+
+    def __init__(
+        self,
+        size: int = 256,
+        quality: int = 80,
+        workers: Optional[int] = None,
+        lazy: bool = False,
+    ):
+        """
+        Configure the service; worker threads start on first use.
+
+        Args:
+            size: Maximum thumbnail width and height in pixels
+            quality: WEBP quality
+            workers: Concurrent renders
+            lazy: Defer rendering from import to first request
+        """
+        self.size = (size, size)
+        self.quality = quality
+        self.workers = workers or self.WORKERS
+        self.lazy = lazy
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Dict[Path, asyncio.Future] = {}
+        # Sources that failed to render -> monotonic time to retry them, so
+        # lazy requests don't re-render a broken file on every view
+        self._failed: Dict[Path, float] = {}
+
+    def supports(self, source_path: Path) -> bool:
+        """Check if a thumbnail can be rendered for the file."""
+        return is_thumbnail_supported(source_path)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="thumbnail"
+            )
+        return self._executor
+
+    async def render(
+        self,
+        source_path: Path,
+        thumbnail_path: Path,
+        on_rendered: Optional[Callable[[Path], None]] = None,
+    ) -> bool:
+        """
+        Render a thumbnail on the worker pool.
+
+        Concurrent calls for the same thumbnail share a single render.
+
+        Args:
+            source_path: Image or PDF to render
+            thumbnail_path: Where the WEBP thumbnail is written
+            on_rendered: Called once with the thumbnail path if this call
+                created it (not for existing or shared renders)
+
+        Returns:
+            True if the thumbnail exists afterwards
+        """
+        if thumbnail_path.exists():
+            return True
+        if not self.supports(source_path) or self._recently_failed(source_path):
+            return False
+
+        pending = self._pending.get(thumbnail_path)
+        if pending is not None:
+            return bool(await asyncio.shield(pending))
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(
+            self._get_executor(),
+            render_thumbnail,
+            source_path,
+            thumbnail_path,
+            self.size,
+            self.quality,
+        )
+        self._pending[thumbnail_path] = future
+        try:
+            rendered = bool(await asyncio.shield(future))
+        finally:
+            self._pending.pop(thumbnail_path, None)
+
+        if rendered and on_rendered is not None:
+            on_rendered(thumbnail_path)
+        elif not rendered:
+            self._record_failure(source_path)
+            log_event(
+                "thumbnail_render_failed",
+                {"source_name": source_path.name},
+                level=logging.DEBUG,
+            )
+        return rendered
+
+    def _recently_failed(self, source_path: Path) -> bool:
+        retry_at = self._failed.get(source_path)
+        if retry_at is None:
+            return False
+        if time.monotonic() < retry_at:
+            return True
+        del self._failed[source_path]
+        return False
+
+    def _record_failure(self, source_path: Path) -> None:
+        self._failed.pop(source_path, None)
+        self._failed[source_path] = time.monotonic() + self.FAILURE_RETRY_SECONDS
+        # Dicts keep insertion order, so the first entries are the oldest
+        while len(self._failed) > self.MAX_FAILED:
+            del self._failed[next(iter(self._failed))]
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker threads; they restart if the service is used again."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
@@ -2,24 +2,27 @@
 File vault for content-addressed storage.
 """
 
+import asyncio
 import logging
 import shutil
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from lifearchivist.storage.vault.thumbnail_service import ThumbnailService
 from lifearchivist.storage.vault.vault_utils import (
     build_content_directory,
     build_content_path,
     build_thumbnail_path,
+    bytes_to_mb,
     calculate_file_hash,
     cleanup_empty_directories,
     cleanup_old_temp_files,
     clear_directory_files,
     delete_file_safely,
     find_files_by_hash_pattern,
-    generate_image_thumbnail,
-    get_comprehensive_directory_stats,
     safe_get_file_size,
+    scan_content_files,
+    scan_directory_stats,
 )
 from lifearchivist.utils.logging import log_event, track
 
@@ -34,23 +37,39 @@ class Vault:
 
     Directory structure:
     - content/: Actual file content organized by hash (ab/cd/efgh123...)
-    - thumbnails/: Auto-generated image previews in WEBP format
+    - thumbnails/: Image and PDF first-page previews in WEBP format, rendered
+      off the event loop at import (or on first request in lazy mode)
     - temp/: Temporary files (cleaned up automatically)
     - exports/: Generated export files
+
+    Storage statistics are kept as per-directory counters updated by
+    store_file and delete_file, seeded by a full recount on first use. An
+    optional periodic recount corrects drift from changes made outside the
+    vault API.
     """
 
-    def __init__(self, vault_path: Path):
+    def __init__(
+        self, vault_path: Path, thumbnail_service: Optional[ThumbnailService] = None
+    ):
         """
         Initialize vault with specified storage path.
 
         Args:
             vault_path: Root directory path for vault storage
+            thumbnail_service: Thumbnail renderer (defaults to eager rendering
+                at 256px)
         """
         self.vault_path = Path(vault_path)
         self.content_dir = self.vault_path / "content"
         self.thumbnails_dir = self.vault_path / "thumbnails"
         self.temp_dir = self.vault_path / "temp"
         self.exports_dir = self.vault_path / "exports"
+        self.thumbnail_service = thumbnail_service or ThumbnailService()
+
+        # Per-directory {"files", "bytes"} counters; None until first recount
+        self._stats: Optional[Dict[str, Dict[str, int]]] = None
+        self._recount_lock = asyncio.Lock()
+        self._recount_task: Optional[asyncio.Task] = None
 
     @track(
         operation="vault_initialization",
@@ -186,6 +205,8 @@ class Vault:
         # If no file hashes provided or we need comprehensive cleanup, clear all files
         if not file_hashes:
             await self._clear_all_vault_files(cleared_metrics)
+            # Anything left behind by failed deletions is picked up by a recount
+            self._stats = None
 
         # Clean up empty directories
         dirs_cleaned = await self._cleanup_empty_directories()
@@ -245,12 +266,26 @@ class Vault:
         content_directory = self._get_content_directory(file_hash)
         matching_files = find_files_by_hash_pattern(content_directory, file_hash)
 
+        files_before = metrics.get("files_deleted", 0)
+        bytes_before = metrics.get("bytes_reclaimed", 0)
         for file_path in matching_files:
             await delete_file_safely(file_path, metrics)
+        self._adjust_stats(
+            "content",
+            files_before - metrics.get("files_deleted", 0),
+            bytes_before - metrics.get("bytes_reclaimed", 0),
+        )
 
         # Thumbnail files
         thumbnail_path = self._get_thumbnail_path(file_hash)
+        files_before = metrics.get("files_deleted", 0)
+        bytes_before = metrics.get("bytes_reclaimed", 0)
         await delete_file_safely(thumbnail_path, metrics)
+        self._adjust_stats(
+            "thumbnails",
+            files_before - metrics.get("files_deleted", 0),
+            bytes_before - metrics.get("bytes_reclaimed", 0),
+        )
 
     def _get_content_directory(self, file_hash: str) -> Path:
         """
@@ -328,35 +363,31 @@ class Vault:
                 level=logging.DEBUG,
             )
 
-            directories = {
-                "content": self.content_dir,
-                "thumbnails": self.thumbnails_dir,  # Note: UI expects "thumbnails", not "thumbnail"
-                "temp": self.temp_dir,
-                "exports": self.exports_dir,
-            }
-
-            flat_stats = await get_comprehensive_directory_stats(directories)
+            counters = self._stats
+            if counters is None:
+                counters = await self.recount_statistics()
 
-            # Transform flat structure to nested structure expected by UI
+            # Build nested structure expected by UI
             nested_directories = {}
-            for dir_name in directories.keys():
+            for dir_name, dir_stats in counters.items():
                 nested_directories[dir_name] = {
-                    "file_count": flat_stats.get(f"{dir_name}_files", 0),
-                    "total_size_bytes": flat_stats.get(f"{dir_name}_size_bytes", 0),
-                    "total_size_mb": flat_stats.get(f"{dir_name}_size_mb", 0.0),
+                    "file_count": dir_stats["files"],
+                    "total_size_bytes": dir_stats["bytes"],
+                    "total_size_mb": bytes_to_mb(dir_stats["bytes"]),
                 }
 
-            total_files = flat_stats.get("total_files", 0)
-            total_mb = flat_stats.get("total_size_mb", 0.0)
+            total_files = sum(d["files"] for d in counters.values())
+            total_bytes = sum(d["bytes"] for d in counters.values())
+            total_mb = bytes_to_mb(total_bytes)
 
             log_event(
                 "vault_stats_collected",
                 {
                     "total_files": total_files,
                     "total_size_mb": round(total_mb, 2),
-                    "content_files": flat_stats.get("content_files", 0),
-                    "thumbnail_files": flat_stats.get("thumbnails_files", 0),
-                    "temp_files": flat_stats.get("temp_files", 0),
+                    "content_files": counters["content"]["files"],
+                    "thumbnail_files": counters["thumbnails"]["files"],
+                    "temp_files": counters["temp"]["files"],
                 },
             )
 
@@ -364,7 +395,7 @@ class Vault:
                 "vault_path": str(self.vault_path),
                 "directories": nested_directories,
                 "total_files": total_files,
-                "total_size_bytes": flat_stats.get("total_size_bytes", 0),
+                "total_size_bytes": total_bytes,
                 "total_size_mb": total_mb,
             }
 
@@ -386,6 +417,103 @@ class Vault:
                 "total_size_mb": 0.0,
             }
 
+    def _stats_directories(self) -> Dict[str, Path]:
+        """Directories covered by vault statistics, keyed by UI name."""
+        return {
+            "content": self.content_dir,
+            "thumbnails": self.thumbnails_dir,  # Note: UI expects "thumbnails", not "thumbnail"
+            "temp": self.temp_dir,
+            "exports": self.exports_dir,
+        }
+
+    def _adjust_stats(self, dir_name: str, files: int, size_bytes: int):
+        """Apply a file count and size delta to a directory's counters."""
+        if self._stats is None:
+            return
+        counters = self._stats[dir_name]
+        counters["files"] = max(0, counters["files"] + files)
+        counters["bytes"] = max(0, counters["bytes"] + size_bytes)
+
+    async def recount_statistics(self) -> Dict[str, Dict[str, int]]:
+        """
+        Recount files and bytes in every vault directory from disk.
+
+        Walks the directories with os.scandir in a worker thread and replaces
+        the incremental counters. Changes made while the walk is running may
+        be counted twice or missed; the next recount corrects them.
+
+        Returns:
+            Per-directory {"files", "bytes"} counts
+        """
+        async with self._recount_lock:
+            directories = self._stats_directories()
+            counts = await asyncio.to_thread(
+                lambda: {
+                    name: scan_directory_stats(path)
+                    for name, path in directories.items()
+                }
+            )
+
+            previous = self._stats
+            self._stats = counts
+
+        if previous is not None:
+            files_drift = sum(
+                counts[name]["files"] - previous[name]["files"] for name in counts
+            )
+            bytes_drift = sum(
+                counts[name]["bytes"] - previous[name]["bytes"] for name in counts
+            )
+            if files_drift or bytes_drift:
+                log_event(
+                    "vault_stats_drift_corrected",
+                    {"files_drift": files_drift, "bytes_drift": bytes_drift},
+                    level=logging.DEBUG,
+                )
+
+        return counts
+
+    def start_stats_recount(self, interval_seconds: int):
+        """
+        Start periodic background recounts of vault statistics.
+
+        Args:
+            interval_seconds: Seconds between recounts; 0 or less disables them
+        """
+        if interval_seconds <= 0 or self._recount_task is not None:
+            return
+        self._recount_task = asyncio.create_task(
+            self._run_stats_recount(interval_seconds)
+        )
+
+    async def stop_stats_recount(self):
+        """Stop periodic background recounts if they are running."""
+        if self._recount_task is None:
+            return
+        self._recount_task.cancel()
+        try:
+            await self._recount_task
+        except asyncio.CancelledError:
+            pass
+        self._recount_task = None
+
+    def shutdown_thumbnails(self):
+        """Stop the thumbnail worker threads."""
+        self.thumbnail_service.shutdown(wait=False)
+
+    async def _run_stats_recount(self, interval_seconds: int):
+        """Recount vault statistics every interval until cancelled."""
+        while True:
+            try:
+                await self.recount_statistics()
+            except Exception as e:
+                log_event(
+                    "vault_stats_recount_failed",
+                    {"error": str(e), "error_type": type(e).__name__},
+                    level=logging.WARNING,
+                )
+            await asyncio.sleep(interval_seconds)
+
     def _get_content_path(self, file_hash: str, extension: str) -> Path:
         """
         Get the full storage path for a file based on its hash and extension.
@@ -581,11 +709,14 @@ class Vault:
             )
             raise RuntimeError(f"Failed to copy file to vault: {e}") from None
 
-        # Generate thumbnail for images
-        thumbnail_generated = await self._generate_thumbnail(target_path, file_hash)
-
         # Get file size
         size_bytes = safe_get_file_size(target_path)
+        self._adjust_stats("content", 1, size_bytes)
+
+        # Generate thumbnail for images and PDFs, unless deferred to first use
+        thumbnail_generated = False
+        if not self.thumbnail_service.lazy:
+            thumbnail_generated = await self._generate_thumbnail(target_path, file_hash)
 
         log_event(
             "vault_file_stored",
@@ -635,6 +766,19 @@ class Vault:
         matching_files = list(file_dir.glob(f"{file_stem}.*"))
         return len(matching_files) > 0
 
+    async def list_content_files(self) -> Dict[str, Dict[str, Any]]:
+        """
+        List every stored content file, keyed by file hash.
+
+        Walks the content directory once in a worker thread, so callers that
+        need to check many hashes can compare against the returned keys
+        instead of calling file_exists per document.
+
+        Returns:
+            Dict mapping file hash to hash, extension, path and size_bytes
+        """
+        return await asyncio.to_thread(scan_content_files, self.content_dir)
+
     async def get_file_path(self, file_hash: str, extension: str) -> Optional[Path]:
         """
         Get the path to a stored file if it exists in the vault.
@@ -651,33 +795,63 @@ class Vault:
 
     async def get_thumbnail_path(self, file_hash: str) -> Optional[Path]:
         """
-        Get the path to a file's thumbnail image if it exists.
+        Get the path to a file's thumbnail image, rendering it if missing.
+
+        A missing thumbnail (lazy mode, or a file stored before its type was
+        supported) is rendered from the stored content on first request and
+        kept for later requests.
 
         Args:
             file_hash: SHA256 hash of the original file
 
         Returns:
-            Path to the thumbnail file if it exists, None otherwise
+            Path to the thumbnail file, or None if the file is not stored or
+            has no thumbnail
         """
         thumbnail_path = self._get_thumbnail_path(file_hash)
-        return thumbnail_path if thumbnail_path.exists() else None
+        if thumbnail_path.exists():
+            return thumbnail_path
+
+        source_path = await asyncio.to_thread(self._find_content_file, file_hash)
+        if source_path is None or not self.thumbnail_service.supports(source_path):
+            return None
+
+        generated = await self._generate_thumbnail(source_path, file_hash)
+        return thumbnail_path if generated else None
+
+    def _find_content_file(self, file_hash: str) -> Optional[Path]:
+        """Find the stored content file for a hash, whatever its extension."""
+        content_dir = self._get_content_directory(file_hash)
+        if not content_dir.exists():
+            return None
+        return next(content_dir.glob(f"{file_hash[4:]}.*"), None)
 
     async def _generate_thumbnail(self, file_path: Path, file_hash: str) -> bool:
         """
-        Generate a thumbnail for an image file (internal method).
+        Generate a thumbnail for an image or PDF file (internal method).
 
-        Creates a 256x256 pixel WEBP thumbnail for supported image formats.
-        Skips generation if thumbnail already exists or file is not an image.
+        Renders a WEBP thumbnail (256x256 by default) on the thumbnail
+        service's worker pool and counts it in the vault statistics. Skips
+        generation if the thumbnail already exists or the type is unsupported.
 
         Args:
-            file_path: Path to the original image file
+            file_path: Path to the original image or PDF file
             file_hash: SHA256 hash of the original file
 
         Returns:
             True if thumbnail was generated, False otherwise
         """
         thumbnail_path = self._get_thumbnail_path(file_hash)
-        generated = await generate_image_thumbnail(file_path, thumbnail_path)
+        if thumbnail_path.exists():
+            return True
+
+        generated = await self.thumbnail_service.render(
+            file_path,
+            thumbnail_path,
+            on_rendered=lambda path: self._adjust_stats(
+                "thumbnails", 1, safe_get_file_size(path)
+            ),
+        )
 
         if generated:
             log_event(
@@ -726,6 +900,7 @@ class Vault:
             try:
                 file_path.unlink()
                 deleted = True
+                self._adjust_stats("content", -1, -content_size)
                 log_event(
                     "vault_content_deleted",
                     {
@@ -749,6 +924,7 @@ class Vault:
         if thumbnail_existed:
             try:
                 thumbnail_path.unlink()
+                self._adjust_stats("thumbnails", -1, -thumbnail_size)
                 log_event(
                     "vault_thumbnail_deleted",
                     {
@@ -818,6 +994,11 @@ class Vault:
         )
 
         cleanup_result = await cleanup_old_temp_files(self.temp_dir)
+        self._adjust_stats(
+            "temp",
+            -cleanup_result.get("cleaned_files", 0),
+            -cleanup_result.get("cleaned_bytes", 0),
+        )
 
         if cleanup_result.get("cleaned_files", 0) > 0:
             log_event(
@@ -3,6 +3,7 @@ Utility functions for vault operations.
 """
 
 import hashlib
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -165,43 +166,111 @@ async def cleanup_empty_directories(
             pass
 
 
-async def generate_image_thumbnail(
+def is_pdf_file(file_path: Path) -> bool:
+    """Check if file is a PDF, whose first page can be thumbnailed."""
+    return file_path.suffix.lower() == ".pdf"
+
+
+def is_thumbnail_supported(file_path: Path) -> bool:
+    """Check if a thumbnail can be generated for the file."""
+    return is_image_file(file_path) or is_pdf_file(file_path)
+
+
+def _save_thumbnail(img: Image.Image, thumbnail_path: Path, quality: int) -> None:
+    """Write a thumbnail atomically, so readers never see a partial file."""
+    if img.mode not in ("RGB", "L"):
+        img = img.convert("RGB")
+
+    thumbnail_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = thumbnail_path.with_name(f".{thumbnail_path.name}.{os.getpid()}.tmp")
+    try:
+        img.save(temp_path, "WEBP", quality=quality, optimize=True)
+        os.replace(temp_path, thumbnail_path)
+    finally:
+        if temp_path.exists():
+            temp_path.unlink()
+
+
+def render_image_thumbnail(
+    source_path: Path,
+    thumbnail_path: Path,
+    size: tuple[int, int] = (256, 256),
+    quality: int = 80,
+) -> bool:
+    """
+    Render an image thumbnail (blocking; run off the event loop).
+
+    JPEGs are decoded at a reduced scale with Image.draft, so a large photo
+    is never fully decoded, and the remaining downscale uses reduce() before
+    the final LANCZOS resample.
+    """
+    with Image.open(source_path) as img:
+        # No-op for formats without reduced-scale decoding
+        img.draft("RGB", size)
+        if img.mode in ("RGBA", "LA", "P"):
+            img = img.convert("RGB")
+        img.thumbnail(size, Image.Resampling.LANCZOS, reducing_gap=2.0)
+        _save_thumbnail(img, thumbnail_path, quality)
+    return True
+
+
+def render_pdf_thumbnail(
     source_path: Path,
     thumbnail_path: Path,
     size: tuple[int, int] = (256, 256),
     quality: int = 80,
 ) -> bool:
-    """Generate a thumbnail for an image file."""
-    if not is_image_file(source_path):
+    """
+    Render a thumbnail of a PDF's first page (blocking; run off the event loop).
+
+    Requires pdf2image and poppler; returns False when they are unavailable.
+    """
+    try:
+        from pdf2image import convert_from_path
+    except ImportError:
         return False
 
-    # Skip if thumbnail already exists
-    if thumbnail_path.exists():
-        return True
+    # Rasterize only the first page, directly at thumbnail scale
+    pages = convert_from_path(
+        str(source_path),
+        first_page=1,
+        last_page=1,
+        size=max(size),
+        fmt="ppm",
+    )
+    if not pages:
+        return False
 
-    try:
-        # Create thumbnail directory
-        thumbnail_path.parent.mkdir(parents=True, exist_ok=True)
+    page = pages[0]
+    page.thumbnail(size, Image.Resampling.LANCZOS)
+    _save_thumbnail(page, thumbnail_path, quality)
+    return True
 
-        with Image.open(source_path) as img:
-            # Convert to RGB if necessary
-            if img.mode in ("RGBA", "LA", "P"):
-                img = img.convert("RGB")
 
-            # Create thumbnail
-            img.thumbnail(size, Image.Resampling.LANCZOS)
-            img.save(thumbnail_path, "WEBP", quality=quality, optimize=True)
+def render_thumbnail(
+    source_path: Path,
+    thumbnail_path: Path,
+    size: tuple[int, int] = (256, 256),
+    quality: int = 80,
+) -> bool:
+    """
+    Render a thumbnail for an image or PDF (blocking; run off the event loop).
 
+    Returns:
+        True if the thumbnail exists afterwards, False if the file type is
+        unsupported or rendering failed
+    """
+    if thumbnail_path.exists():
         return True
 
+    try:
+        if is_image_file(source_path):
+            return render_image_thumbnail(source_path, thumbnail_path, size, quality)
+        if is_pdf_file(source_path):
+            return render_pdf_thumbnail(source_path, thumbnail_path, size, quality)
     except Exception:
-        # Clean up partial thumbnail file if it exists
-        if thumbnail_path.exists():
-            try:
-                thumbnail_path.unlink()
-            except OSError:
-                pass
         return False
+    return False
 
 
 def bytes_to_mb(bytes_value: int) -> float:
@@ -243,6 +312,48 @@ async def cleanup_old_temp_files(temp_dir: Path, hours_old: int = 24) -> Dict[st
         return {"cleaned_files": 0, "cleaned_bytes": 0, "errors": [str(e)]}
 
 
+def scan_content_files(content_dir: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Index every stored content file by hash in a single directory walk.
+
+    Content files live at ``content/XX/YY/<rest>.<ext>``, so the hash is
+    rebuilt from the two directory names and the file stem. Walks with
+    ``os.scandir`` to reuse the directory entries' cached stat data.
+    Blocking; call through ``asyncio.to_thread`` from async code.
+    """
+    files: Dict[str, Dict[str, Any]] = {}
+
+    if not content_dir.exists():
+        return files
+
+    with os.scandir(content_dir) as level1:
+        for dir1 in level1:
+            if not dir1.is_dir() or len(dir1.name) != 2:
+                continue
+            with os.scandir(dir1.path) as level2:
+                for dir2 in level2:
+                    if not dir2.is_dir() or len(dir2.name) != 2:
+                        continue
+                    with os.scandir(dir2.path) as entries:
+                        for entry in entries:
+                            if not entry.is_file() or entry.name.startswith("."):
+                                continue
+                            stem, _, extension = entry.name.partition(".")
+                            file_hash = f"{dir1.name}{dir2.name}{stem}"
+                            try:
+                                size_bytes = entry.stat().st_size
+                            except OSError:
+                                size_bytes = 0
+                            files[file_hash] = {
+                                "hash": file_hash,
+                                "extension": extension,
+                                "path": entry.path,
+                                "size_bytes": size_bytes,
+                            }
+
+    return files
+
+
 def find_files_by_hash_pattern(directory: Path, file_hash: str) -> List[Path]:
     """Find all files matching a hash pattern in a directory."""
     if not directory.exists():
@@ -258,6 +369,36 @@ def find_files_by_hash_pattern(directory: Path, file_hash: str) -> List[Path]:
     return matching_files
 
 
+def scan_directory_stats(directory: Path) -> Dict[str, int]:
+    """
+    Count files and total size in a directory tree using os.scandir.
+
+    Blocking; call through ``asyncio.to_thread`` from async code.
+    """
+    stats = {"files": 0, "bytes": 0}
+
+    if not directory.exists():
+        return stats
+
+    pending = [str(directory)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file():
+                            stats["files"] += 1
+                            stats["bytes"] += entry.stat().st_size
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+    return stats
+
+
 async def get_comprehensive_directory_stats(
     directories: Dict[str, Path],
 ) -> Dict[str, Any]:
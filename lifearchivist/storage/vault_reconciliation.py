@@ -3,13 +3,22 @@ Vault reconciliation service for maintaining data consistency.
 
 This module ensures that Redis/Qdrant metadata stays in sync with actual vault files.
 The policy is simple: if a vault file is missing, remove the orphaned metadata.
+
+Reconciliation walks the vault's content directory once and compares stored
+hashes against document metadata fetched in pipelined batches. Progress is
+checkpointed after every batch, so an interrupted pass resumes where it left
+off instead of starting over.
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from lifearchivist.utils.logging import log_event
 
+# Metadata fields needed to check and report on a document
+RECONCILIATION_FIELDS = ["file_hash", "title", "original_path"]
+
 
 class VaultReconciliationService:
     """
@@ -19,7 +28,18 @@ class VaultReconciliationService:
     remove the corresponding metadata from Redis and Qdrant.
     """
 
-    def __init__(self, vault, doc_tracker, qdrant_client):
+    CHECKPOINT_NAME = "vault_reconciliation"
+    BATCH_SIZE = 500
+    CLEANUP_CONCURRENCY = 8
+
+    def __init__(
+        self,
+        vault,
+        doc_tracker,
+        qdrant_client,
+        batch_size: Optional[int] = None,
+        cleanup_concurrency: Optional[int] = None,
+    ):
         """
         Initialize the reconciliation service.
 
@@ -27,69 +47,90 @@ class VaultReconciliationService:
             vault: Vault instance for file operations
             doc_tracker: Document tracker (Redis) for metadata
             qdrant_client: Qdrant client for vector operations
+            batch_size: Documents fetched per metadata pipeline round-trip
+            cleanup_concurrency: Maximum orphan cleanups running at once
         """
         self.vault = vault
         self.doc_tracker = doc_tracker
         self.qdrant_client = qdrant_client
+        self.batch_size = batch_size or self.BATCH_SIZE
+        self.cleanup_concurrency = cleanup_concurrency or self.CLEANUP_CONCURRENCY
 
-    async def reconcile(self) -> Dict[str, Any]:
+    async def reconcile(self, resume: bool = True) -> Dict[str, Any]:
         """
         Reconcile vault files with metadata stores.
 
         Checks all documents in Redis and removes metadata for any
         documents whose vault files are missing.
 
+        Document IDs are processed in sorted order and the last ID of each
+        completed batch is stored as a checkpoint. With ``resume`` enabled,
+        a pass picks up after the stored checkpoint; the checkpoint is
+        cleared once a pass completes.
+
+        Args:
+            resume: Continue from the last checkpoint instead of starting over
+
         Returns:
             Dict with reconciliation statistics:
                 - checked: Number of documents checked
                 - cleaned: Number of orphaned metadata entries removed
                 - errors: Number of errors encountered
                 - cleaned_documents: List of cleaned document info
+                - resumed_from: Checkpoint the pass resumed after, if any
         """
-        cleaned_documents = []
-        errors = []
+        cleaned_documents: List[Dict[str, Any]] = []
+        errors: List[Dict[str, Any]] = []
+        checked = 0
 
         try:
-            # Get all documents from Redis
-            all_doc_ids = await self.doc_tracker.get_all_document_ids()
+            checkpoint = (
+                await self.doc_tracker.get_checkpoint(self.CHECKPOINT_NAME)
+                if resume
+                else None
+            )
+
+            vault_files, all_doc_ids = await asyncio.gather(
+                self.vault.list_content_files(),
+                self.doc_tracker.get_all_document_ids(),
+            )
+            stored_hashes = set(vault_files)
+
+            pending_ids = [
+                doc_id
+                for doc_id in sorted(all_doc_ids)
+                if checkpoint is None or doc_id > checkpoint
+            ]
 
             log_event(
                 "vault_reconciliation_started",
-                {"total_documents": len(all_doc_ids)},
+                {
+                    "total_documents": len(all_doc_ids),
+                    "pending_documents": len(pending_ids),
+                    "vault_files": len(stored_hashes),
+                    "resumed_from": checkpoint,
+                },
             )
 
-            for doc_id in all_doc_ids:
-                try:
-                    # Check if this document's file exists
-                    cleanup_result = await self._check_and_cleanup_document(doc_id)
-
-                    if cleanup_result:
-                        cleaned_documents.append(cleanup_result)
-
-                except Exception as e:
-                    errors.append(
-                        {
-                            "document_id": doc_id,
-                            "error": str(e),
-                            "error_type": type(e).__name__,
-                        }
-                    )
-                    log_event(
-                        "reconciliation_document_error",
-                        {
-                            "document_id": doc_id,
-                            "error": str(e),
-                            "error_type": type(e).__name__,
-                        },
-                        level=logging.ERROR,
-                    )
+            semaphore = asyncio.Semaphore(self.cleanup_concurrency)
+
+            for start in range(0, len(pending_ids), self.batch_size):
+                batch = pending_ids[start : start + self.batch_size]
+                await self._reconcile_batch(
+                    batch, stored_hashes, semaphore, cleaned_documents, errors
+                )
+                checked += len(batch)
+                await self.doc_tracker.set_checkpoint(self.CHECKPOINT_NAME, batch[-1])
+
+            await self.doc_tracker.set_checkpoint(self.CHECKPOINT_NAME, None)
 
             result = {
-                "checked": len(all_doc_ids),
+                "checked": checked,
                 "cleaned": len(cleaned_documents),
                 "errors": len(errors),
                 "cleaned_documents": cleaned_documents,
                 "error_details": errors if errors else None,
+                "resumed_from": checkpoint,
             }
 
             # Log completion
@@ -97,7 +138,7 @@ class VaultReconciliationService:
                 log_event(
                     "vault_reconciliation_completed_with_cleanup",
                     {
-                        "checked": len(all_doc_ids),
+                        "checked": checked,
                         "cleaned": len(cleaned_documents),
                         "errors": len(errors),
                     },
@@ -107,7 +148,7 @@ class VaultReconciliationService:
                 log_event(
                     "vault_reconciliation_completed",
                     {
-                        "checked": len(all_doc_ids),
+                        "checked": checked,
                         "status": "consistent",
                         "errors": len(errors),
                     },
@@ -118,48 +159,105 @@ class VaultReconciliationService:
         except Exception as e:
             log_event(
                 "vault_reconciliation_failed",
-                {"error": str(e), "error_type": type(e).__name__},
+                {
+                    "checked": checked,
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                },
                 level=logging.ERROR,
             )
             return {
-                "checked": 0,
-                "cleaned": 0,
-                "errors": 1,
+                "checked": checked,
+                "cleaned": len(cleaned_documents),
+                "errors": len(errors) + 1,
+                "cleaned_documents": cleaned_documents,
                 "error": str(e),
                 "error_type": type(e).__name__,
             }
 
-    async def _check_and_cleanup_document(
-        self, doc_id: str
+    async def _reconcile_batch(
+        self,
+        batch: List[str],
+        stored_hashes: Set[str],
+        semaphore: asyncio.Semaphore,
+        cleaned_documents: List[Dict[str, Any]],
+        errors: List[Dict[str, Any]],
+    ) -> None:
+        """
+        Check one batch of documents against the vault hash set.
+
+        Metadata for the whole batch is fetched in a single pipeline, and
+        documents whose hash is not in the vault are cleaned up concurrently.
+        """
+        metadata_by_id = await self.doc_tracker.get_metadata_fields_batch(
+            batch, RECONCILIATION_FIELDS
+        )
+
+        orphaned = []
+        for doc_id in batch:
+            metadata = metadata_by_id.get(doc_id)
+            if not metadata:
+                continue
+
+            file_hash = metadata.get("file_hash")
+            if not file_hash:
+                log_event(
+                    "document_missing_file_hash",
+                    {"document_id": doc_id},
+                    level=logging.WARNING,
+                )
+                continue
+
+            if file_hash not in stored_hashes:
+                orphaned.append((doc_id, metadata))
+
+        if not orphaned:
+            return
+
+        async def cleanup(doc_id: str, metadata: Dict[str, Any]):
+            async with semaphore:
+                return await self._cleanup_document(doc_id, metadata)
+
+        results = await asyncio.gather(
+            *(cleanup(doc_id, metadata) for doc_id, metadata in orphaned),
+            return_exceptions=True,
+        )
+
+        for (doc_id, _), outcome in zip(orphaned, results, strict=True):
+            if isinstance(outcome, BaseException):
+                error = {
+                    "document_id": doc_id,
+                    "error": str(outcome),
+                    "error_type": type(outcome).__name__,
+                }
+                errors.append(error)
+                log_event(
+                    "reconciliation_document_error",
+                    error,
+                    level=logging.ERROR,
+                )
+            elif outcome:
+                cleaned_documents.append(outcome)
+
+    async def _cleanup_document(
+        self, doc_id: str, metadata: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
         """
-        Check if a document's vault file exists and clean up if missing.
+        Remove metadata for a document whose vault file is missing.
+
+        The file is checked again before anything is deleted, since it may
+        have been stored by a concurrent import after the vault was walked.
 
         Args:
-            doc_id: Document ID to check
+            doc_id: Document ID to clean up
+            metadata: Reconciliation fields fetched for the document
 
         Returns:
             Dict with cleanup info if document was cleaned, None otherwise
         """
-        # Get metadata to find file hash
-        metadata = await self.doc_tracker.get_full_metadata(doc_id)
-        if not metadata:
-            return None
+        file_hash = metadata["file_hash"]
 
-        file_hash = metadata.get("file_hash")
-        if not file_hash:
-            log_event(
-                "document_missing_file_hash",
-                {"document_id": doc_id},
-                level=logging.WARNING,
-            )
-            return None
-
-        # Check if vault file exists
-        file_exists = await self.vault.file_exists(file_hash)
-
-        if file_exists:
-            # File exists, no cleanup needed
+        if await self.vault.file_exists(file_hash):
             return None
 
         # File missing - clean up metadata
@@ -238,26 +336,27 @@ class VaultReconciliationService:
         Returns:
             List of orphaned file info dicts
         """
-        orphaned_files = []
-
         try:
-            # Get all file hashes from vault
-            vault_files = await self.vault.list_all_files()
-
-            # Get all file hashes from Redis
-            all_doc_ids = await self.doc_tracker.get_all_document_ids()
-            known_hashes = set()
+            vault_files, all_doc_ids = await asyncio.gather(
+                self.vault.list_content_files(),
+                self.doc_tracker.get_all_document_ids(),
+            )
 
-            for doc_id in all_doc_ids:
-                metadata = await self.doc_tracker.get_full_metadata(doc_id)
-                if metadata and metadata.get("file_hash"):
-                    known_hashes.add(metadata["file_hash"])
+            metadata_by_id = await self.doc_tracker.get_metadata_fields_batch(
+                all_doc_ids, ["file_hash"], batch_size=self.batch_size
+            )
+            known_hashes = {
+                metadata["file_hash"]
+                for metadata in metadata_by_id.values()
+                if metadata.get("file_hash")
+            }
 
             # Find files not in Redis
-            for file_info in vault_files:
-                file_hash = file_info.get("hash")
-                if file_hash and file_hash not in known_hashes:
-                    orphaned_files.append(file_info)
+            orphaned_files = [
+                file_info
+                for file_hash, file_info in vault_files.items()
+                if file_hash not in known_hashes
+            ]
 
             log_event(
                 "orphaned_files_check_completed",
@@ -0,0 +1,52 @@
+"""
+Version fingerprint for the rule-based classifiers.
+
+Cached classification results are only valid for the rules and matching
+code that produced them. The fingerprint hashes the source of the theme and
+subtheme classifier packages (rules included) and the shared matching
+modules, so editing any rule or classifier changes it and old cache entries
+stop being read.
+"""
+
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+
+_TOOLS_DIR = Path(__file__).parent
+
+# Packages and modules whose source determines classification results
+_CLASSIFIER_SOURCES = (
+    "theme_classifier",
+    "subtheme_classifier",
+    "pattern_set.py",
+    "phrase_matcher.py",
+    "text_sampling.py",
+)
+
+
+@lru_cache(maxsize=None)
+def _source_digest() -> str:
+    digest = hashlib.sha256()
+    for name in _CLASSIFIER_SOURCES:
+        path = _TOOLS_DIR / name
+        files = sorted(path.rglob("*.py")) if path.is_dir() else [path]
+        for file in files:
+            digest.update(file.relative_to(_TOOLS_DIR).as_posix().encode())
+            digest.update(b"\0")
+            digest.update(file.read_bytes())
+    return digest.hexdigest()
+
+
+def classification_rules_version(sample_chars: int = 0) -> str:
+    """
+    Get a short fingerprint of the classifier rules and configuration.
+
+    Args:
+        sample_chars: Configured classification sampling budget, which also
+            affects results for large documents
+
+    Returns:
+        16-character hex fingerprint
+    """
+    digest = hashlib.sha256(f"{_source_digest()}:{sample_chars}".encode())
+    return digest.hexdigest()[:16]
@@ -0,0 +1,438 @@
+"""
+Benchmarks for the rule-based theme and subtheme classifiers.
+
+Runs against a synthetic document of a given size, or the text of a real
+file, and prints JSON results:
+
+    python -m lifearchivist.tools.classifier_benchmark phrases --size-mb 4
+    python -m lifearchivist.tools.classifier_benchmark phrases --file notes.txt
+    python -m lifearchivist.tools.classifier_benchmark patterns --size-mb 0.25
+    python -m lifearchivist.tools.classifier_benchmark batch --documents 64
+    python -m lifearchivist.tools.classifier_benchmark sampling --corpus samples/
+
+A labeled corpus for the sampling benchmark is a directory with one
+subdirectory per expected theme (e.g. ``samples/Financial/*.txt``).
+"""
+
+import argparse
+import json
+import random
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from lifearchivist.tools.pattern_set import PatternSet
+from lifearchivist.tools.phrase_matcher import DEFAULT_BACKEND, PhraseMatcher
+from lifearchivist.tools.subtheme_classifier.classifier_pool import ClassifierPool
+from lifearchivist.tools.subtheme_classifier.subtheme_classifier import (
+    get_subtheme_classifier,
+)
+from lifearchivist.tools.text_sampling import TextSampler
+from lifearchivist.tools.theme_classifier.rules import (
+    PRIMARY_DEFINITIVE_PHRASE_DEFINITIONS,
+)
+from lifearchivist.tools.theme_classifier.theme_classifier import ThemeClassifier
+
+# Filler vocabulary for synthetic documents; common words that appear in
+# real documents without matching any definitive phrase on their own
+_FILLER_WORDS = (
+    "the account balance payment statement period total amount due we are "
+    "pleased to inform you that your request has been processed please "
+    "review the enclosed information and contact us with any questions "
+    "date page of for and to in on at by with from this is a"
+).split()
+
+
+def build_benchmark_text(
+    size_mb: float, phrases: Optional[List[str]] = None, seed: int = 0
+) -> str:
+    """
+    Build a synthetic lowercase document of roughly the given size.
+
+    Args:
+        size_mb: Approximate document size in megabytes
+        phrases: Phrases to sprinkle through the text so some rules match
+        seed: Random seed, so runs are comparable
+
+    Returns:
+        Generated document text
+    """
+    rng = random.Random(seed)
+    target = int(size_mb * 1024 * 1024)
+    parts: List[str] = []
+    length = 0
+    while length < target:
+        if phrases and rng.random() < 0.0005:
+            word = rng.choice(phrases)
+        else:
+            word = rng.choice(_FILLER_WORDS)
+        parts.append(word)
+        length += len(word) + 1
+    return " ".join(parts)
+
+
+def _time_call(func: Callable[[], Any], rounds: int) -> float:
+    """Return the mean wall time of a call in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return round((time.perf_counter() - start) * 1000 / rounds, 2)
+
+
+def _compare_matchers(phrases: Set[str], text: str, rounds: int) -> Dict[str, Any]:
+    """Time per-phrase substring scans against the compiled matcher."""
+    scan = PhraseMatcher(phrases, backend="scan")
+    matcher = PhraseMatcher(phrases)
+
+    scan_ms = _time_call(lambda: scan.find_all(text), rounds)
+    matcher_ms = _time_call(lambda: matcher.find_all(text), rounds)
+
+    return {
+        "phrases": len(scan.phrases),
+        "backend": matcher.backend,
+        "phrases_found": len(matcher.find_all(text)),
+        "results_match": scan.find_all(text) == matcher.find_all(text),
+        "scan_ms": scan_ms,
+        "matcher_ms": matcher_ms,
+        "speedup": round(scan_ms / matcher_ms, 2) if matcher_ms else None,
+    }
+
+
+def _compare_pattern_search(
+    pattern_set: PatternSet, text: str, rounds: int
+) -> Dict[str, Any]:
+    """Time searching every regex against the literal-prefiltered set."""
+
+    def search_each():
+        return {pattern for pattern in pattern_set.patterns if pattern.search(text)}
+
+    search_ms = _time_call(search_each, rounds)
+    prefiltered_ms = _time_call(lambda: pattern_set.search_all(text), rounds)
+
+    return {
+        "patterns": len(pattern_set.patterns),
+        "prefiltered_patterns": pattern_set.filtered_count,
+        "patterns_searched": len(pattern_set.candidates(text)),
+        "patterns_matched": len(pattern_set.search_all(text)),
+        "results_match": search_each() == pattern_set.search_all(text),
+        "search_each_ms": search_ms,
+        "prefiltered_ms": prefiltered_ms,
+        "speedup": round(search_ms / prefiltered_ms, 2) if prefiltered_ms else None,
+    }
+
+
+def benchmark_pattern_prefilter(
+    text: Optional[str] = None, size_mb: float = 0.25, rounds: int = 1
+) -> Dict[str, Any]:
+    """
+    Compare searching every classifier regex with literal-prefiltered search.
+
+    Args:
+        text: Document text to use (a synthetic document is built if omitted)
+        size_mb: Size of the synthetic document in megabytes
+        rounds: Timed repetitions per measurement
+
+    Returns:
+        Per-classifier timings and speedups
+    """
+    theme_classifier = ThemeClassifier()
+    subtheme_classifier = get_subtheme_classifier()
+    subtheme_classifier.precompile()
+
+    pattern_sets: Dict[str, PatternSet] = {
+        "theme_unique": theme_classifier.unique_pattern_set,
+        "theme_structure": theme_classifier.structure_pattern_set,
+    }
+    phrases: Set[str] = set(theme_classifier.primary_definitive_phrases)
+    for theme in subtheme_classifier.get_supported_themes():
+        classifier = subtheme_classifier._get_classifier(theme)
+        if classifier:
+            pattern_sets[theme] = classifier.pattern_set
+            phrases.update(classifier.phrase_matcher.phrases)
+
+    if text is None:
+        text = build_benchmark_text(size_mb, sorted(phrases))
+    text_lower = text.lower()
+
+    return {
+        "text_mb": round(len(text_lower) / (1024 * 1024), 2),
+        "rounds": rounds,
+        "classifiers": {
+            name: _compare_pattern_search(pattern_set, text_lower, rounds)
+            for name, pattern_set in pattern_sets.items()
+        },
+    }
+
+
+def benchmark_phrase_matching(
+    text: Optional[str] = None, size_mb: float = 4.0, rounds: int = 3
+) -> Dict[str, Any]:
+    """
+    Compare per-phrase substring scanning with single-pass phrase matching.
+
+    For the theme classifier and each subtheme classifier, times finding the
+    classifier's phrases in the text both ways, checks that both find the
+    same phrases, and times a full classification with the matcher in place.
+
+    Args:
+        text: Document text to use (a synthetic document is built if omitted)
+        size_mb: Size of the synthetic document in megabytes
+        rounds: Timed repetitions per measurement
+
+    Returns:
+        Automaton backend in use, and per-classifier timings and speedups
+    """
+    theme_classifier = ThemeClassifier()
+    subtheme_classifier = get_subtheme_classifier()
+    subtheme_classifier.precompile()
+
+    phrase_sets: Dict[str, Set[str]] = {
+        "theme": set(theme_classifier.primary_definitive_phrases)
+    }
+    for theme in subtheme_classifier.get_supported_themes():
+        classifier = subtheme_classifier._get_classifier(theme)
+        if classifier:
+            phrase_sets[theme] = set(classifier.phrase_matcher.phrases)
+
+    if text is None:
+        all_phrases = sorted(set().union(*phrase_sets.values()))
+        text = build_benchmark_text(size_mb, all_phrases)
+    text_lower = text.lower()
+
+    results: Dict[str, Any] = {
+        # "automaton" means pyahocorasick is missing and the pure-Python
+        # fallback ran
+        "matcher_backend": DEFAULT_BACKEND,
+        "text_mb": round(len(text_lower) / (1024 * 1024), 2),
+        "rounds": rounds,
+        "classifiers": {},
+    }
+
+    for name, phrases in phrase_sets.items():
+        comparison = _compare_matchers(phrases, text_lower, rounds)
+        if name == "theme":
+            comparison["classify_ms"] = _time_call(
+                lambda: theme_classifier.classify(text), rounds
+            )
+        else:
+            comparison["classify_ms"] = _time_call(
+                lambda theme=name: subtheme_classifier.classify(text, theme), rounds
+            )
+        results["classifiers"][name] = comparison
+
+    return results
+
+
+def benchmark_batch_classification(
+    documents: int = 64, size_mb: float = 0.05, processes: int = 0
+) -> Dict[str, Any]:
+    """
+    Compare in-process batch classification with the process pool.
+
+    Args:
+        documents: Number of synthetic documents, spread across themes
+        size_mb: Size of each synthetic document in megabytes
+        processes: Pool worker processes (0 = one per CPU core)
+
+    Returns:
+        Timings for in-process and pooled classification
+    """
+    subtheme_classifier = get_subtheme_classifier()
+    subtheme_classifier.precompile()
+    themes = subtheme_classifier.get_supported_themes()
+
+    phrases: Set[str] = set()
+    for theme in themes:
+        classifier = subtheme_classifier._get_classifier(theme)
+        if classifier:
+            phrases.update(classifier.phrase_matcher.phrases)
+
+    texts = [
+        build_benchmark_text(size_mb, sorted(phrases), seed=index)
+        for index in range(documents)
+    ]
+    primary_themes = [themes[index % len(themes)] for index in range(documents)]
+    items = [
+        (text, theme, None) for text, theme in zip(texts, primary_themes, strict=True)
+    ]
+
+    in_process_ms = _time_call(
+        lambda: subtheme_classifier.classify_many(texts, primary_themes), 1
+    )
+
+    pool = ClassifierPool(processes=processes)
+    try:
+        startup_ms = _time_call(lambda: pool.classify_many(items), 1)
+        pool_ms = _time_call(lambda: pool.classify_many(items), 1)
+    finally:
+        pool.shutdown()
+
+    return {
+        "documents": documents,
+        "document_mb": size_mb,
+        "processes": pool.processes,
+        "in_process_ms": in_process_ms,
+        "pool_first_batch_ms": startup_ms,
+        "pool_ms": pool_ms,
+        "speedup": round(in_process_ms / pool_ms, 2) if pool_ms else None,
+    }
+
+
+def load_labeled_corpus(corpus_dir: Path) -> List[Tuple[str, str]]:
+    """
+    Load (expected theme, text) pairs from a directory of theme folders.
+
+    Args:
+        corpus_dir: Directory containing one subdirectory per theme
+
+    Returns:
+        Labeled documents, sorted by path
+    """
+    return [
+        (path.parent.name, path.read_text(errors="ignore"))
+        for path in sorted(corpus_dir.glob("*/*.txt"))
+    ]
+
+
+def build_labeled_corpus(
+    documents_per_theme: int, size_mb: float
+) -> List[Tuple[str, str]]:
+    """
+    Build synthetic labeled documents seeded with each theme's phrases.
+
+    Args:
+        documents_per_theme: Documents generated for each theme
+        size_mb: Size of each document in megabytes
+
+    Returns:
+        (expected theme, text) pairs
+    """
+    corpus = []
+    for theme, phrases in PRIMARY_DEFINITIVE_PHRASE_DEFINITIONS.items():
+        theme_phrases = sorted(phrase for phrase, _ in phrases)
+        for index in range(documents_per_theme):
+            text = build_benchmark_text(size_mb, theme_phrases, seed=index)
+            corpus.append((theme, text))
+    return corpus
+
+
+def benchmark_sampling(
+    corpus: List[Tuple[str, str]], budgets: List[int]
+) -> Dict[str, Any]:
+    """
+    Measure theme classification accuracy and latency per sampling budget.
+
+    Accuracy is the share of documents classified as their labeled theme;
+    agreement is the share classified the same as with the whole text.
+
+    Args:
+        corpus: (expected theme, text) pairs
+        budgets: Character budgets to compare (0 = whole text)
+
+    Returns:
+        Accuracy, agreement and latency for each budget
+    """
+    results: Dict[str, Any] = {
+        "documents": len(corpus),
+        "mean_document_mb": (
+            round(sum(len(text) for _, text in corpus) / len(corpus) / (1024 * 1024), 2)
+            if corpus
+            else 0
+        ),
+        "budgets": {},
+    }
+
+    baseline: Optional[List[str]] = None
+    for budget in [0] + [budget for budget in budgets if budget]:
+        classifier = ThemeClassifier(sampler=TextSampler(max_chars=budget))
+        themes: List[str] = []
+        latencies: List[float] = []
+        for _, text in corpus:
+            start = time.perf_counter()
+            theme, _, _, _ = classifier.classify(text)
+            latencies.append((time.perf_counter() - start) * 1000)
+            themes.append(theme)
+
+        if baseline is None:
+            baseline = themes
+
+        correct = sum(
+            theme == label for theme, (label, _) in zip(themes, corpus, strict=True)
+        )
+        agreed = sum(a == b for a, b in zip(themes, baseline, strict=True))
+        latencies.sort()
+        results["budgets"][str(budget or "full")] = {
+            "accuracy": round(correct / len(corpus), 3) if corpus else None,
+            "agreement_with_full": round(agreed / len(corpus), 3) if corpus else None,
+            "mean_ms": round(sum(latencies) / len(latencies), 2) if latencies else 0,
+            "max_ms": round(latencies[-1], 2) if latencies else 0,
+        }
+
+    return results
+
+
+def main() -> None:
+    """Command line entry point for classifier benchmarks."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark the rule-based document classifiers."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    phrases = subparsers.add_parser(
+        "phrases", help="Compare per-phrase scans with single-pass phrase matching"
+    )
+    phrases.add_argument("--size-mb", type=float, default=4.0)
+    phrases.add_argument("--file", type=Path, default=None)
+    phrases.add_argument("--rounds", type=int, default=3)
+
+    patterns = subparsers.add_parser(
+        "patterns", help="Compare per-regex search with literal-prefiltered search"
+    )
+    patterns.add_argument("--size-mb", type=float, default=0.25)
+    patterns.add_argument("--file", type=Path, default=None)
+    patterns.add_argument("--rounds", type=int, default=1)
+
+    batch = subparsers.add_parser(
+        "batch", help="Compare in-process batch classification with the process pool"
+    )
+    batch.add_argument("--documents", type=int, default=64)
+    batch.add_argument("--size-mb", type=float, default=0.05)
+    batch.add_argument("--processes", type=int, default=0)
+
+    sampling = subparsers.add_parser(
+        "sampling", help="Compare accuracy and latency across sampling budgets"
+    )
+    sampling.add_argument("--corpus", type=Path, default=None)
+    sampling.add_argument("--documents", type=int, default=4)
+    sampling.add_argument("--size-mb", type=float, default=4.0)
+    sampling.add_argument(
+        "--budgets", type=int, nargs="+", default=[50_000, 200_000, 1_000_000]
+    )
+
+    args = parser.parse_args()
+
+    if args.command == "sampling":
+        corpus = (
+            load_labeled_corpus(args.corpus)
+            if args.corpus
+            else build_labeled_corpus(args.documents, args.size_mb)
+        )
+        result = benchmark_sampling(corpus, args.budgets)
+    elif args.command == "batch":
+        result = benchmark_batch_classification(
+            documents=args.documents, size_mb=args.size_mb, processes=args.processes
+        )
+    else:
+        text = args.file.read_text(errors="ignore") if args.file else None
+        benchmark = (
+            benchmark_phrase_matching
+            if args.command == "phrases"
+            else benchmark_pattern_prefilter
+        )
+        result = benchmark(text=text, size_mb=args.size_mb, rounds=args.rounds)
+
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
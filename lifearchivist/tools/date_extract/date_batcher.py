@@ -0,0 +1,176 @@
+"""
+Batched LLM date extraction.
+
+Sending each document its own prompt of up to 10,000 characters makes
+backfills pay the per-request overhead once per document. The date a
+document was issued is almost always near its top, so batch mode sends only
+the first SNIPPET_CHARS of each document and packs several documents into
+one numbered prompt whose answer has one line per document.
+
+DateExtractionBatcher collects concurrent extract() calls for up to
+MAX_WAIT_SECONDS (or until BATCH_SIZE documents are waiting) and answers
+them all from one LLM request. A failed request is reported once, through
+on_failure, and raised into every waiting document as DateBatchError.
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, List, Optional, Sequence, Set, Tuple
+
+from lifearchivist.utils.logging import log_event
+
+from .date_extraction_utils import (
+    create_batch_date_extraction_prompt,
+    parse_batch_date_response,
+)
+
+# LLM call taking prompt, temperature and max_tokens, e.g. OllamaTool.generate
+GenerateFn = Callable[..., Awaitable[str]]
+
+# Characters from the top of each document included in a batch prompt
+SNIPPET_CHARS = 1500
+
+
+class DateBatchError(Exception):
+    """A batched LLM date extraction request failed; raised for each document."""
+
+
+async def extract_dates_batch(
+    generate: GenerateFn, texts: Sequence[str], snippet_chars: int = SNIPPET_CHARS
+) -> List[str]:
+    """
+    Extract the primary date of several documents with one LLM request.
+
+    Args:
+        generate: LLM call (prompt, temperature, max_tokens) -> response
+        texts: Document texts
+        snippet_chars: Characters from the top of each document to include
+
+    Returns:
+        One YYYY-MM-DD date per document, in order; "" where none was found
+    """
+    if not texts:
+        return []
+    prompt = create_batch_date_extraction_prompt(
+        [text[:snippet_chars] for text in texts]
+    )
+    response = await generate(
+        prompt=prompt,
+        temperature=0.1,
+        # "NN: YYYY-MM-DD" per document, with room for stray formatting
+        max_tokens=20 * len(texts) + 50,
+    )
+    dates = parse_batch_date_response(response or "", len(texts))
+    log_event(
+        "llm_batch_date_extraction",
+        {
+            "documents": len(texts),
+            "prompt_length": len(prompt),
+            "dates_found": sum(1 for date in dates if date),
+        },
+    )
+    return dates
+
+
+class DateExtractionBatcher:
+    """Coalesces concurrent date extraction requests into batched prompts."""
+
+    BATCH_SIZE = 8
+    MAX_WAIT_SECONDS = 0.5
+    TIMEOUT_SECONDS = 120.0
+
+    def __init__(
+        self,
+        generate: GenerateFn,
+        batch_size: Optional[int] = None,
+        max_wait: Optional[float] = None,
+        concurrency: int = 1,
+        timeout: Optional[float] = None,
+        on_failure: Optional[Callable[[], None]] = None,
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            generate: LLM call (prompt, temperature, max_tokens) -> response
+            batch_size: Documents per prompt
+            max_wait: Seconds the first waiting document waits for others
+            concurrency: Batch prompts in flight at once
+            timeout: Seconds before a batch request is abandoned
+            on_failure: Called once per failed batch request
+        """
+        self.generate = generate
+        self.batch_size = batch_size or self.BATCH_SIZE
+        self.max_wait = max_wait if max_wait is not None else self.MAX_WAIT_SECONDS
+        self.timeout = timeout or self.TIMEOUT_SECONDS
+        self.on_failure = on_failure
+        self._semaphore = asyncio.Semaphore(max(1, concurrency))
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._batches: Set[asyncio.Task] = set()
+
+    async def extract(self, text: str) -> str:
+        """
+        Get a document's primary date, sharing an LLM request with others.
+
+        Returns:
+            The date as YYYY-MM-DD, or "" if none was found
+
+        Raises:
+            DateBatchError: If the batch request failed or timed out, for
+                every document in the batch (the original error is its
+                __cause__)
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._pending.append((text, future))
+
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+
+        return str(await future)
+
+    def _flush(self) -> None:
+        """Send the waiting documents, one batch at a time."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        while self._pending:
+            batch = self._pending[: self.batch_size]
+            self._pending = self._pending[self.batch_size :]
+            task = asyncio.create_task(self._run(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _run(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        try:
+            async with self._semaphore:
+                dates = await asyncio.wait_for(
+                    extract_dates_batch(self.generate, [text for text, _ in batch]),
+                    timeout=self.timeout,
+                )
+        except Exception as e:
+            log_event(
+                "llm_batch_date_extraction_failed",
+                {
+                    "documents": len(batch),
+                    "error_type": type(e).__name__,
+                    "error": str(e),
+                },
+                level=logging.WARNING,
+            )
+            if self.on_failure is not None:
+                self.on_failure()
+            for _, future in batch:
+                if not future.done():
+                    error = DateBatchError(f"{type(e).__name__}: {e}")
+                    error.__cause__ = e
+                    future.set_exception(error)
+            return
+
+        for (_, future), date in zip(batch, dates, strict=True):
+            if not future.done():
+                future.set_result(date)
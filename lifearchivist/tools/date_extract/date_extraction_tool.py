@@ -2,16 +2,19 @@
 Content date extraction tool for extracting dates from document text using LLM.
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
+from lifearchivist.config import get_settings
 from lifearchivist.schemas.tool_schemas import (
     ContentDateExtractionInput,
     ContentDateExtractionOutput,
 )
 from lifearchivist.storage.llamaindex_service import LlamaIndexService
 from lifearchivist.tools.base import BaseTool, ToolMetadata
+from lifearchivist.tools.date_extract.date_batcher import extract_dates_batch
 from lifearchivist.tools.date_extract.date_extraction_utils import (
     create_date_extraction_prompt,
+    find_labeled_date,
     truncate_text_for_llm,
 )
 from lifearchivist.tools.ollama.ollama_tool import OllamaTool
@@ -45,6 +48,14 @@ class ContentDateExtractionTool(BaseTool):
     )
     async def extract_date_from_text(self, text: str, document_id: str) -> str:
         """Extract dates from text using LLM analysis."""
+        labeled_date = find_labeled_date(text)
+        if labeled_date:
+            log_event(
+                "date_found_by_pattern",
+                {"document_id": document_id, "extracted_date": labeled_date},
+            )
+            return labeled_date
+
         # Truncate text if too long to avoid token limits
         original_length = len(text)
         text = truncate_text_for_llm(text, max_chars=10000, document_id=document_id)
@@ -90,6 +101,57 @@ class ContentDateExtractionTool(BaseTool):
 
         return response.strip() if response else ""
 
+    @track(
+        operation="llm_batch_date_extraction",
+        track_performance=True,
+        frequency="low_frequency",
+    )
+    async def extract_dates_from_texts(
+        self, texts: Dict[str, str], batch_size: Optional[int] = None
+    ) -> Dict[str, str]:
+        """
+        Extract dates for many documents with as few LLM requests as possible.
+
+        Labeled dates are resolved by pattern; the remaining documents are
+        sent batch_size at a time in combined prompts.
+
+        Args:
+            texts: Document ID to document text
+            batch_size: Documents per prompt (defaults to settings)
+
+        Returns:
+            Document ID to YYYY-MM-DD date, or "" where none was found
+        """
+        batch_size = batch_size or get_settings().date_extraction_batch_size
+        dates: Dict[str, str] = {}
+        remaining: List[str] = []
+        for document_id, text in texts.items():
+            labeled_date = find_labeled_date(text)
+            if labeled_date:
+                dates[document_id] = labeled_date
+            else:
+                remaining.append(document_id)
+
+        ollama_tool = OllamaTool()
+        llm_requests = 0
+        for start in range(0, len(remaining), max(1, batch_size)):
+            batch_ids = remaining[start : start + max(1, batch_size)]
+            batch_dates = await extract_dates_batch(
+                ollama_tool.generate, [texts[document_id] for document_id in batch_ids]
+            )
+            dates.update(zip(batch_ids, batch_dates, strict=True))
+            llm_requests += 1
+
+        log_event(
+            "batch_date_extraction_completed",
+            {
+                "documents": len(texts),
+                "resolved_by_pattern": len(texts) - len(remaining),
+                "llm_requests": llm_requests,
+            },
+        )
+        return dates
+
     @track(
         operation="date_metadata_storage",
         include_args=["document_id"],
@@ -2,8 +2,9 @@
 Date extraction utilities and constants for document date parsing.
 """
 
+import re
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 SUPPORTED_DATE_FORMATS = [
     "%Y-%m-%d",  # 2024-01-15 (ISO format - preferred by LLM)
@@ -111,3 +112,108 @@ def truncate_text_for_llm(
     truncated_text = text[:max_chars] + "..."
 
     return truncated_text
+
+
+# Labels that introduce a document's own date, most specific first
+_DATE_LABEL = (
+    r"(?:statement|issue|document|report|invoice|billing|bill|print|payroll|pay)"
+    r"\s+date|date\s+(?:issued|of\s+issue)|issued(?:\s+on)?"
+)
+_DATE_VALUE = (
+    r"[A-Za-z]{3,9}\.?\s+\d{1,2},?\s+\d{4}"  # January 15, 2024 / Jan. 15 2024
+    r"|\d{4}-\d{2}-\d{2}"  # 2024-01-15
+    r"|\d{1,2}/\d{1,2}/\d{2,4}"  # 01/15/2024
+)
+LABELED_DATE_PATTERN = re.compile(
+    rf"\b(?:{_DATE_LABEL})\s*[:\-]?\s*({_DATE_VALUE})\b", re.IGNORECASE
+)
+
+# Characters from the top of a document searched for a labeled date
+LABELED_DATE_SEARCH_CHARS = 3000
+
+
+def find_labeled_date(
+    text: str, max_chars: int = LABELED_DATE_SEARCH_CHARS
+) -> Optional[str]:
+    """
+    Find an explicitly labeled document date without an LLM.
+
+    Looks near the top of the document for a label such as "Statement Date:"
+    or "Issued on" followed by a date in one of SUPPORTED_DATE_FORMATS.
+
+    Args:
+        text: Document text
+        max_chars: How far into the document to search
+
+    Returns:
+        The first labeled date as YYYY-MM-DD, or None if there is none
+    """
+    for match in LABELED_DATE_PATTERN.finditer(text[:max_chars]):
+        value = re.sub(r"^([A-Za-z]+)\.", r"\1", match.group(1))
+        value = re.sub(r"\s+", " ", value)
+        parsed = parse_date_string(value)
+        if parsed and 1900 <= parsed.year <= datetime.now().year + 1:
+            return parsed.strftime("%Y-%m-%d")
+    return None
+
+
+BATCH_DATE_EXTRACTION_PROMPT_TEMPLATE = """You are a document date extraction expert. For EACH document below, find the PRIMARY DATE when it was created, issued, or sent out: the statement, issue, document, report or payroll date, typically near the top.
+
+IGNORE service periods, due dates, transaction dates and appointment dates within the content.
+
+{documents}
+
+Answer with exactly one line per document, in order, formatted as:
+<document number>: YYYY-MM-DD
+Write "<document number>: none" if a document has no such date. Do not add any other text.
+
+ANSWERS:"""
+
+
+def create_batch_date_extraction_prompt(snippets: List[str]) -> str:
+    """
+    Create one prompt asking for the dates of several documents.
+
+    Args:
+        snippets: Text from the top of each document, numbered from 1 in
+            the prompt
+
+    Returns:
+        Formatted prompt; parse the answer with parse_batch_date_response
+    """
+    documents = "\n\n".join(
+        f"### DOCUMENT {number}\n{snippet.strip()}"
+        for number, snippet in enumerate(snippets, start=1)
+    )
+    return BATCH_DATE_EXTRACTION_PROMPT_TEMPLATE.format(documents=documents)
+
+
+_BATCH_ANSWER_PATTERN = re.compile(
+    r"^\W*(?:document\s*)?#?(\d+)[\s*\]]*[:.)\-]\s*(.+)$", re.IGNORECASE
+)
+
+
+def parse_batch_date_response(response: str, count: int) -> List[str]:
+    """
+    Parse the answer to a batch date prompt.
+
+    Args:
+        response: LLM response with one "<number>: <date>" line per document
+        count: Number of documents in the prompt
+
+    Returns:
+        One YYYY-MM-DD date per document, in prompt order; "" where the model
+        found no date or gave no parseable answer
+    """
+    dates = [""] * count
+    for line in response.splitlines():
+        match = _BATCH_ANSWER_PATTERN.match(line.strip())
+        if not match:
+            continue
+        index = int(match.group(1)) - 1
+        value = match.group(2).strip().strip("\"'`*").rstrip(".")
+        if 0 <= index < count and not dates[index]:
+            parsed = parse_date_string(value)
+            if parsed:
+                dates[index] = parsed.strftime("%Y-%m-%d")
+    return dates
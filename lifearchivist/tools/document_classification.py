@@ -0,0 +1,125 @@
+"""
+Theme and subtheme classification of a whole document.
+
+File import and archive reclassification both store a document's
+classification under its "classifications" metadata field; the helpers here
+build that dict, so both paths produce the same shape.
+"""
+
+import threading
+from typing import Any, Dict, Optional
+
+from lifearchivist.tools.subtheme_classifier.models import SubthemeResult
+from lifearchivist.tools.subtheme_classifier.subtheme_classifier import (
+    get_subtheme_classifier,
+)
+from lifearchivist.tools.theme_classifier.theme_classifier import ThemeClassifier
+
+
+def build_theme_details(
+    theme: str, confidence: float, pattern_or_phrase: str, classification: str
+) -> Dict[str, Any]:
+    """
+    Build the theme part of a document's classifications.
+
+    Args:
+        theme: Classified theme
+        confidence: Classification confidence
+        pattern_or_phrase: Pattern or phrase that decided the theme
+        classification: Tier that matched ("primary", "secondary", "tertiary")
+
+    Returns:
+        Theme details with a human-readable confidence level
+    """
+    theme_details: Dict[str, Any] = {
+        "theme": theme,
+        "match_tier": classification,
+        "match_pattern": pattern_or_phrase,
+        "confidence": confidence,
+    }
+
+    match classification:
+        case "primary":
+            theme_details["confidence_level"] = "Very High"
+        case "secondary":
+            theme_details["confidence_level"] = "High"
+        case "tertiary" if confidence >= 0.5:
+            theme_details["confidence_level"] = "Medium"
+        case "tertiary" if confidence < 0.5:
+            theme_details["confidence_level"] = "Low"
+        case _:
+            theme_details["confidence_level"] = "None"
+
+    return theme_details
+
+
+def build_subtheme_metadata(result: SubthemeResult) -> Optional[Dict[str, Any]]:
+    """
+    Build the subtheme part of a document's classifications.
+
+    Args:
+        result: Subtheme classification result
+
+    Returns:
+        Subtheme fields, or None if no subtheme was detected
+    """
+    if not result.subthemes:
+        return None
+
+    return {
+        "subthemes": result.subthemes,
+        "primary_subtheme": result.primary_subtheme,
+        "subclassifications": result.subclassifications,
+        "primary_subclassification": result.primary_subclassification,
+        "subclassification_confidence": result.subclassification_confidence,
+        "confidence_scores": result.confidence_scores,
+        "category_mapping": result.category_mapping,
+        "matched_patterns": result.matched_patterns,
+        "subclassification_method": result.subclassification_method,
+    }
+
+
+_shared_theme_classifier: Optional[ThemeClassifier] = None
+_shared_theme_classifier_lock = threading.Lock()
+
+
+def get_theme_classifier() -> ThemeClassifier:
+    """Get the process-wide theme classifier, creating it on first use."""
+    global _shared_theme_classifier
+    if _shared_theme_classifier is None:
+        with _shared_theme_classifier_lock:
+            if _shared_theme_classifier is None:
+                _shared_theme_classifier = ThemeClassifier()
+    return _shared_theme_classifier
+
+
+def classify_document(
+    text: str, display_path: str = "", original_filename: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Classify a document's theme and, for supported themes, its subthemes.
+
+    Args:
+        text: Document text
+        display_path: Path or name the theme classifier sees as the filename
+        original_filename: Filename the subtheme classifier sees
+
+    Returns:
+        The document's classifications dict
+    """
+    theme, confidence, pattern_or_phrase, classification = (
+        get_theme_classifier().classify(text=text, filename=display_path)
+    )
+    classifications = build_theme_details(
+        theme, confidence, pattern_or_phrase, classification
+    )
+
+    subtheme_classifier = get_subtheme_classifier()
+    if theme in subtheme_classifier.get_supported_themes():
+        metadata = {"filename": original_filename} if original_filename else {}
+        result = subtheme_classifier.classify_document(text, theme, metadata)
+        subtheme_metadata = build_subtheme_metadata(result)
+        if subtheme_metadata:
+            classifications.update(subtheme_metadata)
+
+    return classifications
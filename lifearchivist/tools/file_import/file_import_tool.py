@@ -9,7 +9,7 @@ from typing import Any, Dict, Optional
 
 import magic
 
-from lifearchivist.server.progress_manager import ProcessingStage
+from lifearchivist.storage.classification_cache import classification_cache_name
 from lifearchivist.tools.base import BaseTool, ToolMetadata
 from lifearchivist.tools.file_import.file_import_utils import (
     calculate_file_hash,
@@ -21,6 +21,10 @@ from lifearchivist.tools.file_import.file_import_utils import (
     is_text_extraction_supported,
     should_extract_dates,
 )
+from lifearchivist.tools.file_import.ingest_timing import (
+    IngestTimer,
+    get_ingest_metrics,
+)
 from lifearchivist.utils.logging import log_event, track
 
 
@@ -33,8 +37,9 @@ class FileImportTool(BaseTool):
         llamaindex_service=None,
         progress_manager=None,
         enrichment_queue=None,
-        theme_classifier=None,
         activity_manager=None,
+        classification_cache=None,
+        classification_batcher=None,
     ):
         super().__init__()
         self.vault = vault
@@ -42,15 +47,15 @@ class FileImportTool(BaseTool):
         self.progress_manager = progress_manager
         self.enrichment_queue = enrichment_queue
         self.activity_manager = activity_manager
-        # Use provided classifier or create a new one
-        if theme_classifier is None:
-            from lifearchivist.tools.theme_classifier.theme_classifier import (
-                ThemeClassifier,
+        self.classification_cache = classification_cache
+        # Shared batcher in front of the classifier process pool
+        if classification_batcher is None:
+            from lifearchivist.tools.subtheme_classifier import (
+                get_classification_batcher,
             )
 
-            self.theme_classifier = ThemeClassifier()
-        else:
-            self.theme_classifier = theme_classifier
+            classification_batcher = get_classification_batcher()
+        self.classification_batcher = classification_batcher
 
     def _get_metadata(self) -> ToolMetadata:
         return ToolMetadata(
@@ -124,13 +129,18 @@ class FileImportTool(BaseTool):
         file_size_bytes = stat.st_size
         file_size_mb = round(file_size_bytes / (1024 * 1024), 2)
 
+        # Stage durations and bytes, attached to progress/activity events
+        timer = IngestTimer()
+
         # Calculate hash and detect MIME type
-        file_hash = await self._analyze_file(file_path, display_path)
+        with timer.stage("hash", file_size_bytes):
+            file_hash = await self._analyze_file(file_path, display_path)
 
         if mime_hint:
             mime_type = mime_hint
         else:
-            mime_type = magic.from_file(str(file_path), mime=True)
+            with timer.stage("detect_mime"):
+                mime_type = magic.from_file(str(file_path), mime=True)
 
         # Use provided file_id or generate unique ID
         file_id = metadata.get("file_id") or str(uuid.uuid4())
@@ -156,55 +166,62 @@ class FileImportTool(BaseTool):
             await self.progress_manager.start_progress(file_id, session_id)
 
         try:
-            # Store file in vault first - this handles physical file deduplication
-            vault_result = await self.vault.store_file(file_path, file_hash)
-
-            # Check for duplicate using vault result AND LlamaIndex metadata check
-            if vault_result["existed"]:
+            # Check for a duplicate straight after hashing, so duplicates exit
+            # before any vault copy, thumbnail, extraction or classification
+            with timer.stage("duplicate_check"):
                 duplicate_doc = await self._check_for_duplicate(file_id, file_hash)
-                if duplicate_doc:
-                    # Send completion message for duplicates BEFORE cleanup
-                    if self.progress_manager and session_id:
-                        # Send a completion message indicating this is a duplicate
-                        await self.progress_manager.complete_progress(
-                            file_id,
-                            metadata={
-                                "original_filename": original_filename,
-                                "file_size": stat.st_size,
-                                "mime_type": mime_type,
-                                "status": "duplicate",
-                                "message": "File already exists in archive",
-                                "existing_doc_id": duplicate_doc.get("document_id"),
-                            },
-                        )
-                        # Now clean up the progress tracking
-                        # Note: We may want to keep this for a bit to ensure the message is delivered
-                        # await self.progress_manager.cleanup_progress(file_id)
-
-                    # Log duplicate found (important business event)
-                    log_event(
-                        "duplicate_file_detected",
-                        {
-                            "file_id": file_id,
+            if duplicate_doc:
+                get_ingest_metrics().record(timer, mime_type)
+                # Send completion message for duplicates BEFORE cleanup
+                if self.progress_manager and session_id:
+                    # Send a completion message indicating this is a duplicate
+                    await self.progress_manager.complete_progress(
+                        file_id,
+                        metadata={
+                            "original_filename": original_filename,
+                            "file_size": stat.st_size,
+                            "mime_type": mime_type,
+                            "status": "duplicate",
+                            "message": "File already exists in archive",
                             "existing_doc_id": duplicate_doc.get("document_id"),
-                            "file_hash": file_hash[:8],
-                            "file_path": display_path,
+                            "timings": timer.to_dict(),
                         },
                     )
+                    # Now clean up the progress tracking
+                    # Note: We may want to keep this for a bit to ensure the message is delivered
+                    # await self.progress_manager.cleanup_progress(file_id)
 
-                    return create_duplicate_response(
-                        duplicate_doc, file_hash, stat, mime_type, display_path
-                    )
+                # Log duplicate found (important business event)
+                log_event(
+                    "duplicate_file_detected",
+                    {
+                        "file_id": file_id,
+                        "existing_doc_id": duplicate_doc.get("document_id"),
+                        "file_hash": file_hash[:8],
+                        "file_path": display_path,
+                    },
+                )
+
+                return create_duplicate_response(
+                    duplicate_doc, file_hash, stat, mime_type, display_path
+                )
+
+            # Store file in vault - this handles physical file deduplication
+            with timer.stage("vault_store", file_size_bytes):
+                vault_result = await self.vault.store_file(file_path, file_hash)
 
             # Extract text content early to have it available for document creation
-            extracted_text = await self._try_extract_text(
-                file_id, file_path, mime_type, file_hash
-            )
+            with timer.stage("extract_text", file_size_bytes):
+                extracted_text = await self._try_extract_text(
+                    file_id, file_path, mime_type, file_hash
+                )
+            text_bytes = len(extracted_text.encode("utf-8")) if extracted_text else 0
 
             # Extract document internal metadata (PDF/DOCX creation dates, etc.)
-            document_metadata = await self._extract_document_metadata(
-                file_id, file_path, mime_type
-            )
+            with timer.stage("extract_metadata"):
+                document_metadata = await self._extract_document_metadata(
+                    file_id, file_path, mime_type
+                )
 
             # If document doesn't have internal creation date, use platform-specific creation date
             # This reads macOS extended attributes (fast, <1ms) or Windows creation time
@@ -230,18 +247,15 @@ class FileImportTool(BaseTool):
 
             theme_result = {}
             if extracted_text:
-                theme_result = await self._classify_themes(
-                    file_id, extracted_text, display_path
+                theme_result = await self._classify_document(
+                    file_id,
+                    file_hash,
+                    extracted_text,
+                    display_path,
+                    original_filename,
+                    timer=timer,
+                    text_bytes=text_bytes,
                 )
-                if theme_result:
-                    # Classify subthemes if we have a primary theme
-                    theme = theme_result.get("theme")
-                    if theme and theme != "Unclassified":
-                        subtheme_result = await self._classify_subthemes(
-                            file_id, extracted_text, theme, original_filename
-                        )
-                        if subtheme_result:
-                            theme_result.update(subtheme_result)
 
             # Build custom metadata dictionary with all enrichments
             custom_metadata_dict = {**metadata}  # Start with user-provided metadata
@@ -269,14 +283,22 @@ class FileImportTool(BaseTool):
                 custom_metadata=custom_metadata_dict,
             )
 
-            await self._create_document(file_id, extracted_text, doc_metadata)
+            with timer.stage("index", text_bytes):
+                await self._create_document(file_id, extracted_text, doc_metadata)
 
             # Queue enrichment tasks instead of processing synchronously
             if extracted_text and self.enrichment_queue:
-                await self._queue_enrichment_tasks(file_id, extracted_text)
+                with timer.stage("enqueue_enrichment", text_bytes):
+                    await self._queue_enrichment_tasks(
+                        file_id, extracted_text, file_hash
+                    )
 
             # Finalize document
-            await self._finalize_document(file_id, file_path, vault_result)
+            with timer.stage("finalize"):
+                await self._finalize_document(file_id, file_path, vault_result)
+
+            get_ingest_metrics().record(timer, mime_type)
+            timings = timer.to_dict()
 
             # Complete progress tracking
             if self.progress_manager and session_id:
@@ -286,6 +308,7 @@ class FileImportTool(BaseTool):
                         "original_filename": original_filename,
                         "file_size": stat.st_size,
                         "mime_type": mime_type,
+                        "timings": timings,
                     },
                 )
 
@@ -303,6 +326,10 @@ class FileImportTool(BaseTool):
                     "text_extracted": bool(extracted_text),
                     "tags_count": len(tags),
                     "vault_existed": vault_result["existed"],
+                    "total_ms": timings["total_ms"],
+                    "stage_ms": {
+                        name: entry["ms"] for name, entry in timings["stages"].items()
+                    },
                 },
             )
 
@@ -322,10 +349,17 @@ class FileImportTool(BaseTool):
                         file_size=file_size_bytes,
                         mime_type=mime_type,
                         document_id=file_id,
+                        timings=timings,
                     )
 
             return create_success_response(
-                file_id, file_hash, stat, mime_type, display_path, vault_result
+                file_id,
+                file_hash,
+                stat,
+                mime_type,
+                display_path,
+                vault_result,
+                timings=timings,
             )
 
         except Exception as e:
@@ -350,8 +384,15 @@ class FileImportTool(BaseTool):
     async def _check_for_duplicate(
         self, file_id: str, file_hash: str
     ) -> Dict[str, Any] | None:
-        """Check for duplicate documents in LlamaIndex."""
-        # Check LlamaIndex for existing document with this file hash
+        """Check for an existing document with the same content hash."""
+        # O(1) lookup in the tracker's hash index when the service has one
+        if hasattr(self.llamaindex_service, "find_document_by_hash"):
+            duplicate: Dict[str, Any] | None = (
+                await self.llamaindex_service.find_document_by_hash(file_hash)
+            )
+            return duplicate
+
+        # Otherwise query LlamaIndex metadata for this file hash
         existing_docs_result = (
             await self.llamaindex_service.query_documents_by_metadata(
                 filters={"file_hash": file_hash}, limit=1
@@ -472,6 +513,9 @@ class FileImportTool(BaseTool):
 
         # Report error to progress tracking if we have a file_id
         if self.progress_manager and session_id and file_id:
+            # Imported here to avoid a tools <-> server import cycle
+            from lifearchivist.server.progress_manager import ProcessingStage
+
             try:
                 await self.progress_manager.error_progress(
                     file_id, str(error), ProcessingStage.UPLOAD
@@ -573,160 +617,91 @@ class FileImportTool(BaseTool):
         else:
             return "unknown"
 
-    @track(
-        operation="theme_classification",
-        include_args=["file_id"],
-        include_result=True,
-        track_performance=True,
-        frequency="medium_frequency",
-    )
-    async def _classify_themes(
-        self, file_id: str, text: str, display_path: str = ""
+    async def _classify_document(
+        self,
+        file_id: str,
+        file_hash: str,
+        text: str,
+        display_path: str,
+        original_filename: Optional[str],
+        timer: Optional[IngestTimer] = None,
+        text_bytes: int = 0,
     ) -> Dict[str, Any] | None:
-        """Classify document themes using the shared ProductionThemeClassifier."""
-        try:
-            theme, confidence, pattern_or_phrase, classification = (
-                self.theme_classifier.classify(
-                    text=text,
-                    filename=display_path,
+        """
+        Classify themes and subthemes, reusing a cached result when possible.
+
+        Results are cached by content hash, filename and rules version, so
+        re-importing unchanged content skips classification entirely.
+        """
+        timer = timer or IngestTimer()
+        cache_name = classification_cache_name(display_path, original_filename)
+        if self.classification_cache:
+            with timer.stage("classification_cache"):
+                cached = await self.classification_cache.get(file_hash, cache_name)
+            if cached is not None:
+                log_event(
+                    "classification_cache_hit",
+                    {"file_id": file_id, "file_hash": file_hash[:8]},
+                    level=logging.DEBUG,
                 )
-            )
-
-            theme_details = {
-                "theme": theme,
-                "match_tier": classification,
-                "match_pattern": pattern_or_phrase,
-                "confidence": confidence,
-            }
-
-            match classification:
-                case "primary":
-                    theme_details["confidence_level"] = "Very High"
-                case "secondary":
-                    theme_details["confidence_level"] = "High"
-                case "tertiary" if confidence >= 0.5:
-                    theme_details["confidence_level"] = "Medium"
-                case "tertiary" if confidence < 0.5:
-                    theme_details["confidence_level"] = "Low"
-                case _:
-                    theme_details["confidence_level"] = "None"
+                return cached
 
-            log_event(
-                "document_themes_classified",
-                {**theme_details},
+        with timer.stage("classify", text_bytes):
+            theme_result = await self._classify_text(
+                file_id, text, display_path, original_filename
             )
-            return theme_details
+        if theme_result and self.classification_cache:
+            await self.classification_cache.set(file_hash, theme_result, cache_name)
 
-        except Exception as e:
-            log_event(
-                "theme_classification_error",
-                {
-                    "file_id": file_id,
-                    "error": str(e),
-                },
-                level=logging.WARNING,
-            )
-            return None
+        return theme_result
 
     @track(
-        operation="subtheme_classification",
-        include_args=["file_id", "primary_theme"],
+        operation="document_classification",
+        include_args=["file_id"],
         include_result=True,
         track_performance=True,
         frequency="medium_frequency",
     )
-    async def _classify_subthemes(
+    async def _classify_text(
         self,
         file_id: str,
         text: str,
-        primary_theme: str,
-        filename: Optional[str] = None,
+        display_path: str = "",
+        original_filename: Optional[str] = None,
     ) -> Dict[str, Any] | None:
-        """Classify document subthemes based on primary theme."""
-        try:
-            from lifearchivist.tools.subtheme_classifier.models import SubthemeResult
-            from lifearchivist.tools.subtheme_classifier.subtheme_classifier import (
-                SubthemeClassifier,
-            )
+        """
+        Classify themes and subthemes off the event loop.
 
-            # Create subtheme classifier instance
-            classifier = SubthemeClassifier()
-
-            # Check if this theme supports subtheme classification
-            if primary_theme not in classifier.get_supported_themes():
-                log_event(
-                    "subtheme_classification_skipped",
-                    {
-                        "file_id": file_id,
-                        "primary_theme": primary_theme,
-                        "reason": "theme_not_supported",
-                    },
-                    level=logging.DEBUG,
-                )
-                return None
-
-            # Prepare metadata for classification
-            metadata = {"filename": filename} if filename else {}
-
-            # Classify subthemes
-            result: SubthemeResult = classifier.classify(
-                text=text, primary_theme=primary_theme, metadata=metadata
+        Concurrent imports are batched onto the shared classifier pool, so
+        bulk imports classify across cores.
+        """
+        try:
+            classifications = await self.classification_batcher.classify(
+                text, display_path, original_filename
             )
-
-            if result.subthemes:
-                subtheme_metadata = {
-                    "subthemes": result.subthemes,
-                    "primary_subtheme": result.primary_subtheme,
-                    "subclassifications": result.subclassifications,
-                    "primary_subclassification": result.primary_subclassification,
-                    "subclassification_confidence": result.subclassification_confidence,
-                    "confidence_scores": result.confidence_scores,
-                    "category_mapping": result.category_mapping,
-                    "matched_patterns": result.matched_patterns,
-                    "subclassification_method": result.subclassification_method,
-                }
-
-                log_event(
-                    "document_subthemes_classified",
-                    {
-                        "file_id": file_id,
-                        "primary_theme": primary_theme,
-                        "primary_subtheme": result.primary_subtheme,
-                        "subthemes_count": len(result.subthemes),
-                        "classification_method": result.subclassification_method,
-                        "primary_pattern": (
-                            result.matched_patterns.get(result.primary_subtheme, "")
-                            if result.primary_subtheme
-                            else ""
-                        ),
-                    },
-                )
-
-                return subtheme_metadata
-            else:
-                log_event(
-                    "document_subthemes_not_detected",
-                    {
-                        "file_id": file_id,
-                        "primary_theme": primary_theme,
-                    },
-                    level=logging.DEBUG,
-                )
-                return None
-
         except Exception as e:
             # Log error but don't fail the import
             log_event(
-                "subtheme_classification_error",
+                "theme_classification_error",
                 {
                     "file_id": file_id,
-                    "primary_theme": primary_theme,
                     "error": str(e),
                 },
                 level=logging.WARNING,
             )
             return None
 
+        log_event(
+            "document_classified",
+            {
+                "file_id": file_id,
+                "theme": classifications.get("theme"),
+                "match_tier": classifications.get("match_tier"),
+                "primary_subtheme": classifications.get("primary_subtheme"),
+            },
+        )
+        return classifications
+
     @track(
         operation="document_metadata_extraction",
         include_args=["file_id", "mime_type"],
@@ -787,8 +762,14 @@ class FileImportTool(BaseTool):
         track_performance=True,
         frequency="medium_frequency",
     )
-    async def _queue_enrichment_tasks(self, file_id: str, text: str):
-        """Queue background enrichment tasks for the document."""
+    async def _queue_enrichment_tasks(self, file_id: str, text: str, file_hash: str):
+        """
+        Queue background enrichment tasks for the document.
+
+        Tasks reference the document by ID and content hash instead of
+        carrying its text; the worker reads the part it needs from the
+        document's chunks.
+        """
         tasks_queued = []
 
         # TODO: ENABLE OR REMOVE DATE EXTRACTION
@@ -798,7 +779,7 @@ class FileImportTool(BaseTool):
             success = await self.enrichment_queue.enqueue_task(
                 task_type="date_extraction",
                 document_id=file_id,
-                data={"text": text},
+                data={"content_hash": file_hash, "text_length": len(text)},
                 priority=0,
             )
 
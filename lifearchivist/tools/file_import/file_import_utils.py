@@ -321,6 +321,7 @@ def create_success_response(
     mime_type: str,
     display_path: str,
     vault_result: Dict[str, Any],
+    timings: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     """
     Create standardized response for successful file import.
@@ -332,11 +333,12 @@ def create_success_response(
         mime_type: MIME type of the file
         display_path: Display path for user feedback
         vault_result: Result from vault storage operation
+        timings: Per-stage import timings (see IngestTimer.to_dict)
 
     Returns:
         Standardized success response dictionary
     """
-    return {
+    response: Dict[str, Any] = {
         "success": True,
         "file_id": file_id,
         "hash": file_hash,
@@ -349,6 +351,9 @@ def create_success_response(
         "modified_at": datetime.fromtimestamp(stat.st_mtime).isoformat(),
         "deduped": vault_result["existed"],
     }
+    if timings:
+        response["timings"] = timings
+    return response
 
 
 def create_error_response(error: Exception, display_path: str) -> Dict[str, Any]:
@@ -0,0 +1,153 @@
+"""
+Per-stage timing for file imports.
+
+IngestTimer measures each stage of one import (hashing, vault store,
+extraction, classification, indexing, ...) with the bytes it handled; the
+breakdown is attached to the import's progress and activity events.
+IngestMetrics keeps a rolling window of recent stage durations per stage and
+MIME type so the p50/p95 of each stage can be queried, showing which stage
+dominates ingest time.
+"""
+
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+
+class IngestTimer:
+    """Records stage durations and byte counts for a single import."""
+
+    def __init__(self):
+        self.stages: Dict[str, Dict[str, Any]] = {}
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str, nbytes: Optional[int] = None) -> Iterator[None]:
+        """
+        Time a stage; repeated stages accumulate.
+
+        Args:
+            name: Stage name
+            nbytes: Bytes the stage handled, if known
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, (time.perf_counter() - start) * 1000, nbytes)
+
+    def add(self, name: str, duration_ms: float, nbytes: Optional[int] = None):
+        """Record a stage measured elsewhere."""
+        entry = self.stages.setdefault(name, {"ms": 0.0, "bytes": 0})
+        entry["ms"] = round(entry["ms"] + duration_ms, 2)
+        if nbytes:
+            entry["bytes"] += nbytes
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the breakdown for progress and activity events."""
+        return {
+            "total_ms": round((time.perf_counter() - self._started) * 1000, 2),
+            "stages": {name: dict(entry) for name, entry in self.stages.items()},
+        }
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of pre-sorted values."""
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return round(sorted_values[index], 2)
+
+
+class IngestMetrics:
+    """
+    Rolling per-stage duration windows, overall and per MIME type.
+
+    Each window keeps the last WINDOW_SIZE samples, so percentiles follow
+    recent ingest behaviour rather than the whole process lifetime.
+    """
+
+    WINDOW_SIZE = 500
+
+    def __init__(self, window_size: Optional[int] = None):
+        self.window_size = window_size or self.WINDOW_SIZE
+        # (stage, mime_type or None for all types) -> (duration_ms, bytes)
+        self._samples: Dict[Tuple[str, Optional[str]], Deque[Tuple[float, int]]] = (
+            defaultdict(lambda: deque(maxlen=self.window_size))
+        )
+        self._imports = 0
+        self._lock = threading.Lock()
+
+    def record(self, timer: IngestTimer, mime_type: str) -> None:
+        """Add one import's stage timings to the windows."""
+        with self._lock:
+            self._imports += 1
+            for name, entry in timer.stages.items():
+                sample = (entry["ms"], entry["bytes"])
+                self._samples[(name, None)].append(sample)
+                self._samples[(name, mime_type)].append(sample)
+
+    @staticmethod
+    def _summarize(samples: Deque[Tuple[float, int]]) -> Dict[str, Any]:
+        durations = sorted(duration for duration, _ in samples)
+        total_ms = sum(durations)
+        total_bytes = sum(nbytes for _, nbytes in samples)
+        summary: Dict[str, Any] = {
+            "count": len(durations),
+            "p50_ms": _percentile(durations, 0.50),
+            "p95_ms": _percentile(durations, 0.95),
+            "mean_ms": round(total_ms / len(durations), 2),
+        }
+        if total_bytes and total_ms:
+            summary["mb_per_second"] = round(
+                total_bytes / (1024 * 1024) / (total_ms / 1000), 2
+            )
+        return summary
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get p50/p95 per stage, with a breakdown per MIME type.
+
+        Returns:
+            Dict with the number of recorded imports and, per stage, the
+            overall summary plus a "by_mime_type" mapping
+        """
+        with self._lock:
+            windows = {key: deque(samples) for key, samples in self._samples.items()}
+            imports = self._imports
+
+        stages: Dict[str, Dict[str, Any]] = {}
+        for (name, mime_type), samples in sorted(
+            windows.items(), key=lambda item: (item[0][0], item[0][1] or "")
+        ):
+            stage = stages.setdefault(name, {"by_mime_type": {}})
+            if mime_type is None:
+                stage.update(self._summarize(samples))
+            else:
+                stage["by_mime_type"][mime_type] = self._summarize(samples)
+
+        return {
+            "imports": imports,
+            "window_size": self.window_size,
+            "stages": stages,
+        }
+
+    def reset(self) -> None:
+        """Discard all samples."""
+        with self._lock:
+            self._samples.clear()
+            self._imports = 0
+
+
+_shared_metrics: Optional[IngestMetrics] = None
+_shared_metrics_lock = threading.Lock()
+
+
+def get_ingest_metrics() -> IngestMetrics:
+    """Get the process-wide ingest metrics, creating them on first use."""
+    global _shared_metrics
+    if _shared_metrics is None:
+        with _shared_metrics_lock:
+            if _shared_metrics is None:
+                _shared_metrics = IngestMetrics()
+    return _shared_metrics
@@ -0,0 +1,183 @@
+"""
+Literal-prefiltered regex sets for the rule-based classifiers.
+
+The classifiers search each document with hundreds of regexes, and most of
+them do not match. PatternSet extracts from each regex a literal that every
+match must contain (e.g. "benefit" in ``(?:retirement|disability)\\s*benefits?``),
+finds all of those literals in one pass with a PhraseMatcher, and only runs
+the regexes whose literal is present. Regexes with no usable literal are
+always searched.
+
+Merging the patterns into one alternation was measured first and is much
+slower with the standard re module, which tries every branch at every
+position; prefiltering keeps each regex intact, so match results are
+identical to searching every pattern.
+"""
+
+import re
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+
+from lifearchivist.tools.phrase_matcher import PhraseMatcher
+
+try:
+    from re import _constants as sre_constants
+    from re import _parser as sre_parse
+except ImportError:  # pragma: no cover - layout of the re internals changed
+    sre_constants = None
+    sre_parse = None
+
+# Characters that re's IGNORECASE matching treats as equal to an ASCII letter
+# even after str.lower() (dotless i and long s). If the text contains one,
+# literal prefiltering could skip a real match, so every pattern is searched.
+_UNSAFE_FOLD_CHARS = ("ı", "ſ")
+
+
+def _literal_score(literals: Optional[FrozenSet[str]]) -> int:
+    """Rank candidate literal sets; longer shortest literal filters better."""
+    if not literals:
+        return 0
+    return min(len(literal) for literal in literals)
+
+
+def _required_literals(items) -> Optional[FrozenSet[str]]:
+    """
+    Find literals of which at least one occurs in every match of a parsed regex.
+
+    Walks the parsed pattern and returns the best lowercase ASCII literal set,
+    or None if no literal is required. Anything not understood just ends the
+    current literal, so the result is conservative.
+    """
+    c = sre_constants
+    best: Optional[FrozenSet[str]] = None
+    run: List[str] = []
+
+    def consider(candidate: Optional[FrozenSet[str]]):
+        nonlocal best
+        if _literal_score(candidate) > _literal_score(best):
+            best = candidate
+
+    def flush():
+        if run:
+            consider(frozenset(["".join(run)]))
+            run.clear()
+
+    for op, av in items:
+        if op is c.LITERAL and av < 128:
+            run.append(chr(av).lower())
+            continue
+        if op is c.AT:
+            # Zero-width (^, $, \b): surrounding literals stay contiguous
+            continue
+
+        flush()
+
+        if op is c.SUBPATTERN:
+            consider(_required_literals(av[-1]))
+        elif op is c.ATOMIC_GROUP:
+            consider(_required_literals(av))
+        elif op is c.BRANCH:
+            alternatives = [_required_literals(branch) for branch in av[1]]
+            if all(alternatives):
+                consider(frozenset().union(*alternatives))
+        elif op in (c.MAX_REPEAT, c.MIN_REPEAT, c.POSSESSIVE_REPEAT):
+            if av[0] >= 1:
+                consider(_required_literals(av[2]))
+
+    flush()
+    return best
+
+
+def required_literals(
+    pattern: re.Pattern, min_length: int = 3
+) -> Optional[FrozenSet[str]]:
+    """
+    Get literals of which at least one must occur in any match of a regex.
+
+    Args:
+        pattern: Compiled regex
+        min_length: Shortest literal worth filtering on
+
+    Returns:
+        Lowercase literal set, or None if the regex has no usable literal
+    """
+    if sre_parse is None or not isinstance(pattern.pattern, str):
+        return None
+    try:
+        parsed = sre_parse.parse(pattern.pattern, pattern.flags)
+        literals = _required_literals(parsed)
+    except Exception:
+        return None
+    if _literal_score(literals) < min_length:
+        return None
+    return literals
+
+
+class PatternSet:
+    """
+    A set of compiled regexes searched with a shared literal prefilter.
+
+    Text passed in must already be lowercased, as the classifiers do; the
+    literals are matched as lowercase substrings.
+    """
+
+    MIN_LITERAL_LENGTH = 3
+
+    def __init__(self, patterns: Iterable[re.Pattern]):
+        """
+        Analyze the patterns and compile their literals into one matcher.
+
+        Args:
+            patterns: Compiled regexes; duplicates are searched once
+        """
+        self.patterns: List[re.Pattern] = list(dict.fromkeys(patterns))
+
+        self._unfiltered: List[re.Pattern] = []
+        self._patterns_by_literal: Dict[str, List[re.Pattern]] = {}
+        for pattern in self.patterns:
+            literals = required_literals(pattern, self.MIN_LITERAL_LENGTH)
+            if literals is None:
+                self._unfiltered.append(pattern)
+                continue
+            for literal in literals:
+                self._patterns_by_literal.setdefault(literal, []).append(pattern)
+
+        self._literal_matcher = PhraseMatcher(self._patterns_by_literal)
+
+    @property
+    def filtered_count(self) -> int:
+        """Number of patterns that can be skipped by the literal prefilter."""
+        return len(self.patterns) - len(self._unfiltered)
+
+    def candidates(self, text_lower: str) -> Set[re.Pattern]:
+        """
+        Get the patterns that might match the text.
+
+        Args:
+            text_lower: Lowercased text
+
+        Returns:
+            Patterns whose required literal occurs, plus unfiltered patterns
+        """
+        if any(char in text_lower for char in _UNSAFE_FOLD_CHARS):
+            return set(self.patterns)
+
+        candidates = set(self._unfiltered)
+        for literal in self._literal_matcher.find_all(text_lower):
+            candidates.update(self._patterns_by_literal[literal])
+        return candidates
+
+    def search_all(self, text_lower: str) -> Set[re.Pattern]:
+        """
+        Get every pattern that matches somewhere in the text.
+
+        Args:
+            text_lower: Lowercased text
+
+        Returns:
+            Patterns with at least one match
+        """
+        return {
+            pattern
+            for pattern in self.candidates(text_lower)
+            if pattern.search(text_lower)
+        }
@@ -0,0 +1,138 @@
+"""
+Multi-phrase substring matching for the rule-based classifiers.
+
+The classifiers check hundreds of definitive phrases, form numbers and
+exclusion phrases against each document. Checking them one ``phrase in text``
+at a time rescans the whole text per phrase; PhraseMatcher compiles the
+phrases into an Aho-Corasick automaton and finds every phrase that occurs in a
+single pass.
+
+Backends:
+- ``pyahocorasick``: C automaton from the pyahocorasick dependency
+- ``automaton``: pure-Python Aho-Corasick, used for large phrase sets when
+  pyahocorasick is not importable (much slower; ``just classifier-benchmark``
+  reports which backend ran)
+- ``scan``: one substring search per phrase, used for small phrase sets where
+  it beats a pass through an automaton
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set
+
+try:
+    import ahocorasick
+
+    DEFAULT_BACKEND = "pyahocorasick"
+except ImportError:  # pragma: no cover - declared dependency, missing install
+    ahocorasick = None
+    DEFAULT_BACKEND = "automaton"
+
+MATCHER_BACKENDS = ("pyahocorasick", "automaton", "scan")
+
+
+class PhraseMatcher:
+    """
+    Finds which of a fixed set of phrases occur in a text.
+
+    Matching is exact and case-sensitive, so callers lowercase both the
+    phrases and the text, as the classifiers already do.
+    """
+
+    # Below this many phrases, per-phrase substring searches (which run in C)
+    # beat a pass through the automaton
+    MIN_AUTOMATON_PHRASES = {"pyahocorasick": 32, "automaton": 256}
+
+    def __init__(self, phrases: Iterable[str], backend: Optional[str] = None):
+        """
+        Compile the phrase set.
+
+        Args:
+            phrases: Phrases to match; empty strings are ignored
+            backend: Force a backend from MATCHER_BACKENDS (chosen automatically
+                when omitted)
+        """
+        self.phrases: List[str] = sorted({phrase for phrase in phrases if phrase})
+
+        if backend is None:
+            backend = DEFAULT_BACKEND
+            if len(self.phrases) < self.MIN_AUTOMATON_PHRASES[backend]:
+                backend = "scan"
+        if backend not in MATCHER_BACKENDS:
+            raise ValueError(
+                f"Unknown matcher backend '{backend}', expected one of {MATCHER_BACKENDS}"
+            )
+        if backend == "pyahocorasick" and ahocorasick is None:
+            raise ValueError("pyahocorasick backend requested but not installed")
+
+        self.backend = backend
+
+        if backend == "pyahocorasick":
+            self._automaton = ahocorasick.Automaton()
+            for phrase in self.phrases:
+                self._automaton.add_word(phrase, phrase)
+            if self.phrases:
+                self._automaton.make_automaton()
+        elif backend == "automaton":
+            self._build_automaton()
+
+    def _build_automaton(self):
+        """Build goto, failure and output tables for the pure-Python backend."""
+        self._goto: List[Dict[str, int]] = [{}]
+        self._outputs: List[Set[str]] = [set()]
+        self._fail: List[int] = [0]
+
+        for phrase in self.phrases:
+            state = 0
+            for char in phrase:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._outputs.append(set())
+                    self._fail.append(0)
+                state = next_state
+            self._outputs[state].add(phrase)
+
+        # Breadth-first so each state's failure target is final before its children
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._outputs[next_state] |= self._outputs[self._fail[next_state]]
+
+    def find_all(self, text: str) -> Set[str]:
+        """
+        Find every phrase that occurs in the text.
+
+        Args:
+            text: Text to search
+
+        Returns:
+            Set of phrases found at least once
+        """
+        if not self.phrases or not text:
+            return set()
+
+        if self.backend == "pyahocorasick":
+            return {phrase for _, phrase in self._automaton.iter(text)}
+
+        if self.backend == "scan":
+            return {phrase for phrase in self.phrases if phrase in text}
+
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        found: Set[str] = set()
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if outputs[state]:
+                found |= outputs[state]
+        return found
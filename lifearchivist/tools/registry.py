@@ -27,6 +27,7 @@ class ToolRegistry:
         progress_manager=None,
         enrichment_queue=None,
         activity_manager=None,
+        classification_cache=None,
     ):
         self.tools: Dict[str, BaseTool] = {}
         self.vault = vault
@@ -34,6 +35,7 @@ class ToolRegistry:
         self.progress_manager = progress_manager
         self.enrichment_queue = enrichment_queue
         self.activity_manager = activity_manager
+        self.classification_cache = classification_cache
 
     @track(operation="tool_registration_batch")
     async def register_all(self):
@@ -54,6 +56,7 @@ class ToolRegistry:
                     "progress_manager": self.progress_manager,
                     "enrichment_queue": self.enrichment_queue,
                     "activity_manager": self.activity_manager,
+                    "classification_cache": self.classification_cache,
                 },
             },
             {
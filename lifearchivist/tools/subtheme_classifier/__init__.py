@@ -2,6 +2,28 @@
 Subtheme classifier tool for document categorization.
 """
 
-from .subtheme_classifier import SubthemeClassifier, SubthemeResult
+from .classifier_pool import (
+    ClassificationBatcher,
+    ClassifierPool,
+    get_classification_batcher,
+    get_classifier_pool,
+    shutdown_classifier_pool,
+)
+from .subtheme_classifier import (
+    SubthemeClassifier,
+    SubthemeResult,
+    get_subtheme_classifier,
+    precompile_subtheme_classifiers,
+)
 
-__all__ = ["SubthemeResult", "SubthemeClassifier"]
+__all__ = [
+    "ClassificationBatcher",
+    "ClassifierPool",
+    "SubthemeResult",
+    "SubthemeClassifier",
+    "get_classification_batcher",
+    "get_classifier_pool",
+    "get_subtheme_classifier",
+    "precompile_subtheme_classifiers",
+    "shutdown_classifier_pool",
+]
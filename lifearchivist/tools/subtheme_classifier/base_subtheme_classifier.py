@@ -7,11 +7,13 @@ Follows DRY principles by centralizing all classification logic.
 
 import logging
 import re
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
+from lifearchivist.tools.pattern_set import PatternSet
+from lifearchivist.tools.phrase_matcher import PhraseMatcher
 from lifearchivist.tools.subtheme_classifier.models import SubthemeResult
 from lifearchivist.tools.subtheme_classifier.rules.base import SubthemeRule
+from lifearchivist.tools.text_sampling import TextSampler
 from lifearchivist.utils.logging import log_event
 
 
@@ -25,13 +27,22 @@ class BaseSubthemeClassifier:
 
     Features:
     - Pre-compiled regex patterns for speed
+    - Single-pass phrase matching shared by all rules
+    - Literal prefiltering so only plausible regexes are searched
+    - Bounded windows for very large documents, with early exit on a
+      confident primary match in the head window
     - Cascade approach: fast filters first, expensive processing only when needed
-    - Parallel classification for multiple subthemes
+    - Batch classification with classify_many (see ClassifierPool for
+      classifying across processes)
     - Exclusion rules to prevent false positives
     """
 
     def __init__(
-        self, theme_name: str, rules: List[SubthemeRule], max_workers: int = 4
+        self,
+        theme_name: str,
+        rules: List[SubthemeRule],
+        max_workers: int = 4,
+        sampler: Optional[TextSampler] = None,
     ):
         """
         Initialize classifier with theme-specific rules.
@@ -39,10 +50,15 @@ class BaseSubthemeClassifier:
         Args:
             theme_name: Name of the primary theme (e.g., "Financial", "Healthcare")
             rules: List of SubthemeRule objects for this theme
-            max_workers: Maximum number of threads for parallel classification
+            max_workers: Kept for compatibility; rules are evaluated in the
+                calling thread, and batches are parallelized across processes
+                by ClassifierPool instead
+            sampler: Window sampling for large documents (defaults to the
+                configured character budget)
         """
         self.theme_name = theme_name
         self.max_workers = max_workers
+        self.sampler = sampler or TextSampler.from_settings()
         self.all_rules = rules
 
         # Build rule lookup by category for faster filtering
@@ -55,6 +71,8 @@ class BaseSubthemeClassifier:
 
         # Pre-compile all patterns for performance
         self._compile_patterns()
+        self._build_phrase_matcher()
+        self._build_pattern_set()
 
     def _compile_patterns(self):
         """Pre-compile all regex patterns for each rule."""
@@ -137,6 +155,26 @@ class BaseSubthemeClassifier:
 
             self.compiled_patterns[rule.name] = rule_patterns
 
+    def _build_phrase_matcher(self):
+        """Compile every rule's phrases and form numbers into one matcher."""
+        phrases: Set[str] = set()
+        for rule in self.all_rules:
+            phrases.update(phrase.lower() for phrase in rule.definitive_phrases)
+            phrases.update(form.lower() for form in rule.form_numbers)
+            phrases.update(phrase.lower() for phrase in rule.exclude_phrases)
+
+        self.phrase_matcher = PhraseMatcher(phrases)
+
+    def _build_pattern_set(self):
+        """Collect every rule's compiled regexes into one prefiltered set."""
+        patterns: List[re.Pattern] = []
+        for rule_patterns in self.compiled_patterns.values():
+            patterns.extend(compiled for compiled, _, _ in rule_patterns["unique"])
+            patterns.extend(compiled for compiled, _ in rule_patterns["structure"])
+            patterns.extend(rule_patterns["exclude"])
+
+        self.pattern_set = PatternSet(patterns)
+
     def classify(self, text: str, metadata: Optional[Dict] = None) -> SubthemeResult:
         """
         Classify document into subthemes using cascade approach.
@@ -160,36 +198,78 @@ class BaseSubthemeClassifier:
                 metadata={"reason": "insufficient_text"},
             )
 
-        # Preprocess text once
-        text_lower = text.lower()
         filename_lower = metadata.get("filename", "").lower() if metadata else ""
 
-        # Run cascade classification for all rules in parallel
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit classification tasks for each rule
-            futures = {
-                executor.submit(
-                    self._classify_single_rule, rule, text_lower, filename_lower
-                ): rule
-                for rule in self.all_rules
-            }
+        windows = self.sampler.sample(text)
+        if len(windows) == 1:
+            return self._classify_text(text.lower(), filename_lower)
 
-            # Collect results (now includes matched pattern)
-            results: Dict[str, Tuple[float, Dict[str, Any]]] = {}
-            for future in futures:
-                rule = futures[future]
-                try:
-                    confidence, matched_pattern = future.result(
-                        timeout=1.0
-                    )  # 1 second timeout per rule
-                    if confidence > 0:
-                        results[rule.name] = (confidence, matched_pattern)
-                except Exception as e:
-                    log_event(
-                        "subtheme_classification_error",
-                        {"theme": self.theme_name, "rule": rule.name, "error": str(e)},
-                        level=logging.DEBUG,
-                    )
+        # Large document: stop at the head window if it is already conclusive,
+        # otherwise classify the bounded sample instead of the full text
+        result = self._classify_text(windows[0].lower(), filename_lower)
+        if self._has_primary_match(result):
+            result.metadata["sampled"] = "head"
+            return result
+
+        result = self._classify_text(self.sampler.join(windows).lower(), filename_lower)
+        result.metadata["sampled"] = "windows"
+        return result
+
+    def _has_primary_match(self, result: SubthemeResult) -> bool:
+        """
+        Check if the best rule matched on a primary identifier alone.
+
+        Combined scores from structure patterns and keywords don't count, so
+        only the same evidence that ends the theme classifier early ends
+        this one.
+        """
+        if result.primary_subclassification is None:
+            return False
+        match = result.matched_patterns.get(result.primary_subclassification, {})
+        return (
+            match.get("classification_level") == "primary"
+            and match.get("confidence", 0.0) >= self.sampler.early_exit_confidence
+        )
+
+    def _classify_text(self, text_lower: str, filename_lower: str) -> SubthemeResult:
+        """
+        Run the rule cascade over lowercased text.
+
+        Args:
+            text_lower: Lowercased document text (or bounded sample of it)
+            filename_lower: Lowercased filename
+
+        Returns:
+            SubthemeResult with classified subthemes and confidence scores
+        """
+
+        # Scan the text once for phrases, regexes and keywords; rules only do
+        # set lookups
+        found_phrases = self.phrase_matcher.find_all(text_lower)
+        matched_patterns = self.pattern_set.search_all(text_lower)
+        words = set(re.findall(r"\b[a-z]{3,}\b", text_lower))
+
+        # Run cascade classification for every rule. Each rule is only set
+        # lookups over the scans above, so this runs inline; threads would
+        # just contend for the GIL
+        results: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        for rule in self.all_rules:
+            try:
+                confidence, matched_pattern = self._classify_single_rule(
+                    rule,
+                    filename_lower,
+                    words,
+                    found_phrases,
+                    matched_patterns,
+                )
+                if confidence > 0:
+                    results[rule.name] = (confidence, matched_pattern)
+            except Exception as e:
+                log_event(
+                    "subtheme_classification_error",
+                    {"theme": self.theme_name, "rule": rule.name, "error": str(e)},
+                    level=logging.DEBUG,
+                )
 
         # Filter and sort results
         if not results:
@@ -295,22 +375,49 @@ class BaseSubthemeClassifier:
             },
         )
 
+    def classify_many(
+        self, texts: List[str], metadatas: Optional[List[Optional[Dict]]] = None
+    ) -> List[SubthemeResult]:
+        """
+        Classify several documents in the calling process.
+
+        Args:
+            texts: Document texts
+            metadatas: Optional metadata per document, aligned with texts
+
+        Returns:
+            One SubthemeResult per text, in order
+        """
+        if metadatas is None:
+            metadatas = [None] * len(texts)
+        return [
+            self.classify(text, metadata)
+            for text, metadata in zip(texts, metadatas, strict=True)
+        ]
+
     def _classify_single_rule(
-        self, rule: SubthemeRule, text_lower: str, filename_lower: str
+        self,
+        rule: SubthemeRule,
+        filename_lower: str,
+        words: Set[str],
+        found_phrases: Set[str],
+        matched_patterns: Set[re.Pattern],
     ) -> Tuple[float, Dict[str, Any]]:
         """
         Classify text against a single subtheme rule using cascade approach.
 
         Args:
             rule: SubthemeRule to check against
-            text_lower: Lowercase document text
             filename_lower: Lowercase filename
+            words: Lowercase words of three or more letters in the text
+            found_phrases: Lowercase rule phrases present in the text
+            matched_patterns: Compiled rule regexes that match the text
 
         Returns:
             Tuple of (confidence score, detailed match information)
         """
         # Check exclusion rules first (fast rejection)
-        if self._check_exclusions(rule, text_lower):
+        if self._check_exclusions(rule, found_phrases, matched_patterns):
             return 0.0, {}
 
         # Collect all matches from all levels
@@ -322,21 +429,21 @@ class BaseSubthemeClassifier:
 
         # Primary identifiers (highest confidence)
         primary_confidence, primary_matches = self._check_primary_identifiers(
-            rule, text_lower
+            rule, found_phrases, matched_patterns
         )
         if primary_matches:
             all_matches["primary"] = primary_matches
 
         # Secondary identifiers (structure patterns)
         secondary_confidence, secondary_matches = self._check_secondary_identifiers(
-            rule, text_lower
+            rule, matched_patterns
         )
         if secondary_matches:
             all_matches["secondary"] = secondary_matches
 
         # Tertiary identifiers (keywords and filename)
         tertiary_confidence, tertiary_matches = self._check_tertiary_identifiers(
-            rule, text_lower, filename_lower
+            rule, filename_lower, words
         )
         if tertiary_matches:
             all_matches["tertiary"] = tertiary_matches
@@ -382,7 +489,12 @@ class BaseSubthemeClassifier:
 
         return final_confidence, match_details
 
-    def _check_exclusions(self, rule: SubthemeRule, text_lower: str) -> bool:
+    def _check_exclusions(
+        self,
+        rule: SubthemeRule,
+        found_phrases: Set[str],
+        matched_patterns: Set[re.Pattern],
+    ) -> bool:
         """
         Check if text contains exclusion patterns or phrases.
 
@@ -392,18 +504,21 @@ class BaseSubthemeClassifier:
         # Check exclusion patterns
         patterns = self.compiled_patterns.get(rule.name, {}).get("exclude", [])
         for pattern in patterns:
-            if pattern.search(text_lower):
+            if pattern in matched_patterns:
                 return True
 
         # Check exclusion phrases
         for phrase in rule.exclude_phrases:
-            if phrase.lower() in text_lower:
+            if phrase.lower() in found_phrases:
                 return True
 
         return False
 
     def _check_primary_identifiers(
-        self, rule: SubthemeRule, text_lower: str
+        self,
+        rule: SubthemeRule,
+        found_phrases: Set[str],
+        matched_patterns: Set[re.Pattern],
     ) -> Tuple[float, Dict[str, Any]]:
         """Check primary identifiers (unique patterns and definitive phrases)."""
         max_confidence = 0.0
@@ -416,7 +531,7 @@ class BaseSubthemeClassifier:
         # Check unique patterns
         patterns = self.compiled_patterns.get(rule.name, {}).get("unique", [])
         for pattern, confidence, name in patterns:
-            if pattern.search(text_lower):
+            if pattern in matched_patterns:
                 all_matches["unique_patterns"].append(
                     {
                         "name": name,
@@ -428,7 +543,7 @@ class BaseSubthemeClassifier:
 
         # Check definitive phrases
         for phrase, confidence in rule.definitive_phrases.items():
-            if phrase.lower() in text_lower:
+            if phrase.lower() in found_phrases:
                 all_matches["definitive_phrases"].append(
                     {"phrase": phrase, "confidence": confidence}
                 )
@@ -436,7 +551,7 @@ class BaseSubthemeClassifier:
 
         # Check form numbers if any
         for form_number, confidence in rule.form_numbers.items():
-            if form_number.lower() in text_lower:
+            if form_number.lower() in found_phrases:
                 all_matches["form_numbers"].append(
                     {"form": form_number, "confidence": confidence}
                 )
@@ -448,7 +563,7 @@ class BaseSubthemeClassifier:
         return max_confidence, all_matches
 
     def _check_secondary_identifiers(
-        self, rule: SubthemeRule, text_lower: str
+        self, rule: SubthemeRule, matched_patterns: Set[re.Pattern]
     ) -> Tuple[float, Dict[str, Any]]:
         """Check secondary identifiers (structure patterns)."""
         patterns = self.compiled_patterns.get(rule.name, {}).get("structure", [])
@@ -458,12 +573,12 @@ class BaseSubthemeClassifier:
 
         total_weight = sum(weight for _, weight in patterns)
         matched_weight = 0.0
-        matched_patterns = []
+        structure_matches = []
 
         for pattern, weight in patterns:
-            if pattern.search(text_lower):
+            if pattern in matched_patterns:
                 matched_weight += weight
-                matched_patterns.append(
+                structure_matches.append(
                     {
                         "pattern": pattern.pattern[:100],  # First 100 chars of regex
                         "weight": weight,
@@ -481,8 +596,8 @@ class BaseSubthemeClassifier:
 
         # Return detailed match information
         match_info = {
-            "structure_patterns": matched_patterns,
-            "total_matched": len(matched_patterns),
+            "structure_patterns": structure_matches,
+            "total_matched": len(structure_matches),
             "total_patterns": len(patterns),
             "combined_confidence": confidence,
         }
@@ -490,7 +605,7 @@ class BaseSubthemeClassifier:
         return confidence, match_info
 
     def _check_tertiary_identifiers(
-        self, rule: SubthemeRule, text_lower: str, filename_lower: str
+        self, rule: SubthemeRule, filename_lower: str, words: Set[str]
     ) -> Tuple[float, Dict[str, Any]]:
         """Check tertiary identifiers (keywords and filename patterns)."""
         max_confidence = 0.0
@@ -508,9 +623,6 @@ class BaseSubthemeClassifier:
                     )
                     max_confidence = max(max_confidence, scaled_confidence)
 
-        # Extract words for keyword matching
-        words = set(re.findall(r"\b[a-z]{3,}\b", text_lower))
-
         if words:
             # Calculate keyword match score
             keyword_matches = words & rule.keywords
@@ -0,0 +1,354 @@
+"""
+Process pool for classifying many documents across cores.
+
+Subtheme rules are pure-Python regex and set work that holds the GIL, so
+threads cannot classify documents in parallel. ClassifierPool keeps a
+persistent ProcessPoolExecutor whose workers build the theme classifiers once
+in their initializer and then classify documents in chunks, so a bulk import
+or reclassification pass uses every core without recompiling rules per call.
+
+Two kinds of batch are supported: subtheme classification for documents
+whose theme is known (classify_many), and full theme plus subtheme
+classification producing a document's classifications dict
+(classify_documents_async). ClassificationBatcher turns concurrent
+single-document requests, such as parallel file imports, into such batches.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, TypeVar
+
+from lifearchivist.utils.logging import log_event
+
+from .models import SubthemeResult
+from .subtheme_classifier import get_subtheme_classifier
+
+# (text, primary theme, metadata) for one document
+ClassificationItem = Tuple[str, str, Optional[Dict]]
+
+# (text, display path, original filename) for one document
+DocumentItem = Tuple[str, str, Optional[str]]
+
+ItemT = TypeVar("ItemT")
+ResultT = TypeVar("ResultT")
+
+
+def _init_worker(themes: Optional[List[str]]):
+    """Compile the theme classifiers once when a worker process starts."""
+    get_subtheme_classifier().precompile(themes)
+
+
+def _classify_chunk(items: List[ClassificationItem]) -> List[SubthemeResult]:
+    """Classify a chunk of documents inside a worker process."""
+    classifier = get_subtheme_classifier()
+    return [
+        classifier.classify_document(text, primary_theme, metadata)
+        for text, primary_theme, metadata in items
+    ]
+
+
+def _classify_documents_chunk(items: List[DocumentItem]) -> List[Dict[str, Any]]:
+    """Classify themes and subthemes for a chunk of documents in a worker."""
+    from lifearchivist.tools.document_classification import classify_document
+
+    return [
+        classify_document(text, display_path, original_filename)
+        for text, display_path, original_filename in items
+    ]
+
+
+class ClassifierPool:
+    """
+    Persistent worker processes for batch document classification.
+
+    Workers are started on first use and kept until shutdown(). Batches
+    smaller than MIN_POOL_BATCH, or a pool configured with a single process,
+    are classified in the calling process, where shipping text to a worker
+    would cost more than it saves.
+    """
+
+    CHUNK_SIZE = 16
+    MIN_POOL_BATCH = 8
+
+    def __init__(
+        self,
+        processes: int = 0,
+        chunk_size: Optional[int] = None,
+        themes: Optional[List[str]] = None,
+    ):
+        """
+        Configure the pool; no processes are started until first use.
+
+        Args:
+            processes: Worker processes (0 = one per CPU core, 1 = in-process)
+            chunk_size: Documents sent to a worker per task
+            themes: Themes to precompile in each worker (defaults to all)
+        """
+        self.processes = processes or os.cpu_count() or 1
+        self.chunk_size = chunk_size or self.CHUNK_SIZE
+        self.themes = themes
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Start the worker processes on first use."""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    # Spawned workers don't inherit the server's threads and
+                    # event loop, which forking a running server would copy
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.processes,
+                        mp_context=multiprocessing.get_context("spawn"),
+                        initializer=_init_worker,
+                        initargs=(self.themes,),
+                    )
+                    log_event(
+                        "classifier_pool_started",
+                        {"processes": self.processes, "chunk_size": self.chunk_size},
+                    )
+        return self._executor
+
+    def _use_pool(self, items: Sequence[Any]) -> bool:
+        return self.processes > 1 and len(items) >= self.MIN_POOL_BATCH
+
+    def _chunks(self, items: Sequence[ItemT]) -> List[List[ItemT]]:
+        return [
+            list(items[start : start + self.chunk_size])
+            for start in range(0, len(items), self.chunk_size)
+        ]
+
+    def _run(
+        self,
+        func: Callable[[List[ItemT]], List[ResultT]],
+        items: Sequence[ItemT],
+    ) -> List[ResultT]:
+        """Apply a chunk function to items, in worker processes if worthwhile."""
+        if not self._use_pool(items):
+            return func(list(items))
+
+        executor = self._get_executor()
+        results: List[ResultT] = []
+        for chunk_results in executor.map(func, self._chunks(items)):
+            results.extend(chunk_results)
+        return results
+
+    async def _run_async(
+        self,
+        func: Callable[[List[ItemT]], List[ResultT]],
+        items: Sequence[ItemT],
+    ) -> List[ResultT]:
+        """Like _run, without blocking the event loop."""
+        if not self._use_pool(items):
+            return await asyncio.to_thread(func, list(items))
+
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        chunk_results = await asyncio.gather(
+            *(
+                loop.run_in_executor(executor, func, chunk)
+                for chunk in self._chunks(items)
+            )
+        )
+        return [result for chunk in chunk_results for result in chunk]
+
+    def classify_many(
+        self, items: Sequence[ClassificationItem]
+    ) -> List[SubthemeResult]:
+        """
+        Classify subthemes, spreading large batches across worker processes.
+
+        Args:
+            items: (text, primary theme, metadata) per document
+
+        Returns:
+            One SubthemeResult per item, in order
+        """
+        return self._run(_classify_chunk, items)
+
+    async def classify_many_async(
+        self, items: Sequence[ClassificationItem]
+    ) -> List[SubthemeResult]:
+        """
+        Classify subthemes without blocking the event loop.
+
+        Args:
+            items: (text, primary theme, metadata) per document
+
+        Returns:
+            One SubthemeResult per item, in order
+        """
+        return await self._run_async(_classify_chunk, items)
+
+    async def classify_documents_async(
+        self, items: Sequence[DocumentItem]
+    ) -> List[Dict[str, Any]]:
+        """
+        Classify themes and subthemes without blocking the event loop.
+
+        Args:
+            items: (text, display path, original filename) per document
+
+        Returns:
+            One classifications dict per item, in order (see
+            lifearchivist.tools.document_classification)
+        """
+        return await self._run_async(_classify_documents_chunk, items)
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker processes; the pool restarts them if used again."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+            log_event("classifier_pool_stopped", {"processes": self.processes})
+
+
+class ClassificationBatcher:
+    """
+    Coalesces concurrent document classifications into pool batches.
+
+    Each file import classifies a single document, which ClassifierPool would
+    always run in-process. The batcher collects concurrent classify() calls
+    for up to MAX_WAIT_SECONDS (or until batch_size documents are waiting)
+    and classifies them together, so bulk imports are spread across the
+    worker processes. With a single-process pool there is nothing to gain
+    from waiting, and each document is classified off the event loop
+    straight away.
+    """
+
+    MAX_WAIT_SECONDS = 0.05
+
+    def __init__(
+        self,
+        pool: ClassifierPool,
+        batch_size: Optional[int] = None,
+        max_wait: Optional[float] = None,
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            pool: Pool the batches are classified on
+            batch_size: Documents per batch (defaults to one chunk per worker)
+            max_wait: Seconds the first waiting document waits for others
+        """
+        self.pool = pool
+        self.batch_size = batch_size or max(
+            pool.MIN_POOL_BATCH, pool.processes * pool.chunk_size
+        )
+        self.max_wait = max_wait if max_wait is not None else self.MAX_WAIT_SECONDS
+        self._pending: List[Tuple[DocumentItem, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._batches: Set[asyncio.Task] = set()
+
+    async def classify(
+        self, text: str, display_path: str = "", original_filename: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Classify a document's theme and subthemes, batched with others.
+
+        Args:
+            text: Document text
+            display_path: Path or name the theme classifier sees as the filename
+            original_filename: Filename the subtheme classifier sees
+
+        Returns:
+            The document's classifications dict
+
+        Raises:
+            Exception: Whatever classifying the batch raised
+        """
+        item: DocumentItem = (text, display_path, original_filename)
+        if self.pool.processes <= 1:
+            return (await self.pool.classify_documents_async([item]))[0]
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """Send the waiting documents, one batch at a time."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        while self._pending:
+            batch = self._pending[: self.batch_size]
+            self._pending = self._pending[self.batch_size :]
+            task = asyncio.create_task(self._run(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _run(self, batch: List[Tuple[DocumentItem, asyncio.Future]]) -> None:
+        try:
+            results = await self.pool.classify_documents_async(
+                [item for item, _ in batch]
+            )
+        except Exception as e:
+            log_event(
+                "classification_batch_failed",
+                {
+                    "documents": len(batch),
+                    "error_type": type(e).__name__,
+                    "error": str(e),
+                },
+                level=logging.WARNING,
+            )
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results, strict=True):
+            if not future.done():
+                future.set_result(result)
+
+
+_shared_pool: Optional[ClassifierPool] = None
+_shared_pool_lock = threading.Lock()
+_shared_batcher: Optional[ClassificationBatcher] = None
+
+
+def get_classifier_pool() -> ClassifierPool:
+    """
+    Get the process-wide classifier pool, sized from settings.
+
+    The pool's worker processes are started lazily by the first batch large
+    enough to need them.
+    """
+    global _shared_pool
+    if _shared_pool is None:
+        with _shared_pool_lock:
+            if _shared_pool is None:
+                from lifearchivist.config import get_settings
+
+                _shared_pool = ClassifierPool(
+                    processes=get_settings().classifier_processes
+                )
+    return _shared_pool
+
+
+def get_classification_batcher() -> ClassificationBatcher:
+    """Get the process-wide batcher in front of the shared classifier pool."""
+    global _shared_batcher
+    if _shared_batcher is None:
+        _shared_batcher = ClassificationBatcher(get_classifier_pool())
+    return _shared_batcher
+
+
+def shutdown_classifier_pool():
+    """Stop the shared pool's worker processes, if any were started."""
+    if _shared_pool is not None:
+        _shared_pool.shutdown()
@@ -34,7 +34,7 @@ class FinancialSubthemeClassifier(BaseSubthemeClassifier):
         Initialize Financial subtheme classifier.
 
         Args:
-            max_workers: Maximum number of threads for parallel classification
+            max_workers: Kept for compatibility (see BaseSubthemeClassifier)
         """
         # Combine all financial subtheme rules
         financial_rules: List[SubthemeRule] = (
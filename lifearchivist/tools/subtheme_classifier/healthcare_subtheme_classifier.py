@@ -35,7 +35,7 @@ class HealthcareSubthemeClassifier(BaseSubthemeClassifier):
         Initialize Healthcare subtheme classifier.
 
         Args:
-            max_workers: Maximum number of threads for parallel classification
+            max_workers: Kept for compatibility (see BaseSubthemeClassifier)
         """
         # Combine all healthcare subtheme rules
         healthcare_rules: List[SubthemeRule] = (
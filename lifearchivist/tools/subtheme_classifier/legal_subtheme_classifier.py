@@ -31,7 +31,7 @@ class LegalSubthemeClassifier(BaseSubthemeClassifier):
         Initialize Legal subtheme classifier.
 
         Args:
-            max_workers: Maximum number of threads for parallel classification
+            max_workers: Kept for compatibility (see BaseSubthemeClassifier)
         """
         # Combine all legal subtheme rules
         legal_rules: List[SubthemeRule] = (
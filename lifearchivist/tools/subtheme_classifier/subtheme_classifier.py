@@ -3,11 +3,19 @@ Subtheme classifier for documents.
 
 Provides hierarchical classification within primary themes.
 Optimized for high-performance batch processing.
+
+Theme classifiers compile several hundred regexes each, so callers should
+use the process-wide instance from get_subtheme_classifier() rather than
+constructing a SubthemeClassifier per document. Large batches can be
+classified across processes with ClassifierPool (see classifier_pool.py).
 """
 
-from typing import Callable, Dict, List, Optional
+import asyncio
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Union
 
-from lifearchivist.utils.logging import track
+from lifearchivist.utils.logging import log_event, track
 
 from .base_subtheme_classifier import BaseSubthemeClassifier
 from .financial_subtheme_classifier import FinancialSubthemeClassifier
@@ -23,7 +31,7 @@ class SubthemeClassifier:
     Features:
     - Lazy loading of theme-specific classifiers
     - Shared classifier instances for efficiency
-    - Support for parallel classification
+    - Batch classification with classify_many
     - Easy extensibility for new themes
     """
 
@@ -32,10 +40,11 @@ class SubthemeClassifier:
         Initialize the subtheme classifier.
 
         Args:
-            max_workers: Maximum number of threads for parallel classification
+            max_workers: Passed to each theme classifier (kept for compatibility)
         """
         self.max_workers = max_workers
         self._classifiers: Dict[str, BaseSubthemeClassifier] = {}
+        self._lock = threading.Lock()
 
         # Define available classifiers (lazy loaded)
         # To add a new theme:
@@ -64,16 +73,39 @@ class SubthemeClassifier:
         Returns:
             Theme-specific classifier instance
         """
-        if theme not in self._classifiers and theme in self._classifier_classes:
-            # Create classifier instance with shared max_workers setting
-            # The classifier factory takes max_workers and returns an initialized classifier
-            # Each subclass (Financial, Healthcare, Legal) has __init__(max_workers) that
-            # internally calls super().__init__(theme_name, rules, max_workers)
-            classifier_factory = self._classifier_classes[theme]
-            self._classifiers[theme] = classifier_factory(self.max_workers)
+        classifier = self._classifiers.get(theme)
+        if classifier is not None or theme not in self._classifier_classes:
+            return classifier
+
+        # Build under the lock so concurrent callers compile each theme once
+        with self._lock:
+            if theme not in self._classifiers:
+                # Create classifier instance with shared max_workers setting
+                # The classifier factory takes max_workers and returns an initialized classifier
+                # Each subclass (Financial, Healthcare, Legal) has __init__(max_workers) that
+                # internally calls super().__init__(theme_name, rules, max_workers)
+                classifier_factory = self._classifier_classes[theme]
+                self._classifiers[theme] = classifier_factory(self.max_workers)
 
         return self._classifiers.get(theme)
 
+    def precompile(self, themes: Optional[List[str]] = None) -> Dict[str, float]:
+        """
+        Build theme classifiers up front instead of on first use.
+
+        Args:
+            themes: Themes to build (defaults to all supported themes)
+
+        Returns:
+            Milliseconds spent building each theme (0 if it was already built)
+        """
+        timings: Dict[str, float] = {}
+        for theme in themes or self.get_supported_themes():
+            start = time.perf_counter()
+            self._get_classifier(theme)
+            timings[theme] = round((time.perf_counter() - start) * 1000, 2)
+        return timings
+
     @track(operation="subtheme_classification", track_performance=True)
     def classify(
         self, text: str, primary_theme: str, metadata: Optional[Dict] = None
@@ -89,6 +121,16 @@ class SubthemeClassifier:
         Returns:
             SubthemeResult with classified subthemes and confidence scores
         """
+        return self.classify_document(text, primary_theme, metadata)
+
+    def classify_document(
+        self, text: str, primary_theme: str, metadata: Optional[Dict] = None
+    ) -> SubthemeResult:
+        """
+        Classify one document without per-call performance tracking.
+
+        Used by batch paths, which track the batch as a whole.
+        """
         # Get classifier for this theme (lazy loaded)
         classifier = self._get_classifier(primary_theme)
 
@@ -107,6 +149,38 @@ class SubthemeClassifier:
         # Delegate to theme-specific classifier
         return classifier.classify(text, metadata)
 
+    @track(operation="subtheme_batch_classification", track_performance=True)
+    def classify_many(
+        self,
+        texts: Sequence[str],
+        primary_themes: Union[str, Sequence[str]],
+        metadatas: Optional[Sequence[Optional[Dict]]] = None,
+    ) -> List[SubthemeResult]:
+        """
+        Classify several documents in the calling process.
+
+        Use ClassifierPool.classify_many to spread a large batch across
+        worker processes instead.
+
+        Args:
+            texts: Document texts
+            primary_themes: One primary theme for every text, or one per text
+            metadatas: Optional metadata per text
+
+        Returns:
+            One SubthemeResult per text, in order
+        """
+        if isinstance(primary_themes, str):
+            primary_themes = [primary_themes] * len(texts)
+        if metadatas is None:
+            metadatas = [None] * len(texts)
+        return [
+            self.classify_document(text, theme, metadata)
+            for text, theme, metadata in zip(
+                texts, primary_themes, metadatas, strict=True
+            )
+        ]
+
     def get_supported_themes(self) -> List[str]:
         """Get list of themes that support subtheme classification."""
         return list(self._classifier_classes.keys())
@@ -117,3 +191,34 @@ class SubthemeClassifier:
         if classifier:
             return classifier.get_supported_subthemes()
         return []
+
+
+_shared_classifier: Optional[SubthemeClassifier] = None
+_shared_classifier_lock = threading.Lock()
+
+
+def get_subtheme_classifier() -> SubthemeClassifier:
+    """
+    Get the process-wide subtheme classifier, creating it on first use.
+
+    Theme classifiers are built lazily on the shared instance, so compiled
+    patterns are reused across imports and workers in this process.
+    """
+    global _shared_classifier
+    if _shared_classifier is None:
+        with _shared_classifier_lock:
+            if _shared_classifier is None:
+                _shared_classifier = SubthemeClassifier()
+    return _shared_classifier
+
+
+async def precompile_subtheme_classifiers() -> Dict[str, float]:
+    """
+    Build every theme classifier on the shared instance in a worker thread.
+
+    Returns:
+        Milliseconds spent building each theme
+    """
+    timings = await asyncio.to_thread(get_subtheme_classifier().precompile)
+    log_event("subtheme_classifiers_precompiled", {"build_ms": timings})
+    return timings
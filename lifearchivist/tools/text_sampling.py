@@ -0,0 +1,130 @@
+"""
+Bounded text sampling for the rule-based classifiers.
+
+Classifying a document scans all of its text several times (lowercasing,
+phrase and regex matching, keyword extraction), so a 500-page export costs
+tens of megabytes of work, most of which does not change the result. A
+TextSampler caps that work: documents up to ``max_chars`` are classified
+whole, and longer ones are reduced to a head window, a tail window and
+evenly strided windows from the middle, which together fit the budget.
+
+The head window comes first so classifiers can stop early: if it already
+contains a primary match at or above ``early_exit_confidence``, the rest of
+the sample is never scanned.
+"""
+
+from typing import List
+
+# Separates windows in the joined sample. Rule regexes only bridge gaps with
+# \s and "." (which stops at newlines), and neither matches NUL, so no phrase
+# or regex can match across a window boundary
+WINDOW_SEPARATOR = "\n\x00\n"
+
+# How far a window edge may move to land on whitespace instead of mid-word
+_SNAP_CHARS = 64
+
+
+class TextSampler:
+    """
+    Splits long documents into a bounded set of classification windows.
+
+    The budget is divided between the head (where titles, form numbers and
+    letterheads usually are), the tail (signatures, totals) and strided
+    windows spread over the middle.
+    """
+
+    MAX_CHARS = 200_000
+    HEAD_FRACTION = 0.4
+    TAIL_FRACTION = 0.2
+    STRIDED_WINDOWS = 8
+    EARLY_EXIT_CONFIDENCE = 0.85
+
+    def __init__(
+        self,
+        max_chars: int = MAX_CHARS,
+        head_fraction: float = HEAD_FRACTION,
+        tail_fraction: float = TAIL_FRACTION,
+        strided_windows: int = STRIDED_WINDOWS,
+        early_exit_confidence: float = EARLY_EXIT_CONFIDENCE,
+    ):
+        """
+        Configure the sampling budget.
+
+        Args:
+            max_chars: Character budget per document (0 = never sample)
+            head_fraction: Share of the budget taken from the start
+            tail_fraction: Share of the budget taken from the end
+            strided_windows: Number of windows the rest is split into
+            early_exit_confidence: Primary match confidence in the head
+                window that ends classification early
+        """
+        if head_fraction < 0 or tail_fraction < 0 or head_fraction + tail_fraction > 1:
+            raise ValueError("head_fraction and tail_fraction must sum to at most 1")
+
+        self.max_chars = max_chars
+        self.head_fraction = head_fraction
+        self.tail_fraction = tail_fraction
+        self.strided_windows = max(strided_windows, 0)
+        self.early_exit_confidence = early_exit_confidence
+
+    @classmethod
+    def from_settings(cls) -> "TextSampler":
+        """Build a sampler using the configured character budget."""
+        from lifearchivist.config import get_settings
+
+        return cls(max_chars=get_settings().classifier_sample_chars)
+
+    def needs_sampling(self, text: str) -> bool:
+        """Whether the text is over budget and will be split into windows."""
+        return self.max_chars > 0 and len(text) > self.max_chars
+
+    def sample(self, text: str) -> List[str]:
+        """
+        Get the windows of the text to classify.
+
+        Args:
+            text: Full document text
+
+        Returns:
+            [text] if it fits the budget, otherwise the head window followed
+            by the tail and strided windows
+        """
+        if not self.needs_sampling(text):
+            return [text]
+
+        head_chars = int(self.max_chars * self.head_fraction)
+        tail_chars = int(self.max_chars * self.tail_fraction)
+        strided_chars = self.max_chars - head_chars - tail_chars
+
+        head_end = _snap(text, head_chars)
+        tail_start = _snap(text, len(text) - tail_chars)
+        windows = [text[:head_end], text[tail_start:]]
+
+        middle = tail_start - head_end
+        if self.strided_windows and strided_chars > 0 and middle > 0:
+            window_chars = strided_chars // self.strided_windows
+            stride = middle / self.strided_windows
+            for index in range(self.strided_windows):
+                # Center each window in its stride so coverage is even
+                center = head_end + int(stride * (index + 0.5))
+                start = _snap(text, max(center - window_chars // 2, head_end))
+                end = _snap(text, min(start + window_chars, tail_start))
+                if end > start:
+                    windows.append(text[start:end])
+
+        return [window for window in windows if window]
+
+    @staticmethod
+    def join(windows: List[str]) -> str:
+        """Join sampled windows into one bounded text."""
+        return WINDOW_SEPARATOR.join(windows)
+
+
+def _snap(text: str, position: int) -> int:
+    """Move a window edge forward to the next whitespace, if one is close."""
+    position = min(max(position, 0), len(text))
+    limit = min(position + _SNAP_CHARS, len(text))
+    for index in range(position, limit):
+        if text[index].isspace():
+            return index
+    return position
@@ -8,6 +8,9 @@ import logging
 import re
 from typing import Optional, Tuple
 
+from lifearchivist.tools.pattern_set import PatternSet
+from lifearchivist.tools.phrase_matcher import PhraseMatcher
+from lifearchivist.tools.text_sampling import TextSampler
 from lifearchivist.tools.theme_classifier.rules import (
     PRIMARY_DEFINITIVE_PHRASE_DEFINITIONS,
     PRIMARY_UNIQUE_PATTERN_DEFINITIONS,
@@ -22,10 +25,18 @@ class ThemeClassifier:
     """
     Fast, accurate document classifier.
     Uses cascade approach: fast filters first, expensive processing only when needed.
+    Very large documents are classified from bounded windows (see TextSampler).
     """
 
-    def __init__(self):
-        """Initialize classifier with pre-compiled patterns and lookup tables."""
+    def __init__(self, sampler: Optional[TextSampler] = None):
+        """
+        Initialize classifier with pre-compiled patterns and lookup tables.
+
+        Args:
+            sampler: Window sampling for large documents (defaults to the
+                configured character budget)
+        """
+        self.sampler = sampler or TextSampler.from_settings()
         self._compile_patterns()
         self._build_lookup_tables()
 
@@ -51,6 +62,14 @@ class ThemeClassifier:
 
             self.secondary_structure_patterns[theme] = compiled_patterns
 
+        # Literal prefilters so only regexes that could match are searched
+        self.unique_pattern_set = PatternSet(self.primary_unique_patterns.values())
+        self.structure_pattern_set = PatternSet(
+            compiled
+            for patterns in self.secondary_structure_patterns.values()
+            for compiled, _ in patterns
+        )
+
     def _build_lookup_tables(self):
         """Build hash tables."""
         self.primary_definitive_phrases: dict[str, Tuple[str, float]] = {
@@ -58,6 +77,7 @@ class ThemeClassifier:
             for theme, phrases in PRIMARY_DEFINITIVE_PHRASE_DEFINITIONS.items()
             for phrase, confidence in phrases
         }
+        self.definitive_phrase_matcher = PhraseMatcher(self.primary_definitive_phrases)
 
         self.tertiary_statistical_keywords: dict[str, set] = (
             TERTIARY_STATISTICAL_KEYWORD_DEFINITIONS
@@ -77,9 +97,20 @@ class ThemeClassifier:
         if not text or len(text.strip()) < 10:
             return "Unclassified", 0.0, "", ""
 
-        text_lower = text.lower()
         filename_lower = filename.lower()
 
+        windows = self.sampler.sample(text)
+        if len(windows) > 1:
+            # Large document: a confident primary match in the head window
+            # settles it; otherwise classify the bounded sample
+            result = self._check_primary_identifiers(windows[0].lower())
+            if result and result[1] >= self.sampler.early_exit_confidence:
+                theme, confidence, pattern_or_phrase = result
+                return theme, confidence, pattern_or_phrase, "primary"
+            text = self.sampler.join(windows)
+
+        text_lower = text.lower()
+
         result = self._check_primary_identifiers(text_lower)
         if result:
             theme, confidence, pattern_or_phrase = result
@@ -101,12 +132,13 @@ class ThemeClassifier:
     def _check_primary_identifiers(self, text: str) -> Optional[Tuple[str, float, str]]:
         """Check for unique identifying patterns."""
 
+        candidates = self.unique_pattern_set.candidates(text)
         for (
             theme,
             confidence,
             pattern_name,
         ), pattern in self.primary_unique_patterns.items():
-            if pattern.search(text):
+            if pattern in candidates and pattern.search(text):
                 log_event(
                     "unique_pattern_matched",
                     {"pattern": pattern_name, "theme": theme, "confidence": confidence},
@@ -114,8 +146,10 @@ class ThemeClassifier:
                 )
                 return theme, confidence, pattern_name
 
+        # One pass finds every phrase; the dict order still picks the winner
+        found_phrases = self.definitive_phrase_matcher.find_all(text)
         for phrase, (theme, confidence) in self.primary_definitive_phrases.items():
-            if phrase in text:
+            if phrase in found_phrases:
                 log_event(
                     "definitive_phrase_matched",
                     {"phrase": phrase, "theme": theme, "confidence": confidence},
@@ -134,6 +168,7 @@ class ThemeClassifier:
         best_confidence: float = 0.0
         best_patterns: list[re.Pattern] = []
 
+        candidates = self.structure_pattern_set.candidates(text_lower)
         for theme, patterns in self.secondary_structure_patterns.items():
             total_weight: float = 0.0
             matched_weight: float = 0.0
@@ -141,7 +176,7 @@ class ThemeClassifier:
 
             for pattern, weight in patterns:
                 total_weight += weight
-                if pattern.search(text_lower):
+                if pattern in candidates and pattern.search(text_lower):
                     matched_weight += weight
                     matched_patterns.append(pattern)
 
@@ -1,31 +1,85 @@
 """
 Background worker for processing document enrichment tasks.
+
+The worker keeps up to ``enrichment_concurrency`` tasks in flight, dequeued
+in batches sized to the free slots. With batched date extraction the cap is
+raised so every concurrent LLM batch can fill. Each task type has its own concurrency
+limit so slow LLM date extractions cannot starve cheaper task types. When the
+Ollama provider is reported degraded, or LLM calls time out or fail, the
+worker backs off exponentially and takes one task at a time until calls
+succeed again.
 """
 
 import asyncio
 import logging
 import signal
+import time
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Set, Tuple, cast
 
 from lifearchivist.config import get_settings
-from lifearchivist.server.enrichment_queue import EnrichmentQueue
+from lifearchivist.llm.base_provider import LLMMessage, ProviderType
+from lifearchivist.llm.provider_health_monitor import HealthStatus
+from lifearchivist.llm.request_scheduler import RequestPriority
+from lifearchivist.server.enrichment_queue import create_enrichment_queue
 from lifearchivist.storage.llamaindex_service import LlamaIndexService
 from lifearchivist.storage.vault.vault import Vault
+from lifearchivist.tools.date_extract.date_batcher import (
+    DateBatchError,
+    DateExtractionBatcher,
+)
 from lifearchivist.tools.date_extract.date_extraction_utils import (
+    LABELED_DATE_SEARCH_CHARS,
     create_date_extraction_prompt,
+    find_labeled_date,
     truncate_text_for_llm,
 )
 from lifearchivist.tools.ollama.ollama_tool import OllamaTool
 from lifearchivist.utils.logging import log_event, track
 
+from .worker_coordinator import WorkerCoordinator, default_worker_id
+
 
 class EnrichmentWorker:
     """Worker for processing background enrichment tasks."""
 
-    def __init__(self, llamaindex_service=None, vault=None):
+    # Concurrent tasks per type; date_extraction comes from settings
+    TASK_CONCURRENCY = {"auto_tagging": 4}
+    DEFAULT_TASK_CONCURRENCY = 1
+
+    # Characters of document text sent to the LLM for date extraction
+    DATE_EXTRACTION_MAX_CHARS = 10000
+
+    BACKOFF_BASE_SECONDS = 1.0
+    BACKOFF_MAX_SECONDS = 60.0
+
+    def __init__(
+        self,
+        llamaindex_service=None,
+        vault=None,
+        health_monitor=None,
+        concurrency: Optional[int] = None,
+        worker_id: Optional[str] = None,
+        llm_manager=None,
+    ):
+        """
+        Initialize the worker.
+
+        Args:
+            llamaindex_service: Service used to update document metadata
+            vault: Vault holding document content
+            health_monitor: ProviderHealthMonitor consulted before taking work
+            concurrency: Tasks in flight at once (defaults to settings)
+            worker_id: Name used for heartbeats and leader election
+            llm_manager: LLMProviderManager to send LLM calls through as
+                batch requests, so they yield to interactive chat; without
+                one, Ollama is called directly
+        """
         self.settings = get_settings()
-        self.queue = EnrichmentQueue(redis_url=self.settings.redis_url)
+        self.queue = create_enrichment_queue(
+            redis_url=self.settings.redis_url,
+            backend=self.settings.enrichment_queue_backend,
+        )
         self.vault = vault
         self.llamaindex_service = llamaindex_service
         self.ollama_tool: Optional[OllamaTool] = None
@@ -34,6 +88,32 @@ class EnrichmentWorker:
         self.tasks_processed = 0
         self.tasks_failed = 0
 
+        self.health_monitor = health_monitor
+        self.llm_manager = llm_manager
+        # Batched date extraction needs enough tasks in flight to fill batches;
+        # the batcher itself limits concurrent LLM requests
+        batch_size = max(1, self.settings.date_extraction_batch_size)
+        self._task_limits = {
+            **self.TASK_CONCURRENCY,
+            "date_extraction": self.settings.enrichment_llm_concurrency * batch_size,
+        }
+        self.concurrency = max(1, concurrency or self.settings.enrichment_concurrency)
+        if batch_size > 1:
+            # A lower in-flight cap would leave every batch partly empty
+            self.concurrency = max(
+                self.concurrency, self._task_limits["date_extraction"]
+            )
+        self.date_batcher: Optional[DateExtractionBatcher] = None
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._in_flight: Set[asyncio.Task] = set()
+        self._consecutive_failures = 0
+        self._backoff_until = 0.0
+
+        self.worker_id = worker_id or default_worker_id()
+        self.coordinator = WorkerCoordinator(
+            self.queue, worker_id=self.worker_id, status_provider=self._heartbeat_status
+        )
+
     async def initialize(self):
         """Initialize worker components."""
         log_event("enrichment_worker_init_started", {})
@@ -52,6 +132,14 @@ class EnrichmentWorker:
             await self.llamaindex_service.ensure_initialized()
 
         self.ollama_tool = OllamaTool()
+        if self.settings.date_extraction_batch_size > 1:
+            self.date_batcher = DateExtractionBatcher(
+                self._generate,
+                batch_size=self.settings.date_extraction_batch_size,
+                concurrency=self.settings.enrichment_llm_concurrency,
+                # One failed request is one failure, not one per document
+                on_failure=self._record_failure,
+            )
 
         self._setup_signal_handlers()
 
@@ -86,17 +174,27 @@ class EnrichmentWorker:
     async def run(self):
         """Main worker loop."""
         self.running = True
-        log_event("enrichment_worker_started", {})
+        log_event("enrichment_worker_started", {"worker_id": self.worker_id})
+        await self.coordinator.start()
 
         while self.running and not self.shutdown_event.is_set():
             try:
-                task = await self.queue.get_next_task(timeout=1)
-
-                if not task:
-                    await asyncio.sleep(0.1)
+                free_slots = self.concurrency - len(self._in_flight)
+                delay = self._backoff_delay()
+                if free_slots <= 0 or delay > 0:
+                    await self._wait_for_capacity(delay)
                     continue
 
-                await self._process_task(task)
+                if self._is_degraded():
+                    # One task at a time until the provider recovers
+                    free_slots = 1 if not self._in_flight else 0
+                    if not free_slots:
+                        await self._wait_for_capacity(self.BACKOFF_BASE_SECONDS)
+                        continue
+
+                tasks = await self.queue.get_next_tasks(free_slots, timeout=1)
+                for task in tasks:
+                    self._start_task(task)
 
             except asyncio.CancelledError:
                 log_event(
@@ -104,8 +202,12 @@ class EnrichmentWorker:
                     {
                         "tasks_processed": self.tasks_processed,
                         "tasks_failed": self.tasks_failed,
+                        "in_flight": len(self._in_flight),
                     },
                 )
+                # Unacknowledged tasks stay in the queue for the next worker
+                for in_flight in self._in_flight:
+                    in_flight.cancel()
                 break
             except Exception as e:
                 log_event(
@@ -118,8 +220,92 @@ class EnrichmentWorker:
                 )
                 await asyncio.sleep(1)
 
+        await self._drain()
         await self._shutdown()
 
+    def _heartbeat_status(self) -> Dict[str, Any]:
+        return {
+            "tasks_processed": self.tasks_processed,
+            "tasks_failed": self.tasks_failed,
+            "in_flight": len(self._in_flight),
+        }
+
+    def _start_task(self, task: Dict[str, Any]) -> None:
+        """Process a task in the background, tracking it as in flight."""
+        in_flight = asyncio.create_task(self._run_limited(task))
+        self._in_flight.add(in_flight)
+        in_flight.add_done_callback(self._in_flight.discard)
+
+    async def _run_limited(self, task: Dict[str, Any]) -> None:
+        """Process a task once its type has a free slot."""
+        task_type = str(task.get("type"))
+        semaphore = self._semaphores.get(task_type)
+        if semaphore is None:
+            limit = self._task_limits.get(task_type, self.DEFAULT_TASK_CONCURRENCY)
+            semaphore = asyncio.Semaphore(max(1, limit))
+            self._semaphores[task_type] = semaphore
+
+        async with semaphore:
+            await self._process_task(task)
+
+    async def _wait_for_capacity(self, delay: float) -> None:
+        """Wait for an in-flight task to finish, the backoff to pass, or shutdown."""
+        timeout = delay if delay > 0 else 1.0
+        waiters = set(self._in_flight) if delay <= 0 else set()
+        shutdown = asyncio.create_task(self.shutdown_event.wait())
+        try:
+            await asyncio.wait(
+                waiters | {shutdown},
+                timeout=timeout,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            shutdown.cancel()
+
+    async def _drain(self) -> None:
+        """Let in-flight tasks finish before the queue connection closes."""
+        if not self._in_flight:
+            return
+        log_event("enrichment_worker_draining", {"in_flight": len(self._in_flight)})
+        await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+    def _is_degraded(self) -> bool:
+        """Check whether the health monitor reports a struggling Ollama provider."""
+        if not self.health_monitor:
+            return False
+        for provider in self.health_monitor.registry.get_by_type(ProviderType.OLLAMA):
+            health = self.health_monitor.get_health(provider.provider_id)
+            if health and health.status in (
+                HealthStatus.DEGRADED,
+                HealthStatus.UNHEALTHY,
+            ):
+                return True
+        return False
+
+    def _backoff_delay(self) -> float:
+        return max(0.0, self._backoff_until - time.monotonic())
+
+    def _record_success(self) -> None:
+        self._consecutive_failures = 0
+        self._backoff_until = 0.0
+
+    def _record_failure(self) -> None:
+        """Back off exponentially after consecutive task failures."""
+        self._consecutive_failures += 1
+        delay = min(
+            self.BACKOFF_MAX_SECONDS,
+            self.BACKOFF_BASE_SECONDS * 2 ** (self._consecutive_failures - 1),
+        )
+        self._backoff_until = time.monotonic() + delay
+        log_event(
+            "enrichment_worker_backoff",
+            {
+                "consecutive_failures": self._consecutive_failures,
+                "delay_seconds": delay,
+            },
+            level=logging.WARNING,
+        )
+
     @track(
         operation="process_enrichment_task",
         include_args=["task_type", "document_id"],
@@ -159,6 +345,7 @@ class EnrichmentWorker:
 
             await self.queue.mark_complete(task)
             self.tasks_processed += 1
+            self._record_success()
 
         except asyncio.TimeoutError:
             log_event(
@@ -171,6 +358,7 @@ class EnrichmentWorker:
             )
             await self.queue.requeue_with_retry(task)
             self.tasks_failed += 1
+            self._record_failure()
 
         except Exception as e:
             log_event(
@@ -185,6 +373,39 @@ class EnrichmentWorker:
             )
             await self.queue.requeue_with_retry(task)
             self.tasks_failed += 1
+            if not isinstance(e, DateBatchError):
+                # Batch failures were already counted once by the batcher
+                self._record_failure()
+
+    async def _load_task_text(
+        self, task: Dict[str, Any], max_chars: int
+    ) -> Optional[str]:
+        """
+        Get the start of a task's document text.
+
+        Tasks carry a document ID and content hash; the text is read from the
+        document's chunks, only as far as max_chars. Tasks queued before that
+        change still carry the full text inline.
+        """
+        data = task.get("data", {})
+        if data.get("text"):
+            return cast(str, data["text"])
+
+        text = await self.llamaindex_service.get_document_text(
+            task.get("document_id"),
+            max_chars=max_chars,
+            content_hash=data.get("content_hash"),
+        )
+        if text is None:
+            log_event(
+                "enrichment_document_unavailable",
+                {
+                    "task_type": task.get("type"),
+                    "document_id": task.get("document_id"),
+                },
+                level=logging.WARNING,
+            )
+        return cast(Optional[str], text)
 
     @track(
         operation="process_date_extraction",
@@ -196,7 +417,13 @@ class EnrichmentWorker:
         """Process date extraction for a document."""
         document_id = task.get("document_id")
         data = task.get("data", {})
-        text = data.get("text", "")
+        # Batched prompts and the labeled-date search only use the top
+        max_chars = (
+            LABELED_DATE_SEARCH_CHARS
+            if self.date_batcher
+            else self.DATE_EXTRACTION_MAX_CHARS
+        )
+        text = await self._load_task_text(task, max_chars)
 
         if not text:
             log_event(
@@ -208,33 +435,22 @@ class EnrichmentWorker:
             )
             return
 
-        truncated_text = truncate_text_for_llm(
-            text, max_chars=10000, document_id=document_id
-        )
-        prompt = create_date_extraction_prompt(truncated_text)
-
         log_event(
             "background_date_extraction_started",
             {
                 "document_id": document_id,
-                "text_length": len(text),
-                "truncated_length": len(truncated_text),
+                "text_length": data.get("text_length", len(text)),
             },
         )
 
         try:
-            if not self.ollama_tool:
-                raise RuntimeError("Ollama tool not initialized")
-            response = await asyncio.wait_for(
-                self.ollama_tool.generate(
-                    prompt=prompt,
-                    temperature=0.1,
-                    max_tokens=1000,
-                ),
-                timeout=120.0,
-            )
-
-            extracted_date = response.strip() if response else ""
+            # Explicitly labeled dates need no LLM call
+            extracted_date = find_labeled_date(text) or ""
+            method = "pattern"
+            if not extracted_date:
+                extracted_date, method = await self._extract_date_with_llm(
+                    document_id, text
+                )
 
             has_valid_date = extracted_date and not extracted_date.lower().startswith(
                 ("no date", "none", "not found", "unable")
@@ -260,6 +476,7 @@ class EnrichmentWorker:
                     "document_id": document_id,
                     "dates_found": has_valid_date,
                     "extracted_date": extracted_date if has_valid_date else None,
+                    "method": method,
                     "metadata_updated": success,
                 },
             )
@@ -275,6 +492,62 @@ class EnrichmentWorker:
             )
             raise
 
+    async def _extract_date_with_llm(
+        self, document_id: Optional[str], text: str
+    ) -> Tuple[str, str]:
+        """
+        Ask the LLM for a document's date, batched with other documents if enabled.
+
+        Returns:
+            (date or "", extraction method)
+        """
+        if self.date_batcher:
+            return await self.date_batcher.extract(text), "llm_batch"
+
+        truncated_text = truncate_text_for_llm(
+            text, max_chars=self.DATE_EXTRACTION_MAX_CHARS, document_id=document_id
+        )
+        response = await asyncio.wait_for(
+            self._generate(
+                prompt=create_date_extraction_prompt(truncated_text),
+                temperature=0.1,
+                max_tokens=1000,
+            ),
+            timeout=120.0,
+        )
+        return (response.strip() if response else ""), "llm"
+
+    async def _generate(self, prompt: str, temperature: float, max_tokens: int) -> str:
+        """
+        Run an LLM prompt for enrichment.
+
+        Goes through the provider manager's scheduler as a BATCH request when
+        an Ollama provider is registered there, otherwise straight to Ollama.
+        """
+        provider = None
+        if self.llm_manager:
+            providers = self.llm_manager.registry.get_by_type(ProviderType.OLLAMA)
+            provider = providers[0] if providers else None
+
+        if provider is not None:
+            result = await self.llm_manager.generate(
+                messages=[LLMMessage(role="user", content=prompt)],
+                model=self.settings.llm_model,
+                provider_id=provider.provider_id,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                priority=RequestPriority.BATCH,
+            )
+            if result.is_failure():
+                raise RuntimeError(result.error_or("LLM request failed"))
+            return str(result.unwrap().content)
+
+        if not self.ollama_tool:
+            raise RuntimeError("Ollama tool not initialized")
+        return await self.ollama_tool.generate(
+            prompt=prompt, temperature=temperature, max_tokens=max_tokens
+        )
+
     @track(
         operation="process_auto_tagging",
         include_args=["document_id"],
@@ -285,13 +558,12 @@ class EnrichmentWorker:
         """Process auto-tagging for a document."""
         document_id = task.get("document_id")
         data = task.get("data", {})
-        text = data.get("text", "")
 
         log_event(
             "background_auto_tagging_started",
             {
                 "document_id": document_id,
-                "text_length": len(text),
+                "text_length": data.get("text_length", len(data.get("text", ""))),
             },
         )
 
@@ -331,6 +603,7 @@ class EnrichmentWorker:
             },
         )
 
+        await self.coordinator.stop()
         await self.queue.cleanup()
 
     @track(
@@ -344,17 +617,24 @@ class EnrichmentWorker:
 
         return {
             "worker": {
+                "worker_id": self.worker_id,
+                "is_leader": self.coordinator.is_leader,
                 "running": self.running,
                 "tasks_processed": self.tasks_processed,
                 "tasks_failed": self.tasks_failed,
+                "concurrency": self.concurrency,
+                "in_flight": len(self._in_flight),
+                "task_limits": self._task_limits,
+                "degraded": self._is_degraded(),
+                "backoff_seconds": round(self._backoff_delay(), 2),
             },
             "queue": queue_stats,
         }
 
 
-async def main():
+async def main(worker_id: Optional[str] = None):
     """Main entry point for running the worker."""
-    worker = EnrichmentWorker()
+    worker = EnrichmentWorker(worker_id=worker_id)
 
     try:
         await worker.initialize()
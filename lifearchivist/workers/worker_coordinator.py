@@ -0,0 +1,206 @@
+"""
+Coordination between enrichment worker processes through Redis.
+
+Every worker publishes a heartbeat key with a short TTL, so the set of live
+workers (and what each is doing) can be read from Redis, and a worker that
+dies simply drops out when its key expires. One worker at a time holds a
+leader lease (SET NX with a TTL, renewed only by its holder); the leader runs
+the queue's periodic maintenance, so stuck-task recovery and history trimming
+happen once per interval no matter how many workers are running.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, cast
+
+from lifearchivist.utils.logging import log_event
+
+# Extend the lease only while this worker still holds it
+RENEW_LEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+  return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+# Give up the lease only if this worker holds it
+RELEASE_LEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+  return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+HEARTBEAT_KEY_PREFIX = "lifearchivist:enrichment:workers"
+LEADER_KEY = "lifearchivist:enrichment:leader"
+
+
+def default_worker_id() -> str:
+    """Identify this process uniquely across hosts."""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+class WorkerCoordinator:
+    """Heartbeats and leader election for one enrichment worker."""
+
+    HEARTBEAT_INTERVAL_SECONDS = 10.0
+    HEARTBEAT_TTL_SECONDS = 30
+    MAINTENANCE_INTERVAL_SECONDS = 60.0
+
+    def __init__(
+        self,
+        queue,
+        worker_id: Optional[str] = None,
+        status_provider: Optional[Callable[[], Dict[str, Any]]] = None,
+    ):
+        """
+        Initialize the coordinator.
+
+        Args:
+            queue: Initialized enrichment queue; its Redis connection is shared
+                and its run_maintenance() is called while leader
+            worker_id: Unique worker name (defaults to host and PID)
+            status_provider: Returns worker counters to publish with each
+                heartbeat
+        """
+        self.queue = queue
+        self.worker_id = worker_id or default_worker_id()
+        self.status_provider = status_provider
+        self.is_leader = False
+        self.started_at = time.time()
+        self._last_maintenance = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def heartbeat_key(self) -> str:
+        return f"{HEARTBEAT_KEY_PREFIX}:{self.worker_id}"
+
+    async def start(self) -> None:
+        """Publish the first heartbeat and start the coordination loop."""
+        if self._task and not self._task.done():
+            return
+        await self._tick()
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """Stop the loop, remove the heartbeat and give up leadership."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        try:
+            client = self.queue._client()
+            await cast(Awaitable[int], client.delete(self.heartbeat_key))
+            if self.is_leader:
+                release = client.register_script(RELEASE_LEASE_SCRIPT)
+                await release(keys=[LEADER_KEY], args=[self.worker_id])
+        except Exception as e:
+            log_event(
+                "worker_coordinator_stop_failed",
+                {"worker_id": self.worker_id, "error": str(e)},
+                level=logging.DEBUG,
+            )
+        self.is_leader = False
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.HEARTBEAT_INTERVAL_SECONDS)
+            try:
+                await self._tick()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log_event(
+                    "worker_coordinator_error",
+                    {"worker_id": self.worker_id, "error": str(e)},
+                    level=logging.WARNING,
+                )
+
+    async def _tick(self) -> None:
+        """Heartbeat, hold or contest the lease, and maintain if leader."""
+        await self._heartbeat()
+        await self.queue.refresh_in_flight()
+        await self._elect()
+
+        now = time.monotonic()
+        if (
+            self.is_leader
+            and now - self._last_maintenance >= self.MAINTENANCE_INTERVAL_SECONDS
+        ):
+            self._last_maintenance = now
+            await self.queue.run_maintenance()
+
+    async def _heartbeat(self) -> None:
+        heartbeat = {
+            "worker_id": self.worker_id,
+            "pid": os.getpid(),
+            "host": socket.gethostname(),
+            "started_at": self.started_at,
+            "last_seen": time.time(),
+            "is_leader": self.is_leader,
+            **(self.status_provider() if self.status_provider else {}),
+        }
+        await cast(
+            Awaitable[bool],
+            self.queue._client().set(
+                self.heartbeat_key,
+                json.dumps(heartbeat),
+                ex=self.HEARTBEAT_TTL_SECONDS,
+            ),
+        )
+
+    async def _elect(self) -> None:
+        client = self.queue._client()
+        ttl_ms = self.HEARTBEAT_TTL_SECONDS * 1000
+        was_leader = self.is_leader
+
+        if self.is_leader:
+            renew = client.register_script(RENEW_LEASE_SCRIPT)
+            self.is_leader = bool(
+                await renew(keys=[LEADER_KEY], args=[self.worker_id, ttl_ms])
+            )
+        if not self.is_leader:
+            self.is_leader = bool(
+                await cast(
+                    Awaitable[Optional[bool]],
+                    client.set(LEADER_KEY, self.worker_id, nx=True, px=ttl_ms),
+                )
+            )
+
+        if self.is_leader != was_leader:
+            log_event(
+                (
+                    "enrichment_leader_elected"
+                    if self.is_leader
+                    else "enrichment_leader_lost"
+                ),
+                {"worker_id": self.worker_id},
+            )
+            # A new leader maintains straight away
+            self._last_maintenance = 0.0
+
+
+async def list_workers(client) -> List[Dict[str, Any]]:
+    """
+    Get the heartbeats of all live enrichment workers.
+
+    Args:
+        client: Redis client (decode_responses=True)
+
+    Returns:
+        Heartbeat dicts, oldest worker first
+    """
+    keys = [key async for key in client.scan_iter(match=f"{HEARTBEAT_KEY_PREFIX}:*")]
+    if not keys:
+        return []
+    values = await cast(Awaitable[List[Optional[str]]], client.mget(keys))
+    workers = [json.loads(value) for value in values if value]
+    return sorted(workers, key=lambda worker: worker.get("started_at", 0))
@@ -0,0 +1,159 @@
+"""
+Supervisor running enrichment workers as separate processes.
+
+An in-process EnrichmentWorker shares the server's event loop and CPU core.
+WorkerSupervisor instead spawns K worker processes, each running the
+standalone worker (its own event loop, queue consumer, heartbeat and vote in
+leader election; see worker_coordinator). Workers that exit unexpectedly are
+restarted with exponential backoff. On stop, each worker is sent SIGTERM,
+which makes it finish its in-flight tasks before exiting; workers still
+running after the drain timeout are killed, and their unacknowledged tasks
+are recovered by the surviving workers' queue maintenance.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import socket
+import time
+from multiprocessing.process import BaseProcess
+from typing import Any, Dict, List, Optional
+
+from lifearchivist.utils.logging import log_event
+
+
+def _run_worker_process(worker_id: str) -> None:
+    """Entry point of a worker process."""
+    from lifearchivist.workers.enrichment_worker import main
+
+    asyncio.run(main(worker_id=worker_id))
+
+
+class WorkerSupervisor:
+    """Spawns, monitors and drains enrichment worker processes."""
+
+    MONITOR_INTERVAL_SECONDS = 2.0
+    RESTART_BACKOFF_SECONDS = 5.0
+    MAX_RESTART_BACKOFF_SECONDS = 300.0
+    DRAIN_TIMEOUT_SECONDS = 30.0
+
+    def __init__(self, processes: int = 0, drain_timeout: Optional[float] = None):
+        """
+        Configure the supervisor; nothing is started until start().
+
+        Args:
+            processes: Worker processes (0 = one per CPU core)
+            drain_timeout: Seconds workers get to finish in-flight tasks on stop
+        """
+        self.processes = processes or os.cpu_count() or 1
+        self.drain_timeout = drain_timeout or self.DRAIN_TIMEOUT_SECONDS
+        # Spawned workers don't inherit the server's threads and event loop
+        self._context = multiprocessing.get_context("spawn")
+        self._workers: List[Optional[BaseProcess]] = [None] * self.processes
+        self._restarts = [0] * self.processes
+        self._restart_at = [0.0] * self.processes
+        self._monitor_task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    def _worker_id(self, slot: int) -> str:
+        return f"{socket.gethostname()}-{os.getpid()}-worker{slot}"
+
+    def _spawn(self, slot: int) -> None:
+        process = self._context.Process(
+            target=_run_worker_process,
+            args=(self._worker_id(slot),),
+            name=f"enrichment-worker-{slot}",
+            daemon=True,
+        )
+        process.start()
+        self._workers[slot] = process
+        log_event(
+            "enrichment_worker_process_started",
+            {"slot": slot, "pid": process.pid, "restarts": self._restarts[slot]},
+        )
+
+    async def start(self) -> None:
+        """Spawn the worker processes and start monitoring them."""
+        self._stopping = False
+        for slot in range(self.processes):
+            self._spawn(slot)
+        self._monitor_task = asyncio.create_task(self._monitor())
+        log_event("worker_supervisor_started", {"processes": self.processes})
+
+    async def _monitor(self) -> None:
+        """Restart workers that exited while the supervisor is running."""
+        while not self._stopping:
+            await asyncio.sleep(self.MONITOR_INTERVAL_SECONDS)
+            now = time.monotonic()
+            for slot, process in enumerate(self._workers):
+                if process is None or process.is_alive() or self._stopping:
+                    continue
+
+                if not self._restart_at[slot]:
+                    self._restarts[slot] += 1
+                    delay = min(
+                        self.MAX_RESTART_BACKOFF_SECONDS,
+                        self.RESTART_BACKOFF_SECONDS * 2 ** (self._restarts[slot] - 1),
+                    )
+                    self._restart_at[slot] = now + delay
+                    log_event(
+                        "enrichment_worker_process_exited",
+                        {
+                            "slot": slot,
+                            "exit_code": process.exitcode,
+                            "restart_in_seconds": delay,
+                        },
+                        level=logging.WARNING,
+                    )
+                elif now >= self._restart_at[slot]:
+                    self._restart_at[slot] = 0.0
+                    self._spawn(slot)
+
+    async def stop(self) -> None:
+        """Drain and stop all worker processes."""
+        self._stopping = True
+        if self._monitor_task:
+            self._monitor_task.cancel()
+            try:
+                await self._monitor_task
+            except asyncio.CancelledError:
+                pass
+            self._monitor_task = None
+
+        running = [p for p in self._workers if p is not None and p.is_alive()]
+        for process in running:
+            # Workers handle SIGTERM by finishing their in-flight tasks
+            process.terminate()
+
+        deadline = time.monotonic() + self.drain_timeout
+        for process in running:
+            await asyncio.to_thread(process.join, max(0.0, deadline - time.monotonic()))
+
+        killed = 0
+        for process in running:
+            if process.is_alive():
+                process.kill()
+                await asyncio.to_thread(process.join, 5.0)
+                killed += 1
+
+        log_event(
+            "worker_supervisor_stopped",
+            {"processes": len(running), "killed": killed},
+            level=logging.WARNING if killed else logging.INFO,
+        )
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get the state of each worker process."""
+        return {
+            "processes": self.processes,
+            "workers": [
+                {
+                    "slot": slot,
+                    "pid": process.pid if process else None,
+                    "alive": bool(process and process.is_alive()),
+                    "restarts": self._restarts[slot],
+                }
+                for slot, process in enumerate(self._workers)
+            ],
+        }
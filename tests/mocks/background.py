@@ -91,6 +91,14 @@ class MockFolderWatcher:
     async def schedule_ingestion(self, folder_id: str, file_path) -> None:
         pass
 
+    async def scan_folder(self, folder_id: str) -> dict:
+        return {
+            "files_found": 0,
+            "files_queued": 0,
+            "files_unchanged": 0,
+            "files_removed": 0,
+        }
+
     async def get_aggregate_status(self) -> dict:
         return {
             "total_folders": 0,
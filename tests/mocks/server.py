@@ -38,6 +38,14 @@ class MockApplicationServer:
         self.credential_service = None
         self.provider_loader = None
         self.background_tasks = MockBackgroundTasks()
+        self.reclassification_status: Dict[str, Any] = {"status": "idle"}
+
+    def start_reclassification(self, resume: bool = True) -> Dict[str, Any]:
+        self.reclassification_status = {"status": "pending", "resumed": resume}
+        return self.reclassification_status
+
+    def get_reclassification_status(self) -> Dict[str, Any]:
+        return self.reclassification_status
 
     async def execute_tool(self, tool_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
         if tool_name == "file.import":
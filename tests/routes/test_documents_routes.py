@@ -135,6 +135,36 @@ class TestUpdateDocumentSubthemeEndpoint:
         assert response.status_code == 503
 
 
+class TestReclassifyDocumentsEndpoint:
+    def test_reclassify_starts_job(self, client: TestClient):
+        response = client.post("/api/documents/reclassify")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert data["status"] == "pending"
+
+    def test_reclassify_without_resume(self, client: TestClient):
+        response = client.post("/api/documents/reclassify?resume=false")
+        assert response.status_code == 200
+        assert response.json()["resumed"] is False
+
+    def test_reclassify_already_running(self, client: TestClient):
+        client.post("/api/documents/reclassify")
+        response = client.post("/api/documents/reclassify")
+        assert response.status_code == 409
+
+    def test_reclassify_no_service(self, client_no_services: TestClient):
+        response = client_no_services.post("/api/documents/reclassify")
+        assert response.status_code == 503
+
+    def test_reclassify_status_idle(self, client: TestClient):
+        response = client.get("/api/documents/reclassify/status")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert data["status"] == "idle"
+
+
 class TestClearAllDocumentsEndpoint:
     def test_clear_all_endpoint_exists(self, client: TestClient):
         response = client.delete("/api/documents")
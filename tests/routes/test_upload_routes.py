@@ -234,3 +234,31 @@ class TestProgressEndpoint:
     def test_progress_various_file_id_formats(self, client: TestClient, file_id: str):
         response = client.get(f"/api/upload/{file_id}/progress")
         assert response.status_code in [200, 404]
+
+
+class TestIngestMetricsEndpoint:
+    def test_ingest_metrics_endpoint_exists(self, client: TestClient):
+        response = client.get("/api/ingest/metrics")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert "imports" in data
+        assert "stages" in data
+
+    def test_ingest_metrics_stage_percentiles(self, client: TestClient):
+        from lifearchivist.tools.file_import.ingest_timing import (
+            IngestTimer,
+            get_ingest_metrics,
+        )
+
+        timer = IngestTimer()
+        timer.add("hash", 12.5, 1024)
+        get_ingest_metrics().record(timer, "application/pdf")
+
+        response = client.get("/api/ingest/metrics")
+        assert response.status_code == 200
+        hash_stage = response.json()["stages"]["hash"]
+        assert hash_stage["count"] >= 1
+        assert "p50_ms" in hash_stage
+        assert "p95_ms" in hash_stage
+        assert "application/pdf" in hash_stage["by_mime_type"]